@@ -3,6 +3,8 @@ import { GeistSans } from 'geist/font/sans'
 import { GeistMono } from 'geist/font/mono'
 import { Analytics } from '@vercel/analytics/next'
 import './globals.css'
+import './fonts.css'
+import { FONT_FILES, FONT_STYLESHEET } from '@/lib/game/font-files'
 
 export const metadata: Metadata = {
   title: 'Coal Jack',
@@ -23,6 +25,27 @@ export default function RootLayout({
   return (
     <html lang="en">
       <head>
+        {/* Self-hosted game fonts (build_fonts.py), fetched with the document */}
+        {FONT_FILES.map((font) => (
+          <link key={font.url} rel="preload" href={font.url} as="font" type="font/woff2" crossOrigin="anonymous" />
+        ))}
+        {/* Hosted stylesheet for any family not built yet, inserted by script
+            so it never blocks the first paint (font-display: swap) */}
+        {FONT_STYLESHEET && (
+          <>
+            <link rel="preconnect" href="https://fonts.googleapis.com" />
+            <link rel="preconnect" href="https://fonts.gstatic.com" crossOrigin="anonymous" />
+            <link rel="preload" href={FONT_STYLESHEET} as="style" />
+            <script
+              dangerouslySetInnerHTML={{
+                __html: `var l=document.createElement("link");l.rel="stylesheet";l.href=${JSON.stringify(FONT_STYLESHEET)};document.head.appendChild(l)`,
+              }}
+            />
+            <noscript>
+              <link rel="stylesheet" href={FONT_STYLESHEET} />
+            </noscript>
+          </>
+        )}
         <style>{`
 html {
   font-family: ${GeistSans.style.fontFamily};
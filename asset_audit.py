@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Audit public/ assets: duplicates, dead files and byte budgets
+
+- Exact duplicates: identical SHA-256
+- Near duplicates: 64-bit similarity fingerprint (SVG shapes and embedded
+  rasters, WAV loudness envelope, PNG pixels when Pillow is installed)
+- Dead assets: files never referenced from a string literal in the game code
+- Budgets: per-asset limits and a total shipped-payload target derived from
+  them: every shipped file at or under its own budget, each distinct file
+  counted once. --check fails the build when the payload is over the target
+
+Usage:
+    python3 asset_audit.py                             # report only
+    python3 asset_audit.py --check                     # exit 1 when over the target
+    python3 asset_audit.py --check --max-total-mb 18   # ceiling while over the target
+
+The build (package.json prebuild) runs with a ceiling at today's payload so
+it keeps passing while the over-budget files are re-exported; the report
+shows how far the payload is from the target. Lower the ceiling as files
+shrink and drop it once the target is met.
+"""
+
+import argparse
+import base64
+import hashlib
+import os
+import re
+import struct
+import sys
+import wave
+import zlib
+from array import array
+
+PUBLIC_DIR = 'public'
+
+# Where asset paths are referenced from (string literals only)
+SOURCE_PATHS = ['Baron-web.tsx', 'app', 'components', 'lib', 'hooks']
+SOURCE_EXTS = ('.ts', '.tsx', '.js', '.mjs', '.json', '.css')
+
+# Per-asset budgets by extension; they also set the total payload target
+PER_ASSET_BUDGET = {
+    '.svg': 1024 * 1024,
+    '.png': 512 * 1024,
+    '.wav': 256 * 1024,
+    '.mp3': 1024 * 1024,
+}
+DEFAULT_ASSET_BUDGET = 512 * 1024
+
+# Max differing fingerprint bits for two files to count as near duplicates
+NEAR_DUP_BITS = 4
+
+# Files that are served by convention rather than referenced in code
+IGNORED = {'robots.txt', 'sitemap.xml'}
+
+# Build outputs derived from referenced sources (build_sprites.py)
+GENERATED_DIRS = ('sprites/',)
+
+# Opening quote/paren followed by an absolute public path
+REF_PATTERN = re.compile(r"""["'`(]\s*/([^"'`)?#\n]+)""")
+DATA_URI_PATTERN = re.compile(rb'data:image/(?:png|jpeg);base64,([A-Za-z0-9+/=\s]+)')
+SVG_NUMBER_PATTERN = re.compile(rb'-?\d*\.?\d+')
+SVG_SHAPE_PATTERN = re.compile(rb'<(path|rect|circle|ellipse|polygon|line|g|image)\b[^>]*>')
+
+
+def fmt_bytes(n):
+    if n >= 1024 * 1024:
+        return f'{n / (1024 * 1024):.2f} MB'
+    if n >= 1024:
+        return f'{n / 1024:.1f} KB'
+    return f'{n} B'
+
+
+def simhash(features):
+    """64-bit SimHash of an iterable of byte strings"""
+    weights = [0] * 64
+    # Distinct features only: runs of transparent pixels must not dominate
+    for feature in set(features):
+        h = int.from_bytes(hashlib.blake2b(feature, digest_size=8).digest(), 'little')
+        for bit in range(64):
+            weights[bit] += 1 if (h >> bit) & 1 else -1
+    value = 0
+    for bit in range(64):
+        if weights[bit] > 0:
+            value |= 1 << bit
+    return value
+
+
+def sampled_shingles(data, size=8, samples=4096):
+    """Evenly spaced byte shingles so huge files cost the same as small ones"""
+    if len(data) <= size:
+        return [data]
+    stride = max(1, (len(data) - size) // samples)
+    return [data[i:i + size] for i in range(0, len(data) - size, stride)]
+
+
+def png_pixel_stream(png):
+    """Decompressed (still filtered) scanlines of a PNG, or b'' if unreadable"""
+    if not png.startswith(b'\x89PNG\r\n\x1a\n'):
+        return b''
+    pos, idat = 8, []
+    while pos + 8 <= len(png):
+        length, kind = struct.unpack('>I4s', png[pos:pos + 8])
+        if kind == b'IDAT':
+            idat.append(png[pos + 8:pos + 8 + length])
+        elif kind == b'IEND':
+            break
+        pos += 12 + length
+    try:
+        return zlib.decompress(b''.join(idat))
+    except zlib.error:
+        return b''
+
+
+def raster_fingerprint(png):
+    """dHash with Pillow when available, else SimHash of the pixel stream"""
+    try:
+        from io import BytesIO
+        from PIL import Image
+    except ImportError:
+        return simhash(sampled_shingles(png_pixel_stream(png) or png))
+    img = Image.open(BytesIO(png)).convert('L').resize((9, 8))
+    px = list(img.getdata())
+    value = 0
+    for row in range(8):
+        for col in range(8):
+            if px[row * 9 + col] > px[row * 9 + col + 1]:
+                value |= 1 << (row * 8 + col)
+    return value
+
+
+def svg_fingerprint(data):
+    """Fingerprint embedded rasters plus shape markup with geometry rounded"""
+    rasters = [base64.b64decode(m.group(1)) for m in DATA_URI_PATTERN.finditer(data)]
+    if rasters:
+        # Wrapper SVGs (Figma exports): the embedded image is what you see
+        return raster_fingerprint(max(rasters, key=len))
+    features = []
+    for shape in SVG_SHAPE_PATTERN.finditer(data):
+        # Round numbers so re-exports with tiny float drift still match
+        tag = SVG_NUMBER_PATTERN.sub(
+            lambda m: b'%d' % round(float(m.group(0))), shape.group(0))
+        features.extend(sampled_shingles(tag, size=16, samples=256))
+    return simhash(features or sampled_shingles(data))
+
+
+def wav_fingerprint(path):
+    """dHash over the loudness envelope (65 windows)"""
+    try:
+        with wave.open(path, 'rb') as w:
+            if w.getsampwidth() != 2:
+                return None
+            frames = w.readframes(w.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    samples = array('h', frames)
+    if sys.byteorder == 'big':
+        samples.byteswap()
+    window = max(1, len(samples) // 65)
+    envelope = []
+    for i in range(65):
+        chunk = samples[i * window:(i + 1) * window:16]
+        envelope.append(sum(abs(s) for s in chunk) / max(1, len(chunk)))
+    value = 0
+    for i in range(64):
+        if envelope[i] > envelope[i + 1]:
+            value |= 1 << i
+    return value
+
+
+def fingerprint(path, data):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.svg':
+        return svg_fingerprint(data)
+    if ext in ('.png', '.jpg', '.jpeg'):
+        return raster_fingerprint(data)
+    if ext == '.wav':
+        fp = wav_fingerprint(path)
+        if fp is not None:
+            return fp
+    return simhash(sampled_shingles(data))
+
+
+def collect_assets():
+    assets = []
+    for root, _, files in os.walk(PUBLIC_DIR):
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            rel = os.path.relpath(path, PUBLIC_DIR).replace(os.sep, '/')
+            if rel in IGNORED or rel.startswith(GENERATED_DIRS):
+                continue
+            with open(path, 'rb') as f:
+                data = f.read()
+            assets.append({
+                'rel': rel,
+                'path': path,
+                'size': len(data),
+                'sha256': hashlib.sha256(data).hexdigest(),
+                'fingerprint': fingerprint(path, data),
+            })
+    return assets
+
+
+def collect_references():
+    refs = {}
+    files = []
+    for source in SOURCE_PATHS:
+        if os.path.isfile(source):
+            files.append(source)
+        for root, dirs, names in os.walk(source):
+            dirs[:] = [d for d in dirs if d not in ('node_modules', '.next')]
+            files.extend(os.path.join(root, n) for n in names if n.endswith(SOURCE_EXTS))
+    for path in files:
+        with open(path, 'r', encoding='utf-8') as f:
+            for lineno, line in enumerate(f, 1):
+                for match in REF_PATTERN.finditer(line):
+                    refs.setdefault(match.group(1).strip(), []).append(f'{path}:{lineno}')
+    return refs
+
+
+def find_duplicates(assets):
+    by_hash = {}
+    for asset in assets:
+        by_hash.setdefault(asset['sha256'], []).append(asset)
+    exact = [group for group in by_hash.values() if len(group) > 1]
+
+    # One representative per exact group, then pairwise fingerprint distance
+    reps = [group[0] for group in by_hash.values()]
+    near = []
+    for i, a in enumerate(reps):
+        for b in reps[i + 1:]:
+            if os.path.splitext(a['rel'])[1].lower() != os.path.splitext(b['rel'])[1].lower():
+                continue
+            distance = bin(a['fingerprint'] ^ b['fingerprint']).count('1')
+            if distance <= NEAR_DUP_BITS:
+                near.append((a, b, distance))
+    return exact, near
+
+
+def asset_budget(asset):
+    return PER_ASSET_BUDGET.get(os.path.splitext(asset['rel'])[1].lower(), DEFAULT_ASSET_BUDGET)
+
+
+def payload_target(used):
+    """Shipped bytes with every file within its budget and duplicates shipped once"""
+    distinct = {asset['sha256']: min(asset['size'], asset_budget(asset)) for asset in used}
+    return sum(distinct.values())
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help='exit 1 when the shipped payload exceeds the limit')
+    parser.add_argument('--max-total-mb', type=float,
+                        help='limit in MB instead of the per-asset target (a ceiling while assets are reduced)')
+    args = parser.parse_args()
+
+    assets = collect_assets()
+    refs = collect_references()
+    used = [a for a in assets if a['rel'] in refs]
+    target = payload_target(used)
+    limit = int(args.max_total_mb * 1024 * 1024) if args.max_total_mb else target
+    dead = [a for a in assets if a['rel'] not in refs]
+    missing = sorted(r for r in refs if '.' in r.rsplit('/', 1)[-1]
+                     and not any(a['rel'] == r for a in assets)
+                     and os.path.splitext(r)[1].lower() in PER_ASSET_BUDGET)
+    exact, near = find_duplicates(assets)
+
+    print(f"📦 {len(assets)} assets in {PUBLIC_DIR}/ ({fmt_bytes(sum(a['size'] for a in assets))})")
+
+    print(f"\n🔁 Exact duplicates: {len(exact)}")
+    for group in exact:
+        names = ', '.join(a['rel'] for a in group)
+        print(f"  - {names} ({fmt_bytes(group[0]['size'])} each, "
+              f"{fmt_bytes(group[0]['size'] * (len(group) - 1))} wasted)")
+
+    print(f"\n≈  Near duplicates: {len(near)}")
+    for a, b, distance in near:
+        print(f"  - {a['rel']} ~ {b['rel']} ({distance} bits apart)")
+
+    print(f"\n🪦 Dead assets (no reference in {', '.join(SOURCE_PATHS)}): {len(dead)}")
+    for asset in sorted(dead, key=lambda a: -a['size']):
+        print(f"  - {asset['rel']} ({fmt_bytes(asset['size'])})")
+
+    if missing:
+        print(f"\n❓ Referenced but missing: {len(missing)}")
+        for rel in missing:
+            print(f"  - /{rel} ({refs[rel][0]})")
+
+    over = [(asset, asset_budget(asset)) for asset in used if asset['size'] > asset_budget(asset)]
+    print(f"\n⚖️  Shipped assets over per-asset budget: {len(over)}")
+    for asset, budget in sorted(over, key=lambda item: -item[0]['size']):
+        print(f"  - {asset['rel']}: {fmt_bytes(asset['size'])} (budget {fmt_bytes(budget)})")
+
+    shipped = sum(a['size'] for a in used)
+    print(f"\n🚚 Shipped payload: {fmt_bytes(shipped)} across {len(used)} assets "
+          f"(target {fmt_bytes(target)}, limit {fmt_bytes(limit)})")
+    if shipped > target and limit > target:
+        print(f"⚠️  {fmt_bytes(shipped - target)} over the per-asset target: fix the files above, "
+              f"then lower --max-total-mb")
+
+    if shipped > limit:
+        print(f"❌ Shipped payload exceeds the limit by {fmt_bytes(shipped - limit)}")
+        if args.check:
+            sys.exit(1)
+    else:
+        print("✅ Shipped payload within the limit")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,360 @@
+#!/usr/bin/env python3
+"""
+Bake the opening level of the default seed into lib/game/opening-level-data.ts
+
+Every run from DEFAULT_SEED starts with the same 26 platforms, their coins
+and 20 clouds. This is a Python port of GameEngine's opening-level
+generation (engine.ts: reset, generatePlatforms, generateCoinsForPlatforms,
+addOpeningCoins, generateClouds). It writes the result as one little-endian
+Float64Array in base64, in the layout read by lib/game/opening-level.ts.
+GameEngine.reset() copies that into pooled records instead of generating.
+
+The port has to match the TypeScript bit for bit:
+- JS Math.round is floor(x + 0.5), not Python's round-half-to-even
+- Every random draw happens in the same order, including draws whose
+  value ends up unused and ones skipped by short-circuiting conditions
+- Sorting is stable, like Array.prototype.sort
+
+Development builds regenerate the level in TypeScript once and log an error
+if the bake is stale. Re-run after changing the generator or the layout.
+
+Usage:
+    python3 bake_opening_level.py            # write the data module
+    python3 bake_opening_level.py --check    # exit 1 when it is out of date
+"""
+
+import argparse
+import base64
+import math
+import struct
+import sys
+
+OUTPUT = 'lib/game/opening-level-data.ts'
+
+# Keep in sync with lib/game/opening-level.ts
+LAYOUT_VERSION = 1
+PLATFORM_FIRE = 1
+PLATFORM_DROP = 2
+PLATFORM_UP = 4
+
+# Keep in sync with engine.ts / world.ts
+DEFAULT_SEED = 12345
+CANVAS_H = 640
+TOP_BOUND = 0
+BOTTOM_BOUND = CANVAS_H
+COIN_W = 26
+COIN_H = 26
+
+# getPlatformItems pattern: (hasFire, hasDrop, dropDirection), 1-based cycle of 25
+PLATFORM_ITEMS = [
+    (False, False, 'down'), (False, False, 'down'), (False, False, 'down'),
+    (False, True, 'down'), (False, True, 'up'), (False, False, 'down'),
+    (True, False, 'down'), (False, True, 'up'), (False, True, 'down'),
+    (False, False, 'down'), (False, True, 'up'), (True, False, 'down'),
+    (True, False, 'down'), (False, True, 'down'), (False, False, 'down'),
+    (True, False, 'up'), (False, True, 'up'), (False, False, 'down'),
+    (False, True, 'down'), (False, True, 'up'), (False, True, 'down'),
+    (True, False, 'up'), (False, False, 'down'), (False, True, 'down'),
+    (False, False, 'down'),
+]
+
+DATA_TEMPLATE = """// Generated by bake_opening_level.py - do not edit by hand
+// Opening level of seed {seed}: {platforms} platforms, {coins} coins, {clouds} clouds
+export const OPENING_LEVEL_BASE64 =
+  "{data}"
+"""
+
+
+class SeededRandom:
+    def __init__(self, seed):
+        self.state = seed
+
+    def next(self):
+        self.state = (self.state * 9301 + 49297) % 233280
+        return self.state / 233280
+
+
+def js_round(x):
+    return math.floor(x + 0.5)
+
+
+def platform_items(platform_id):
+    return PLATFORM_ITEMS[(platform_id - 1) % 25]
+
+
+def make_platform(x, y, width, items, platform_id):
+    has_fire, has_drop, direction = items
+    return {
+        'x': x, 'y': y, 'width': width, 'height': 6,
+        'hasFire': has_fire, 'hasDrop': has_drop, 'dropDirection': direction, 'id': platform_id,
+    }
+
+
+def generate_platforms(random, start_x, count, start_id, platforms_passed=0):
+    runner_height = 33
+    min_spacing = runner_height * 2
+    platform_height = 6
+
+    current_score = platforms_passed
+    p = min(1, current_score / 600)
+    current_level = math.floor(platforms_passed / 20) + 1
+    level2_bonus = 20 if current_level == 2 else 0
+
+    platforms = []
+    current_x = start_x
+    for i in range(count):
+        base_width = 100 - 30 * p
+        if current_score < 50:
+            base_width += (50 - current_score) * 0.4
+
+        r = random.next()
+        ratio = 1 if r < 0.34 else 2 if r < 0.67 else 3
+
+        width_raw = base_width * ratio
+        width = max(60, min(300, width_raw + (-6 + random.next() * 12)))
+
+        num_zones = max(1, math.floor((BOTTOM_BOUND - TOP_BOUND - platform_height) / (platform_height + min_spacing)))
+        zone_height = (BOTTOM_BOUND - TOP_BOUND - platform_height) / num_zones
+        zone = math.floor(random.next() * num_zones)
+        y_in_zone = random.next() * max(1, zone_height - platform_height - min_spacing)
+        platform_y = TOP_BOUND + zone * zone_height + y_in_zone + min_spacing / 2
+
+        platform_id = start_id + i
+        bonus_25_26 = 30 if platform_id in (25, 26) else 0
+
+        overlap_min = 25 - 10 * p
+        jitter = -5 + random.next() * 10
+        step = max(40, width - overlap_min + jitter - level2_bonus - bonus_25_26)
+
+        y = max(TOP_BOUND + 64, min(platform_y, BOTTOM_BOUND - platform_height - 64))
+        platforms.append(make_platform(current_x, y, width, platform_items(platform_id), platform_id))
+        current_x += step
+
+    platforms.sort(key=lambda platform: platform['x'])
+    for i in range(1, len(platforms)):
+        current = platforms[i]
+        previous = platforms[i - 1]
+        min_v_space = runner_height * 2
+        p_height = 8
+        horizontal_overlap = not (
+            current['x'] > previous['x'] + previous['width'] or previous['x'] > current['x'] + current['width']
+        )
+        if horizontal_overlap and abs(current['y'] - previous['y']) < min_v_space:
+            if current['y'] > previous['y']:
+                current['y'] = min(previous['y'] + min_v_space, BOTTOM_BOUND - p_height - 64)
+            else:
+                current['y'] = max(previous['y'] - min_v_space, TOP_BOUND + 64)
+
+    return platforms
+
+
+def overlaps(ax, ay, aw, ah, bx, by, bw, bh):
+    return ax < bx + bw and ax + aw > bx and ay < by + bh and ay + ah > by
+
+
+def coin_collides(x, y, coins, platform):
+    for coin in coins:
+        if overlaps(x, y, COIN_W, COIN_H, coin['x'], coin['y'], coin['width'], coin['height']):
+            return True
+    if platform['hasFire']:
+        fire_x = platform['x'] + (platform['width'] - 35) / 2
+        if platform['dropDirection'] == 'up':
+            fire_y = platform['y'] - 42 - 1
+        else:
+            fire_y = platform['y'] + platform['height'] + 1
+        if overlaps(x, y, COIN_W, COIN_H, fire_x, fire_y, 35, 42):
+            return True
+    if platform['hasDrop']:
+        drop_x = platform['x'] + platform['width'] - 42 - 5
+        if platform['dropDirection'] == 'up':
+            drop_y = platform['y'] - 42 - 1
+        else:
+            drop_y = platform['y'] + platform['height'] + 1
+        if overlaps(x, y, COIN_W, COIN_H, drop_x, drop_y, 42, 42):
+            return True
+    return False
+
+
+def make_coin(x, y):
+    return {'x': x, 'y': y, 'width': COIN_W, 'height': COIN_H}
+
+
+def place_coin(random, platform, coins, coin_y):
+    """Up to 10 random spots across the platform; the first free one wins"""
+    for _ in range(10):
+        coin_x = platform['x'] + platform['width'] / 2 - COIN_W / 2 + (random.next() - 0.5) * (platform['width'] * 0.6)
+        final_x = max(platform['x'] + 5, min(coin_x, platform['x'] + platform['width'] - COIN_W - 5))
+        x, y = js_round(final_x), js_round(coin_y)
+        if not coin_collides(x, y, coins, platform):
+            coins.append(make_coin(x, y))
+            return
+
+
+def generate_coins(random, platforms):
+    coins = []
+    drop_w = 42
+    for platform in platforms:
+        if platform['hasDrop'] and random.next() < 0.85:
+            drop_center_x = platform['x'] + platform['width'] - drop_w - 5 + drop_w / 2
+            if platform['dropDirection'] == 'up':
+                coin_y = platform['y'] - COIN_H - 8
+            else:
+                coin_y = platform['y'] + platform['height'] + 8
+            for offset in (-40, -25, 30):
+                coin_x = drop_center_x + offset - COIN_W / 2
+                final_x = max(platform['x'] + 5, min(coin_x, platform['x'] + platform['width'] - COIN_W - 5))
+                coins.append(make_coin(js_round(final_x), js_round(coin_y)))
+        elif not platform['hasFire'] and not platform['hasDrop'] and random.next() < 0.78:
+            place_coin(random, platform, coins, platform['y'] - COIN_H - 8)
+
+        if not platform['hasFire'] and not platform['hasDrop'] and random.next() < 0.3:
+            place_coin(random, platform, coins, platform['y'] + platform['height'] + 8)
+    return coins
+
+
+def add_opening_coins(random, platform, count, coins):
+    for i in range(count):
+        for _ in range(10):
+            base_x = platform['x'] + (i + 1) * (platform['width'] / (count + 1))
+            coin_x = base_x + (random.next() - 0.5) * 30 - COIN_W / 2
+            coin_y = platform['y'] - COIN_H - 8
+            final_x = max(platform['x'] + 5, min(coin_x, platform['x'] + platform['width'] - COIN_W - 5))
+            x, y = js_round(final_x), js_round(coin_y)
+            if not coin_collides(x, y, coins, platform):
+                coins.append(make_coin(x, y))
+                break
+
+
+def generate_clouds(random, start_x, count):
+    clouds = []
+    for i in range(count):
+        if i == 0:
+            cloud_type = 3
+        else:
+            cloud_type = 1 if random.next() < 0.5 else 2
+
+        if cloud_type == 3:
+            final_size = 132
+        else:
+            base_scale = 1.6 + random.next() * 0.4
+            bump = 1.2 + random.next() * 0.2
+            size_multiplier = base_scale * bump
+            if cloud_type == 2:
+                size_multiplier *= [1.0, 1.3, 0.7][math.floor(random.next() * 3)]
+            base_size = 60 + random.next() * 40
+            final_size = base_size * size_multiplier
+
+        clouds.append({
+            'x': start_x + i * (50 + random.next() * 80),
+            'y': 20 + random.next() * 140,
+            'width': final_size,
+            'height': final_size,
+            'opacity': 0.25 + random.next() * 0.4,
+            'type': cloud_type,
+        })
+    return clouds
+
+
+def generate_opening_level(seed):
+    random = SeededRandom(seed)
+    cloud_random = SeededRandom(seed + 1)
+
+    def pick_ratio_width():
+        r = random.next()
+        ratio = 1 if r < 0.34 else 2 if r < 0.67 else 3
+        return max(60, min(300, 100 * ratio))
+
+    none = (False, False, 'down')
+    platforms = [make_platform(-100, 317, 267, none, 1), make_platform(-100, 250, 267, none, 2)]
+    platforms.append(make_platform(200, 100, pick_ratio_width(), platform_items(2), 3))
+    platforms.append(make_platform(330, 240, pick_ratio_width() * 1.4, platform_items(3), 4))
+    platforms.append(make_platform(480, 110, pick_ratio_width(), platform_items(4), 5))
+    platforms.append(make_platform(640, 200, pick_ratio_width(), platform_items(5), 6))
+
+    coins = generate_coins(random, platforms)
+    add_opening_coins(random, platforms[4], 3, coins)
+    add_opening_coins(random, platforms[2], 5, coins)
+
+    generated = generate_platforms(random, 800, 20, 7)
+    platforms.extend(generated)
+    coins.extend(generate_coins(random, generated))
+
+    # Manual placement tweaks (platform 25 closer to 24, 13 further from 12)
+    p24, p25 = platforms[23], platforms[24]
+    p25['x'] = p24['x'] + p24['width'] + 10
+    p12, p13 = platforms[11], platforms[12]
+    p13['x'] = max(p13['x'], p12['x'] + p12['width'] + 60)
+    target_y = p12['y'] + 50 if p12['y'] < (TOP_BOUND + BOTTOM_BOUND) / 2 else p12['y'] - 50
+    p13['y'] = max(TOP_BOUND + 64, min(BOTTOM_BOUND - 64, target_y))
+
+    clouds = generate_clouds(cloud_random, 0, 20)
+
+    last = platforms[-1]
+    return {
+        'seed': seed,
+        'random': random.state,
+        'cloud_random': cloud_random.state,
+        'next_chunk_x': last['x'] + last['width'] + 200,
+        'next_chunk_id': 27,
+        'next_cloud_x': 20 * 130,
+        # Same order as the engine's x-sorted spatial indexes
+        'platforms': sorted(platforms, key=lambda platform: platform['x']),
+        'coins': sorted(coins, key=lambda coin: coin['x']),
+        'clouds': sorted(clouds, key=lambda cloud: cloud['x']),
+    }
+
+
+def encode(level):
+    values = [
+        LAYOUT_VERSION, level['seed'], level['random'], level['cloud_random'],
+        level['next_chunk_x'], level['next_chunk_id'], level['next_cloud_x'],
+        len(level['platforms']), len(level['coins']), len(level['clouds']),
+    ]
+    for platform in level['platforms']:
+        flags = (
+            (PLATFORM_FIRE if platform['hasFire'] else 0)
+            | (PLATFORM_DROP if platform['hasDrop'] else 0)
+            | (PLATFORM_UP if platform['dropDirection'] == 'up' else 0)
+        )
+        values += [platform['x'], platform['y'], platform['width'], platform['height'], flags, platform['id']]
+    for coin in level['coins']:
+        values += [coin['x'], coin['y'], coin['width'], coin['height']]
+    for cloud in level['clouds']:
+        values += [cloud['x'], cloud['y'], cloud['width'], cloud['height'], cloud['opacity'], cloud['type']]
+    return struct.pack(f'<{len(values)}d', *values)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--check', action='store_true', help='fail when the data module is out of date')
+    args = parser.parse_args()
+
+    level = generate_opening_level(DEFAULT_SEED)
+    blob = encode(level)
+    source = DATA_TEMPLATE.format(
+        seed=DEFAULT_SEED,
+        platforms=len(level['platforms']),
+        coins=len(level['coins']),
+        clouds=len(level['clouds']),
+        data=base64.b64encode(blob).decode('ascii'),
+    )
+
+    if args.check:
+        try:
+            with open(OUTPUT) as f:
+                current = f.read()
+        except FileNotFoundError:
+            current = None
+        if current != source:
+            sys.exit(f"❌ {OUTPUT} is out of date: run python3 bake_opening_level.py")
+        print(f"✅ {OUTPUT} is up to date")
+        return
+
+    with open(OUTPUT, 'w') as f:
+        f.write(source)
+    print(f"✅ Baked seed {DEFAULT_SEED} into {OUTPUT} ({len(blob)} bytes)")
+    print(f"  - {len(level['platforms'])} platforms, {len(level['coins'])} coins, {len(level['clouds'])} clouds")
+
+
+if __name__ == '__main__':
+    main()
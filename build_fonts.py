@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Self-host the game's web fonts as subset WOFF2 files
+
+- Vendoring: the upstream variable TTFs and their OFL license are downloaded
+  once into fonts/ (commit it); later runs work offline from that copy
+- Instancing: axes are pinned or narrowed to what the UI uses (Instrument
+  Sans at normal width, only the weights referenced by the page and canvas)
+- Subsetting: only Basic Latin is kept (scores, labels, the canvas "$" and
+  "+1"); emoji and anything else falls back to the system font
+- Output: public/fonts/<slug>.woff2, the @font-face rules in app/fonts.css
+  and lib/game/font-files.ts, which lists the files for the preload links
+  (app/layout.tsx) and the render worker
+- Fallback: families without a WOFF2 in public/fonts/ are listed in
+  FONT_STYLESHEET instead, and app/layout.tsx loads that Google Fonts
+  stylesheet without blocking render (preconnect, then a script-inserted
+  link). No page ever points at a font file that isn't there
+
+Re-run after changing FAMILIES or SUBSET_TEXT, and commit public/fonts/ with
+the generated sources. --check (run by prebuild) fails when app/fonts.css or
+lib/game/font-files.ts don't match the WOFF2 files on disk, e.g. fonts that
+were built locally but never committed.
+
+Usage:
+    python3 build_fonts.py             # vendor, subset and write every output
+    python3 build_fonts.py --sources   # rewrite the CSS/TS from the files on disk
+    python3 build_fonts.py --check     # exit 1 when the CSS/TS are stale
+
+Building requires fonttools and brotli (pip install fonttools brotli).
+"""
+
+import argparse
+import os
+import sys
+import urllib.request
+
+VENDOR_DIR = 'fonts'
+PUBLIC_DIR = 'public'
+OUTPUT_DIR = os.path.join(PUBLIC_DIR, 'fonts')
+CSS_OUTPUT = 'app/fonts.css'
+TS_OUTPUT = 'lib/game/font-files.ts'
+UPSTREAM = 'https://raw.githubusercontent.com/google/fonts/main/ofl'
+HOSTED_CSS = 'https://fonts.googleapis.com/css2'
+
+# Weights in use: Rethink Sans 400 (canvas "$"), 500 (font-medium), 700 (bold
+# labels, canvas); Instrument Sans 500 (font-medium) and 600 (font-semibold).
+# Upright only: nothing sets font-style: italic, so the italic faces the old
+# injected stylesheets requested are dropped
+FAMILIES = [
+    {
+        'family': 'Rethink Sans',
+        'slug': 'rethink-sans',
+        'upstream': 'rethinksans/RethinkSans[wght].ttf',
+        'axes': {'wght': (400, 700)},
+    },
+    {
+        'family': 'Instrument Sans',
+        'slug': 'instrument-sans',
+        'upstream': 'instrumentsans/InstrumentSans[wdth,wght].ttf',
+        'axes': {'wdth': 100, 'wght': (500, 600)},
+    },
+]
+
+SUBSET_TEXT = ''.join(chr(code) for code in range(0x20, 0x7F))
+UNICODE_RANGE = 'U+0020-007E'
+
+CSS_TEMPLATE = """@font-face {{
+  font-family: "{family}";
+  font-style: normal;
+  font-weight: {weight};
+  font-display: swap;
+  src: url("{url}") format("woff2");
+  unicode-range: {unicode_range};
+}}
+"""
+
+TS_TEMPLATE = """// Generated by build_fonts.py - do not edit by hand
+
+// Self-hosted subset fonts in public/fonts/ (app/fonts.css)
+export const FONT_FILES: {{ family: string; weight: string; url: string }}[] = {files}
+
+// Hosted stylesheet for the families not built yet (null once all are)
+export const FONT_STYLESHEET: string | null = {stylesheet}
+"""
+
+
+def output_path(spec):
+    return os.path.join(OUTPUT_DIR, f"{spec['slug']}.woff2")
+
+
+def font_url(spec):
+    return f"/fonts/{spec['slug']}.woff2"
+
+
+def weight_range(spec):
+    low, high = spec['axes']['wght']
+    return low, high
+
+
+def stylesheet_url(specs):
+    """Google Fonts css2 URL for the given families at their weight ranges"""
+    families = '&'.join(
+        f"family={spec['family'].replace(' ', '+')}:wght@{'..'.join(map(str, weight_range(spec)))}"
+        for spec in specs
+    )
+    return f"{HOSTED_CSS}?{families}&display=swap"
+
+
+def sources():
+    """(app/fonts.css, lib/game/font-files.ts) text for the WOFF2 files on disk"""
+    built = [spec for spec in FAMILIES if os.path.exists(output_path(spec))]
+    hosted = [spec for spec in FAMILIES if spec not in built]
+
+    rules = [
+        CSS_TEMPLATE.format(
+            family=spec['family'],
+            weight='{} {}'.format(*weight_range(spec)),
+            url=font_url(spec),
+            unicode_range=UNICODE_RANGE,
+        )
+        for spec in built
+    ]
+    if not rules:
+        rules.append('/* No fonts built yet: app/layout.tsx loads the hosted stylesheet */\n')
+    css = '/* Generated by build_fonts.py - do not edit by hand */\n' + '\n'.join(rules)
+
+    entries = [
+        '  {{ family: "{}", weight: "{} {}", url: "{}" }},'.format(spec['family'], *weight_range(spec), font_url(spec))
+        for spec in built
+    ]
+    files = '[\n' + '\n'.join(entries) + '\n]' if entries else '[]'
+    stylesheet = f'"{stylesheet_url(hosted)}"' if hosted else 'null'
+    ts = TS_TEMPLATE.format(files=files, stylesheet=stylesheet)
+    return {CSS_OUTPUT: css, TS_OUTPUT: ts}, built, hosted
+
+
+def vendor(path, url):
+    """Download url to path unless the vendored copy already exists"""
+    if os.path.exists(path):
+        return False
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    print(f"⬇️  {url}")
+    with urllib.request.urlopen(url) as response, open(path, 'wb') as f:
+        f.write(response.read())
+    return True
+
+
+def build(spec):
+    """Write the subset WOFF2 for one family; (TTF bytes, WOFF2 bytes)"""
+    try:
+        from fontTools import subset
+        from fontTools.varLib import instancer
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        sys.exit("❌ fonttools is required: pip install fonttools brotli")
+
+    upstream_dir = os.path.dirname(spec['upstream'])
+    src = os.path.join(VENDOR_DIR, os.path.basename(spec['upstream']))
+    vendor(src, f"{UPSTREAM}/{spec['upstream']}")
+    vendor(os.path.join(VENDOR_DIR, f"{spec['slug']}-OFL.txt"), f"{UPSTREAM}/{upstream_dir}/OFL.txt")
+
+    font = TTFont(src)
+    font = instancer.instantiateVariableFont(font, spec['axes'])
+
+    options = subset.Options()
+    options.flavor = 'woff2'
+    options.layout_features = ['kern', 'liga', 'calt', 'tnum']
+    options.name_IDs = ['*']
+    options.notdef_outline = True
+    subsetter = subset.Subsetter(options)
+    subsetter.populate(text=SUBSET_TEXT)
+    subsetter.subset(font)
+
+    out = output_path(spec)
+    os.makedirs(OUTPUT_DIR, exist_ok=True)
+    font.flavor = 'woff2'
+    font.save(out)
+    return os.path.getsize(src), os.path.getsize(out)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument('--sources', action='store_true',
+                      help=f'rewrite {CSS_OUTPUT} and {TS_OUTPUT} without building fonts')
+    mode.add_argument('--check', action='store_true',
+                      help=f'exit 1 when {CSS_OUTPUT} or {TS_OUTPUT} do not match {OUTPUT_DIR}/')
+    args = parser.parse_args()
+
+    if not args.sources and not args.check:
+        for spec in FAMILIES:
+            size_in, size_out = build(spec)
+            print(f"  - {spec['family']}: {size_in / 1024:.0f} KB TTF → {size_out / 1024:.0f} KB WOFF2")
+
+    outputs, built, hosted = sources()
+    if args.check:
+        stale = []
+        for path, text in outputs.items():
+            current = open(path).read() if os.path.exists(path) else None
+            if current != text:
+                stale.append(path)
+        if stale:
+            missing = [output_path(spec) for spec in hosted]
+            print(f"❌ Stale font sources: {', '.join(stale)}")
+            if missing:
+                print(f"  - Not in {OUTPUT_DIR}/: {', '.join(missing)} (built but never committed?)")
+            sys.exit(f"❌ Run python3 build_fonts.py (or --sources) and commit {OUTPUT_DIR}/ with the sources")
+        print(f"✅ Font sources match {OUTPUT_DIR}/ ({len(built)} self-hosted, {len(hosted)} hosted)")
+        return
+
+    for path, text in outputs.items():
+        with open(path, 'w') as f:
+            f.write(text)
+    print(f"✅ Wrote {CSS_OUTPUT} and {TS_OUTPUT} ({len(built)} self-hosted, {len(hosted)} hosted)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+Rasterize game sprites into PNG sets sized to their canvas draw sizes
+
+Reads lib/game/asset-manifest.json and writes public/sprites/<scale>x/<id>.png
+for every scale in the manifest, then records the complete sets in
+lib/game/built-sprite-sets.json. The game only requests PNGs from a set listed
+there and loads the source SVGs otherwise, so a checkout without the sets
+never asks for files that aren't there.
+
+Re-run after changing art or draw sizes, and commit public/sprites/ with
+built-sprite-sets.json. --check (run by prebuild) fails when the JSON doesn't
+match the sets on disk, e.g. sets built locally but never committed.
+
+Usage:
+    python3 build_sprites.py             # rasterize and record the sets
+    python3 build_sprites.py --check     # exit 1 when the recorded sets are stale
+
+Building requires cairosvg (pip install cairosvg).
+"""
+
+import argparse
+import json
+import os
+import sys
+
+MANIFEST = 'lib/game/asset-manifest.json'
+BUILT_SETS = 'lib/game/built-sprite-sets.json'
+PUBLIC_DIR = 'public'
+
+
+def set_dir(manifest, scale):
+    return os.path.join(PUBLIC_DIR, manifest['spriteDir'].lstrip('/'), f'{scale}x')
+
+
+def built_scales(manifest):
+    """Scales whose set has a PNG for every sprite"""
+    return [
+        scale for scale in manifest['scales']
+        if all(os.path.exists(os.path.join(set_dir(manifest, scale), f"{sprite['id']}.png"))
+               for sprite in manifest['sprites'])
+    ]
+
+
+def built_sets_json(manifest):
+    return json.dumps({'scales': built_scales(manifest)}, indent=2) + '\n'
+
+
+def build(manifest):
+    try:
+        import cairosvg
+    except ImportError:
+        sys.exit("❌ cairosvg is required: pip install cairosvg")
+
+    total_in = 0
+    total_out = {scale: 0 for scale in manifest['scales']}
+    for sprite in manifest['sprites']:
+        src = os.path.join(PUBLIC_DIR, sprite['src'].lstrip('/'))
+        total_in += os.path.getsize(src)
+        for scale in manifest['scales']:
+            out_dir = set_dir(manifest, scale)
+            os.makedirs(out_dir, exist_ok=True)
+            out = os.path.join(out_dir, f"{sprite['id']}.png")
+            # Stretch to the exact draw box, same as drawImage(img, x, y, w, h)
+            cairosvg.svg2png(
+                url=src,
+                write_to=out,
+                output_width=sprite['width'] * scale,
+                output_height=sprite['height'] * scale,
+            )
+            total_out[scale] += os.path.getsize(out)
+
+    print(f"✅ Built {len(manifest['sprites'])} sprites x {len(manifest['scales'])} scales")
+    print(f"  - Source SVGs: {total_in / 1024:.0f} KB")
+    for scale, size in total_out.items():
+        print(f"  - {scale}x set: {size / 1024:.0f} KB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--check', action='store_true',
+                        help=f'exit 1 when {BUILT_SETS} does not match the sets on disk')
+    args = parser.parse_args()
+
+    with open(MANIFEST, 'r') as f:
+        manifest = json.load(f)
+
+    if args.check:
+        current = open(BUILT_SETS).read() if os.path.exists(BUILT_SETS) else None
+        expected = built_sets_json(manifest)
+        if current != expected:
+            sys.exit(f"❌ {BUILT_SETS} is stale (sets on disk: {built_scales(manifest)}): "
+                     f"run python3 build_sprites.py and commit public/sprites/ with it")
+        print(f"✅ {BUILT_SETS} matches the sets on disk ({len(built_scales(manifest))} built)")
+        return
+
+    build(manifest)
+    with open(BUILT_SETS, 'w') as f:
+        f.write(built_sets_json(manifest))
+    print(f"✅ Wrote {BUILT_SETS}")
+
+
+if __name__ == '__main__':
+    main()
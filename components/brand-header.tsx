@@ -0,0 +1,143 @@
+"use client"
+
+import { useEffect, useState } from "react"
+import type { BenchmarkResult } from "@/lib/game/replay"
+import { SOUND_LABELS, type SoundSettings } from "@/hooks/use-game-audio"
+
+export function BrandHeader({ 
+  showPlatformNumbers, 
+  setShowPlatformNumbers,
+  showPerfHud,
+  setShowPerfHud,
+  soundEnabled,
+  setSoundEnabled,
+  hasReplay,
+  isBenchmarking,
+  benchmarkResult,
+  onRunBenchmark,
+  onSaveReplay,
+  onLoadReplay,
+}: { 
+  showPlatformNumbers: boolean
+  setShowPlatformNumbers: (show: boolean) => void
+  showPerfHud: boolean
+  setShowPerfHud: (show: boolean) => void
+  soundEnabled: SoundSettings
+  setSoundEnabled: (enabled: SoundSettings) => void
+  hasReplay: boolean
+  isBenchmarking: boolean
+  benchmarkResult: BenchmarkResult | null
+  onRunBenchmark: () => void
+  onSaveReplay: () => void
+  onLoadReplay: (file: File) => void
+}) {
+  const [isDropdownOpen, setIsDropdownOpen] = useState(false)
+  const [isMobile, setIsMobile] = useState(false)
+
+  // Detect mobile on mount and resize
+  useEffect(() => {
+    const checkMobile = () => {
+      setIsMobile(window.innerWidth < 768)
+    }
+    checkMobile()
+    window.addEventListener('resize', checkMobile)
+    return () => window.removeEventListener('resize', checkMobile)
+  }, [])
+
+  const toggleSound = (key: keyof typeof soundEnabled) => {
+    setSoundEnabled({ ...soundEnabled, [key]: !soundEnabled[key] })
+  }
+
+  return (
+    <div className="w-full max-w-[800px] mb-3 relative z-[100]">
+      {/* Dev Tools Dropdown Button - Desktop Only */}
+      {!isMobile && (
+        <div className="flex justify-center">
+          <button
+            onClick={() => setIsDropdownOpen(!isDropdownOpen)}
+            className="px-4 py-2 bg-gray-800 hover:bg-gray-700 text-white font-medium rounded-lg transition-colors flex items-center gap-2 relative z-[100]"
+          >
+            🛠️ Dev Tools
+            <svg
+              className={`w-4 h-4 transition-transform ${isDropdownOpen ? "rotate-180" : ""}`}
+              fill="none"
+              stroke="currentColor"
+              viewBox="0 0 24 24"
+            >
+              <path strokeLinecap="round" strokeLinejoin="round" strokeWidth={2} d="M19 9l-7 7-7-7" />
+            </svg>
+          </button>
+        </div>
+      )}
+
+      {/* Dropdown Content */}
+      {!isMobile && isDropdownOpen && (
+        <div className="absolute left-1/2 -translate-x-1/2 mt-2 w-72 bg-white rounded-lg shadow-xl border border-gray-200 p-4 text-sm text-gray-800 z-[100]">
+          <div className="font-semibold mb-2">Overlays</div>
+          <label className="flex items-center gap-2 mb-3">
+            <input
+              type="checkbox"
+              checked={showPlatformNumbers}
+              onChange={() => setShowPlatformNumbers(!showPlatformNumbers)}
+            />
+            Platform numbers
+          </label>
+          <label className="flex items-center gap-2 mb-3">
+            <input type="checkbox" checked={showPerfHud} onChange={() => setShowPerfHud(!showPerfHud)} />
+            Performance HUD
+          </label>
+
+          <div className="font-semibold mb-2">Sounds</div>
+          <div className="grid grid-cols-2 gap-1 mb-3">
+            {(Object.keys(SOUND_LABELS) as (keyof typeof SOUND_LABELS)[]).map((key) => (
+              <label key={key} className="flex items-center gap-2">
+                <input type="checkbox" checked={soundEnabled[key]} onChange={() => toggleSound(key)} />
+                {SOUND_LABELS[key]}
+              </label>
+            ))}
+          </div>
+
+          <div className="font-semibold mb-2">Replay benchmark</div>
+          <div className="flex flex-wrap gap-2 mb-2">
+            <button
+              onClick={onRunBenchmark}
+              disabled={!hasReplay || isBenchmarking}
+              className="px-2 py-1 bg-gray-800 hover:bg-gray-700 disabled:opacity-40 text-white rounded"
+            >
+              {isBenchmarking ? "Running…" : "▶ Run last replay"}
+            </button>
+            <button
+              onClick={onSaveReplay}
+              disabled={!hasReplay}
+              className="px-2 py-1 bg-gray-200 hover:bg-gray-300 disabled:opacity-40 rounded"
+            >
+              Save
+            </button>
+            <label className="px-2 py-1 bg-gray-200 hover:bg-gray-300 rounded cursor-pointer">
+              Load
+              <input
+                type="file"
+                accept=".replay"
+                className="hidden"
+                onChange={(e) => {
+                  const file = e.target.files?.[0]
+                  if (file) onLoadReplay(file)
+                  e.target.value = ""
+                }}
+              />
+            </label>
+          </div>
+          {benchmarkResult && (
+            <div className="font-mono text-xs text-gray-600">
+              {benchmarkResult.frames} frames of {benchmarkResult.stepsPerFrame} ticks · mean{" "}
+              {benchmarkResult.meanMs.toFixed(2)} ms
+              <br />
+              p50 {benchmarkResult.p50Ms.toFixed(2)} · p95 {benchmarkResult.p95Ms.toFixed(2)} · max{" "}
+              {benchmarkResult.maxMs.toFixed(2)} ms
+            </div>
+          )}
+        </div>
+      )}
+    </div>
+  )
+}
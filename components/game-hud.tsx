@@ -0,0 +1,57 @@
+"use client"
+
+// Level, lives and score above the canvas
+export function GameHud({ level, lives, score }: { level: number; lives: number; score: number }) {
+  return (
+    <div className="w-[390px]">
+      <div
+        className="px-4 py-[20px] rounded-t-lg rounded-b-none shadow-lg select-none"
+        style={{
+          background: "linear-gradient(135deg, #1e3a8a 0%, #1e40af 100%)",
+          fontFamily: "Rethink Sans, sans-serif",
+        }}
+      >
+        <div className="flex items-center justify-between gap-2">
+          <div
+            className="text-white font-medium text-lg drop-shadow-lg leading-none"
+            style={{ fontFamily: "Rethink Sans, sans-serif" }}
+          >
+            Level {level}
+          </div>
+
+          <div className="flex items-center justify-center gap-1 leading-none select-none">
+            {[1, 2, 3].map((heartIndex) => (
+              <svg
+                key={heartIndex}
+                width="26"
+                height="26"
+                viewBox="0 0 24 24"
+                className="drop-shadow-lg"
+              >
+                <defs>
+                  <linearGradient id={`heartGradient${heartIndex}`} x1="0%" y1="0%" x2="0%" y2="100%">
+                    <stop offset="0%" stopColor={heartIndex <= lives ? "#ff6b6b" : "#d1d5db"} />
+                    <stop offset="100%" stopColor={heartIndex <= lives ? "#c92a2a" : "#9ca3af"} />
+                  </linearGradient>
+                </defs>
+                <path
+                  d="M12 21.35l-1.45-1.32C5.4 15.36 2 12.28 2 8.5 2 5.42 4.42 3 7.5 3c1.74 0 3.41.81 4.5 2.09C13.09 3.81 14.76 3 16.5 3 19.58 3 22 5.42 22 8.5c0 3.78-3.4 6.86-8.55 11.54L12 21.35z"
+                  fill={heartIndex <= lives ? `url(#heartGradient${heartIndex})` : "rgba(255, 255, 255, 0.4)"}
+                  stroke={heartIndex <= lives ? "none" : "white"}
+                  strokeWidth={heartIndex <= lives ? "0" : "1.5"}
+                />
+              </svg>
+            ))}
+          </div>
+
+          <div
+            className="text-white font-medium text-lg drop-shadow-lg leading-none"
+            style={{ fontFamily: "Rethink Sans, sans-serif" }}
+          >
+            Score: {score}
+          </div>
+        </div>
+      </div>
+    </div>
+  )
+}
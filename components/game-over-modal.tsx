@@ -0,0 +1,79 @@
+"use client"
+
+// Final and best score, shown when a run ends
+export function GameOverModal({
+  score,
+  bestScore,
+  isNewBestScore,
+  onStartAgain,
+}: {
+  score: number
+  bestScore: number
+  isNewBestScore: boolean
+  onStartAgain: () => void
+}) {
+  return (
+    <div className="fixed inset-0 z-50 bg-black bg-opacity-75 flex items-center justify-center p-4">
+      {/* Main overlay panel */}
+      <div
+        className="bg-white rounded-2xl p-8 text-center shadow-2xl flex flex-col w-full max-w-sm mx-auto"
+        style={{ fontFamily: "Rethink Sans, sans-serif" }}
+      >
+        {/* Brand Logo */}
+        <div className="mb-4 flex justify-center">
+          <img src="/brand.svg" alt="Brand Logo" className="w-32 h-auto select-none" />
+        </div>
+
+        {/* Game Over Image */}
+        <div className="mb-6 flex justify-center">
+          <img src="/game-over.png" alt="Game Over" className="w-44 h-auto select-none" />
+        </div>
+
+        {/* New Best Score notification */}
+        {isNewBestScore && (
+          <div className="mb-6 p-3 bg-yellow-100 border border-yellow-300 rounded-lg">
+            <p
+              className="text-lg font-bold text-yellow-800 select-none"
+              style={{ fontFamily: "Rethink Sans, sans-serif" }}
+            >
+              🎉 NEW BEST SCORE! 🎉
+            </p>
+          </div>
+        )}
+
+        {/* Scores grouped together */}
+        <div className="mb-8 flex-grow flex flex-col justify-center">
+          <p
+            className="text-xl text-black mb-2 select-none uppercase font-semibold"
+            style={{ fontFamily: "Instrument Sans, sans-serif" }}
+          >
+            Score: {score}
+          </p>
+          {bestScore > 0 && (
+            <div className="flex items-center justify-center gap-2">
+              <img src="/trophy-02.svg" alt="Trophy" className="w-5 h-5 select-none" style={{ filter: "grayscale(100%) brightness(0.5)" }} />
+              <p className="text-base text-black select-none uppercase font-medium" style={{ fontFamily: "Instrument Sans, sans-serif" }}>
+                Best Score: {bestScore}
+              </p>
+            </div>
+          )}
+        </div>
+
+        {/* Start Again Button - at bottom */}
+        <button
+          onClick={onStartAgain}
+          className="bg-black hover:bg-gray-900 text-white font-medium transition-all duration-200 hover:scale-105 active:scale-95 select-none mx-auto"
+          style={{
+            fontFamily: "Instrument Sans, sans-serif",
+            fontSize: "17px",
+            borderRadius: "40px",
+            width: "153px",
+            height: "53px",
+          }}
+        >
+          Start Again
+        </button>
+      </div>
+    </div>
+  )
+}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Generate public/sw.js from the asset manifest
+
+- Precache: the critical path flagged "precache" in lib/game/asset-manifest.json
+  (character and coin frames, the drop on the first platforms, land and coin
+  sounds) plus the page shell and the self-hosted fonts (build_fonts.py),
+  which every page preloads. Sprites are precached at one scale: the
+  smallest built set (build_sprites.py), or the SVG when none is built
+- Lazy: every other same-origin asset is cached the first time it is fetched
+  (fire states, clouds, game-over and level-up audio, Next.js chunks)
+- Versioned eviction: cache names carry a hash of every listed file, and the
+  activate handler deletes every cache from an older version
+
+Runs as part of `npm run build`; re-run after changing assets or the manifest.
+"""
+
+import hashlib
+import json
+import os
+
+MANIFEST = 'lib/game/asset-manifest.json'
+BUILT_SETS = 'lib/game/built-sprite-sets.json'
+PUBLIC_DIR = 'public'
+OUTPUT = os.path.join(PUBLIC_DIR, 'sw.js')
+CACHE_PREFIX = 'coal-jack'
+
+# Always precached so a repeat start can boot offline
+SHELL = ['/']
+FONT_DIR = 'fonts'
+
+SW_TEMPLATE = """// Generated by generate_service_worker.py - do not edit by hand
+const VERSION = "__VERSION__"
+const PRECACHE = `__PREFIX__-precache-${VERSION}`
+const RUNTIME = `__PREFIX__-runtime-${VERSION}`
+const PRECACHE_URLS = __PRECACHE_URLS__
+const LAZY_URLS = new Set(__LAZY_URLS__)
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(PRECACHE).then((cache) => cache.addAll(PRECACHE_URLS)).then(() => self.skipWaiting()),
+  )
+})
+
+// Versioned eviction: drop every cache this version doesn't own
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(
+        keys
+          .filter((key) => key.startsWith("__PREFIX__-") && key !== PRECACHE && key !== RUNTIME)
+          .map((key) => caches.delete(key)),
+      ))
+      .then(() => self.clients.claim()),
+  )
+})
+
+const isCacheable = (url) =>
+  url.origin === self.location.origin &&
+  (LAZY_URLS.has(url.pathname) ||
+    url.pathname.startsWith("/_next/static/") ||
+    url.pathname.startsWith("__SPRITE_DIR__/") ||
+    url.pathname.startsWith("/__FONT_DIR__/"))
+
+const cacheFirst = async (request) => {
+  const cached = await caches.match(request, { ignoreSearch: true })
+  if (cached) return cached
+  const response = await fetch(request)
+  if (response.ok) {
+    const cache = await caches.open(RUNTIME)
+    cache.put(request, response.clone())
+  }
+  return response
+}
+
+// Pages: network first so deploys show up, cached shell when offline
+const networkFirst = async (request) => {
+  try {
+    const response = await fetch(request)
+    if (response.ok) {
+      const cache = await caches.open(RUNTIME)
+      cache.put(request, response.clone())
+    }
+    return response
+  } catch (error) {
+    const cached = (await caches.match(request)) || (await caches.match("/"))
+    if (cached) return cached
+    throw error
+  }
+}
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event
+  if (request.method !== "GET") return
+  const url = new URL(request.url)
+  if (request.mode === "navigate") {
+    event.respondWith(networkFirst(request))
+  } else if (PRECACHE_URLS.includes(url.pathname) || isCacheable(url)) {
+    event.respondWith(cacheFirst(request))
+  }
+})
+
+// The page posts the chunks it loaded before this worker took control
+self.addEventListener("message", (event) => {
+  if (event.data?.type !== "warm") return
+  event.waitUntil(
+    caches.open(RUNTIME).then((cache) =>
+      Promise.all(event.data.urls.map((url) =>
+        cache.match(url).then((hit) => hit || cache.add(url).catch(() => undefined)),
+      )),
+    ),
+  )
+})
+"""
+
+
+def public_path(url):
+    return os.path.join(PUBLIC_DIR, url.lstrip('/'))
+
+
+def precache_sprite_url(manifest, built_scales, sprite):
+    """The smallest built set (what phones load), otherwise the source SVG"""
+    if built_scales:
+        return f"{manifest['spriteDir']}/{min(built_scales)}x/{sprite['id']}.png"
+    return sprite['src']
+
+
+with open(MANIFEST, 'r') as f:
+    manifest = json.load(f)
+with open(BUILT_SETS, 'r') as f:
+    built_scales = json.load(f)['scales']
+
+# One scale per sprite: a device only uses one, and the other sets are
+# cached on first use under the sprite directory
+precache, lazy = list(SHELL), []
+for sprite in manifest['sprites']:
+    if sprite.get('precache'):
+        precache.append(precache_sprite_url(manifest, built_scales, sprite))
+for sound in manifest['sounds']:
+    (precache if sound.get('precache') else lazy).append(sound['src'])
+font_dir = public_path(FONT_DIR)
+if os.path.isdir(font_dir):
+    precache.extend(f'/{FONT_DIR}/{name}' for name in sorted(os.listdir(font_dir)) if name.endswith('.woff2'))
+# Source SVGs stay lazily cacheable for the sprite-set fallback
+lazy.extend(sprite['src'] for sprite in manifest['sprites'])
+lazy = sorted(set(lazy) - set(precache))
+
+# Version from asset bytes + manifest so any change evicts old caches
+digest = hashlib.sha256(json.dumps(manifest, sort_keys=True).encode())
+for url in precache + lazy:
+    if url in SHELL:
+        continue
+    with open(public_path(url), 'rb') as f:
+        digest.update(url.encode())
+        digest.update(f.read())
+version = digest.hexdigest()[:12]
+
+sw = (SW_TEMPLATE
+      .replace('__VERSION__', version)
+      .replace('__PREFIX__', CACHE_PREFIX)
+      .replace('__SPRITE_DIR__', manifest['spriteDir'])
+      .replace('__FONT_DIR__', FONT_DIR)
+      .replace('__PRECACHE_URLS__', json.dumps(precache, indent=2))
+      .replace('__LAZY_URLS__', json.dumps(lazy, indent=2)))
+
+with open(OUTPUT, 'w') as f:
+    f.write(sw)
+
+precache_bytes = sum(os.path.getsize(public_path(u)) for u in precache if u not in SHELL)
+print(f"✅ Generated {OUTPUT} (version {version})")
+print(f"  - Precache: {len(precache)} URLs ({precache_bytes / 1024:.0f} KB of assets)")
+print(f"  - Lazy: {len(lazy)} URLs cached on first use")
@@ -0,0 +1,155 @@
+"use client"
+
+import { useEffect, useRef, useCallback } from "react"
+import manifest from "@/lib/game/asset-manifest.json"
+import { SoundEngine } from "@/lib/game/sound-engine"
+
+export const SOUND_LABELS = {
+  vortex: "Gravity flip",
+  ouch: "Drop hit",
+  coinCollect: "Coin",
+  success: "Flame",
+  land: "Landing",
+  bgMusic: "Music",
+  gameOver: "Game over",
+}
+
+export type SoundSettings = Record<keyof typeof SOUND_LABELS, boolean>
+
+// Manifest entry (src, volume) for the streamed background track
+const BACKGROUND_MUSIC = manifest.sounds.find((sound) => sound.id === "background-music")!
+
+// Sound effects on the shared AudioContext and streamed background music,
+// each gated by its Dev Tools toggle
+export function useGameAudio(soundEnabled: SoundSettings) {
+  const soundEngineRef = useRef<SoundEngine | null>(null)
+  const backgroundMusicRef = useRef<HTMLAudioElement | null>(null)
+
+  // Decode every sound effect once into the shared AudioContext
+  useEffect(() => {
+    const engine = new SoundEngine()
+    soundEngineRef.current = engine
+    engine.load()
+
+    // Background music streams from a media element
+    const backgroundMusic = new Audio(BACKGROUND_MUSIC.src)
+    backgroundMusic.volume = BACKGROUND_MUSIC.volume
+    backgroundMusic.preload = 'auto'
+    backgroundMusic.load()
+    backgroundMusicRef.current = backgroundMusic
+    backgroundMusic.addEventListener('error', () => {
+      console.error('Failed to load background music:', backgroundMusic.error)
+    })
+
+    // Unlock audio on first user interaction (browser autoplay policy)
+    const unlockAudio = () => {
+      engine.unlock()
+      backgroundMusic.play().then(() => {
+        backgroundMusic.pause()
+        backgroundMusic.currentTime = 0
+      }).catch(() => { /* ignore */ })
+      // Remove listeners after first unlock
+      document.removeEventListener('click', unlockAudio)
+      document.removeEventListener('keydown', unlockAudio)
+      document.removeEventListener('touchstart', unlockAudio)
+    }
+
+    // Add event listeners for first interaction
+    document.addEventListener('click', unlockAudio, { once: true })
+    document.addEventListener('keydown', unlockAudio, { once: true })
+    document.addEventListener('touchstart', unlockAudio, { once: true })
+
+    return () => {
+      document.removeEventListener('click', unlockAudio)
+      document.removeEventListener('keydown', unlockAudio)
+      document.removeEventListener('touchstart', unlockAudio)
+      engine.dispose()
+      soundEngineRef.current = null
+    }
+  }, [])
+
+  // Gravity flip sound (synthesized on the shared AudioContext)
+  const playVortexSound = useCallback(() => {
+    if (!soundEnabled.vortex) return
+    soundEngineRef.current?.playVortex()
+  }, [soundEnabled])
+
+  const playOuchSound = useCallback(() => {
+    if (!soundEnabled.ouch) return
+    soundEngineRef.current?.play("drop-hit")
+  }, [soundEnabled])
+
+  const playCoinCollectSound = useCallback(() => {
+    if (!soundEnabled.coinCollect) return
+    soundEngineRef.current?.play("coin-collect")
+  }, [soundEnabled])
+
+  const playSuccessSound = useCallback(() => {
+    if (!soundEnabled.success) return
+    soundEngineRef.current?.play("flame-touch")
+  }, [soundEnabled])
+
+  const playYeahBoySound = useCallback(() => {
+    if (!soundEnabled.success) return
+    soundEngineRef.current?.play("yeah-boy")
+  }, [soundEnabled])
+
+  const playLandSound = useCallback(() => {
+    if (!soundEnabled.land) return
+    soundEngineRef.current?.play("land")
+  }, [soundEnabled])
+
+  const stopBackgroundMusic = useCallback(() => {
+    if (backgroundMusicRef.current) {
+      backgroundMusicRef.current.pause()
+      backgroundMusicRef.current.currentTime = 0
+    }
+  }, [])
+
+  const playBackgroundMusic = useCallback(() => {
+    if (!soundEnabled.bgMusic || !backgroundMusicRef.current) return
+    try {
+      backgroundMusicRef.current.currentTime = 0
+      backgroundMusicRef.current.loop = true
+      backgroundMusicRef.current.volume = BACKGROUND_MUSIC.volume
+      backgroundMusicRef.current.play().catch((error) => {
+        console.error('Failed to play background music:', error)
+      })
+    } catch (error) {
+      console.error('Failed to play background music:', error)
+    }
+  }, [soundEnabled])
+
+  const playGameOverMusic = useCallback(() => {
+    if (!soundEnabled.gameOver) return
+    // Stop background music when game ends
+    stopBackgroundMusic()
+    // Restart rather than overlap any game over sound still playing
+    soundEngineRef.current?.stop("game-over")
+    soundEngineRef.current?.play("game-over")
+  }, [soundEnabled, stopBackgroundMusic])
+
+  const playLevelUpSound = useCallback(() => {
+    if (!soundEnabled.bgMusic) return
+    soundEngineRef.current?.play("level-up")
+  }, [soundEnabled])
+
+  // Silence the game over sound when a new run starts
+  const stopGameOverSound = useCallback(() => {
+    soundEngineRef.current?.stop("game-over")
+  }, [])
+
+  return {
+    playVortexSound,
+    playOuchSound,
+    playCoinCollectSound,
+    playSuccessSound,
+    playYeahBoySound,
+    playLandSound,
+    playBackgroundMusic,
+    stopBackgroundMusic,
+    playGameOverMusic,
+    playLevelUpSound,
+    stopGameOverSound,
+  }
+}
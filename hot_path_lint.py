@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+"""
+Lint the per-frame code paths for allocations, logging and React updates
+
+Everything in HOT_PATHS runs every animation frame or every simulation step.
+Per function (nested callbacks included) the lint counts:
+
+- log: console.* calls
+- alloc: array/object literals, `new`, spreads, template strings, String()
+  and allocating calls (.map/.filter/.slice/Object.keys/JSON/...)
+- closure: arrow functions and function expressions created per call
+- save/restore: canvas state pushes and pops (reported when unbalanced)
+- setter: React state setters (from `useState` in the same file)
+
+The target for every category is zero. hot_path_budget.json lists the only
+exceptions, each with a count and the reason it is acceptable (a cache-miss
+branch, one event object per engine event, a balanced transform); a finding
+without an entry fails --budget. Logging is never allowed, and React setters
+only in EVENT_HANDLERS, which run once per engine event rather than per frame.
+Entries are written by hand: add one only with its reason, and lower the
+count when the code improves (--budget lists allowances left unused).
+run_patch.py runs the same check after every patch script.
+
+Usage:
+    python3 hot_path_lint.py              # report every finding
+    python3 hot_path_lint.py --budget     # exit 1 on any finding not allowed
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from tsx_tokens import TokenIndex
+
+BUDGET_FILE = 'hot_path_budget.json'
+
+# file -> functions on the per-frame path (names or glob patterns)
+HOT_PATHS = {
+    'Baron-web.tsx': ['gameLoop', 'render', 'handleEngineEvent'],
+    'lib/game/engine.ts': ['step', 'flip', 'addScore', 'checkFireCollision', 'checkDropCollision'],
+    'lib/game/glyph-atlas.ts': ['measure', 'measureInt', 'draw', 'drawInt', 'drawString', 'blit'],
+    'lib/game/input-queue.ts': ['apply'],
+    'lib/game/render-frame.ts': ['writeFrame'],
+    'lib/game/renderer.ts': ['draw', 'drawPlatformNumbers', 'drawPlayer', 'drawCoin', 'levelLabel'],
+}
+
+# Hot functions that may update React state: called per engine event, not per frame
+EVENT_HANDLERS = {'Baron-web.tsx:handleEngineEvent'}
+
+CATEGORIES = ['log', 'alloc', 'closure', 'save', 'restore', 'setter']
+
+ALLOCATING_METHODS = {
+    'map', 'filter', 'slice', 'concat', 'flat', 'flatMap', 'split', 'join',
+    'toFixed', 'padStart', 'padEnd', 'toString', 'bind', 'splice',
+}
+ALLOCATING_STATICS = {
+    'Object': {'keys', 'values', 'entries', 'assign', 'fromEntries'},
+    'Array': {'from', 'of'},
+    'JSON': {'stringify', 'parse'},
+}
+# Previous tokens after which `[` / `{` start a literal rather than an index or block
+LITERAL_AFTER = {'=', '(', ',', '?', ':', '[', '??', '||', '&&', '!', 'return', '...', '+', '-'}
+
+
+def react_setters(index):
+    """Names bound by `const [value, setValue] = useState(...)`"""
+    setters = set()
+    code = index.code
+    for k in range(len(code) - 6):
+        if (
+            code[k].text in ('const', 'let')
+            and index.is_punct(k + 1, '[')
+            and index.is_punct(k + 3, ',')
+            and index.is_punct(k + 5, ']')
+            and code[k + 7].text.startswith('useState')
+        ):
+            setters.add(code[k + 4].text)
+    return setters
+
+
+def is_case_block(index, k):
+    """`case "x": {` / `default: {`: a block, not an object literal"""
+    return index.text(k) == '{' and index.text(k - 1) == ':' and (
+        index.text(k - 2) == 'default' or index.text(k - 3) == 'case'
+    )
+
+
+def lint_function(index, fn, setters):
+    """(category, line, snippet) findings inside fn's body"""
+    code = index.code
+    findings = []
+
+    def add(category, k):
+        line = code[k].line
+        snippet = index.source.splitlines()[line - 1].strip()
+        findings.append((category, line, snippet))
+
+    for k in index.body_tokens(fn):
+        token = code[k]
+        text = token.text
+        previous = index.text(k - 1)
+        following = index.text(k + 1)
+        if token.kind == 'name':
+            if text == 'console' and following == '.':
+                add('log', k)
+            elif text == 'new':
+                add('alloc', k)
+            elif text == 'function' and previous != '.':
+                add('closure', k)
+            elif text == 'String' and following == '(' and previous != '.':
+                add('alloc', k)
+            elif text in ALLOCATING_STATICS and following == '.' and index.text(k + 2) in ALLOCATING_STATICS[text]:
+                add('alloc', k)
+            elif previous in ('.', '?.') and following == '(':
+                if text in ALLOCATING_METHODS:
+                    add('alloc', k)
+                elif text == 'save':
+                    add('save', k)
+                elif text == 'restore':
+                    add('restore', k)
+            elif text in setters and following == '(' and previous not in ('.', '?.'):
+                add('setter', k)
+        elif token.kind == 'template':
+            if '${' in text:
+                add('alloc', k)
+        elif token.kind == 'punct':
+            if text == '=>':
+                add('closure', k)
+            elif text == '...':
+                add('alloc', k)
+            elif text in ('[', '{') and previous in LITERAL_AFTER and not is_case_block(index, k):
+                add('alloc', k)
+    return findings
+
+
+def lint(paths=HOT_PATHS):
+    """{'file:function': [(category, line, snippet), ...]} for every hot function found"""
+    report = {}
+    for path, names in paths.items():
+        if not os.path.exists(path):
+            continue
+        index = TokenIndex(path)
+        setters = react_setters(index)
+        for fn in index.find(names):
+            report[f"{path}:{fn.name}"] = lint_function(index, fn, setters)
+    return report
+
+
+def missing(report, paths=HOT_PATHS):
+    """HOT_PATHS entries (not patterns) that matched no function"""
+    return [
+        f"{path}:{name}" for path, names in paths.items() for name in names
+        if '*' not in name and f"{path}:{name}" not in report
+    ]
+
+
+def counts(findings):
+    totals = {category: 0 for category in CATEGORIES}
+    for category, _, _ in findings:
+        totals[category] += 1
+    return totals
+
+
+def load_budget():
+    if not os.path.exists(BUDGET_FILE):
+        return {}
+    with open(BUDGET_FILE) as f:
+        return json.load(f)
+
+
+def budget_problems(budget):
+    """Allowances the rules forbid: logging, setters per frame, no reason given"""
+    problems = []
+    for key, allowances in sorted(budget.items()):
+        for category, allowance in allowances.items():
+            if category not in CATEGORIES:
+                problems.append(f"{key}: unknown category {category!r} in {BUDGET_FILE}")
+            elif category == 'log':
+                problems.append(f"{key}: logging is never allowed on the hot path")
+            elif category == 'setter' and key not in EVENT_HANDLERS:
+                problems.append(f"{key}: React setters are only allowed in EVENT_HANDLERS")
+            elif not allowance.get('why', '').strip():
+                problems.append(f"{key}: {category} allowance has no reason")
+    return problems
+
+
+def check_budget(report=None):
+    """Messages for findings the budget doesn't allow (empty when clean)"""
+    report = lint() if report is None else report
+    budget = load_budget()
+    problems = budget_problems(budget)
+    for key, findings in sorted(report.items()):
+        allowances = budget.get(key, {})
+        for category, count in counts(findings).items():
+            allowed = allowances.get(category, {}).get('max', 0)
+            if count > allowed:
+                lines = ', '.join(str(line) for c, line, _ in findings if c == category)
+                problems.append(f"{key}: {count} {category} (allowed {allowed}) at lines {lines}")
+    for key in sorted((set(budget) - set(report)) | set(missing(report))):
+        problems.append(f"{key}: hot function not found (renamed? update HOT_PATHS and {BUDGET_FILE})")
+    return problems
+
+
+def unused_allowances(report):
+    """Allowances above today's count: lower them so regressions can't hide"""
+    notes = []
+    for key, allowances in sorted(load_budget().items()):
+        totals = counts(report.get(key, []))
+        for category, allowance in allowances.items():
+            if totals.get(category, 0) < allowance.get('max', 0):
+                notes.append(f"{key}: {category} allows {allowance['max']}, found {totals[category]}")
+    return notes
+
+
+def print_report(report):
+    header = ''.join(f"{category:>9}" for category in CATEGORIES)
+    print(f"{'function':<42}{header}")
+    for key, findings in report.items():
+        totals = counts(findings)
+        print(f"{key:<42}" + ''.join(f"{totals[category]:>9}" for category in CATEGORIES))
+    for key, findings in report.items():
+        totals = counts(findings)
+        if not findings:
+            continue
+        print(f"\n📄 {key}")
+        if totals['save'] != totals['restore']:
+            print(f"  ⚠️  {totals['save']} save() vs {totals['restore']} restore()")
+        for category, line, snippet in findings:
+            print(f"  - {line:>5} {category:<8} {snippet[:90]}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--budget', action='store_true', help=f'fail on any finding {BUDGET_FILE} does not allow')
+    args = parser.parse_args()
+
+    report = lint()
+    if args.budget:
+        problems = check_budget(report)
+        if problems:
+            print(f"❌ Hot path findings not allowed by {BUDGET_FILE}:")
+            for problem in problems:
+                print(f"  - {problem}")
+            sys.exit(1)
+        for note in unused_allowances(report):
+            print(f"⚠️  {note}: lower the allowance")
+        print(f"✅ Hot path clean ({len(report)} functions)")
+    else:
+        print_report(report)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,26 @@
+// Sprite animation timing derived from the rAF timestamp. Frame indices are
+// computed on demand from the clock, so advancing an animation never touches
+// React state and never re-renders the component.
+
+export const ANIMATIONS = {
+  player: { periodMs: 100, frames: 3 }, // Character_1 → 1.5 → 2
+  platformFire: { periodMs: 300, frames: 2 }, // fire_1 ↔ fire_2
+  coin: { periodMs: 200, frames: 4 }, // COIN-1..4 flip
+} as const
+
+export type AnimationName = keyof typeof ANIMATIONS
+
+export class AnimationClock {
+  now = 0
+
+  // Call once per rAF callback with its timestamp
+  tick(timeMs: number) {
+    this.now = timeMs
+  }
+
+  // Current frame of a looping animation, optionally offset by a phase
+  frame(name: AnimationName, phase = 0) {
+    const { periodMs, frames } = ANIMATIONS[name]
+    return (Math.floor(this.now / periodMs) + phase) % frames
+  }
+}
@@ -0,0 +1,123 @@
+import manifest from "./asset-manifest.json"
+import type { DecodeResponse } from "./decode-worker"
+import { getSpriteSourceUrl, getSpriteUrl, hasSpriteSet, loadImage, loadSpriteImage, type SpriteId } from "./sprite-sets"
+
+// Progressive sprite loader. Tiers load in order (0 before 1 before 2) so the
+// character is decoded before the countdown ends and late-game art never
+// competes with it. Everything comes out as an ImageBitmap at draw size, so
+// the first drawImage of a sprite never triggers an SVG decode.
+//
+//   tier 0: character frames (platforms are procedural)
+//   tier 1: coins, drops and platform fires
+//   tier 2: fire states, clouds and DEAD
+
+export type SpriteTier = 0 | 1 | 2
+
+const TIERS: SpriteTier[] = [0, 1, 2]
+
+export class AssetLoader {
+  private bitmaps = new Map<SpriteId, ImageBitmap>()
+  private tierReady = new Map<SpriteTier, Promise<void>>()
+  private worker: Worker | null = null
+  private pending = new Map<string, { resolve: (b: ImageBitmap) => void; reject: (e: Error) => void }>()
+  private disposed = false
+
+  constructor(private scale: number) {
+    if (typeof Worker !== "undefined" && typeof createImageBitmap !== "undefined") {
+      try {
+        this.worker = new Worker(new URL("./decode-worker.ts", import.meta.url))
+        this.worker.onmessage = (event: MessageEvent<DecodeResponse>) => {
+          const { id, bitmap, error } = event.data
+          const request = this.pending.get(id)
+          if (!request) return
+          this.pending.delete(id)
+          if (bitmap) request.resolve(bitmap)
+          else request.reject(new Error(error))
+        }
+      } catch {
+        this.worker = null
+      }
+    }
+
+    // Chain the tiers so each starts only when the previous one is decoded
+    let previous: Promise<void> = Promise.resolve()
+    for (const tier of TIERS) {
+      const ids = manifest.sprites.filter((sprite) => sprite.tier === tier).map((sprite) => sprite.id)
+      previous = previous.then(() => this.loadGroup(ids))
+      this.tierReady.set(tier, previous)
+    }
+  }
+
+  // Resolves when every sprite in this tier (and all earlier tiers) is ready
+  ready(tier: SpriteTier) {
+    return this.tierReady.get(tier)!
+  }
+
+  get(id: SpriteId) {
+    return this.bitmaps.get(id)
+  }
+
+  // All frames of an animation, or null until every one is decoded
+  getFrames(ids: SpriteId[]) {
+    const frames: ImageBitmap[] = []
+    for (const id of ids) {
+      const bitmap = this.bitmaps.get(id)
+      if (!bitmap) return null
+      frames.push(bitmap)
+    }
+    return frames
+  }
+
+  dispose() {
+    this.disposed = true
+    this.worker?.terminate()
+    this.worker = null
+    this.pending.clear()
+    this.bitmaps.forEach((bitmap) => bitmap.close())
+    this.bitmaps.clear()
+  }
+
+  private async loadGroup(ids: SpriteId[]) {
+    await Promise.all(
+      ids.map(async (id) => {
+        try {
+          const bitmap = await this.decode(id)
+          if (this.disposed) bitmap.close()
+          else this.bitmaps.set(id, bitmap)
+        } catch (error) {
+          console.error(`Failed to load sprite ${id}`, error)
+        }
+      }),
+    )
+  }
+
+  // Built PNG set through the worker; source SVG on the main thread otherwise
+  private async decode(id: SpriteId): Promise<ImageBitmap> {
+    let img: HTMLImageElement
+    if (this.worker && hasSpriteSet(this.scale)) {
+      try {
+        return await this.decodeInWorker(id, getSpriteUrl(id, this.scale))
+      } catch {
+        // PNG missing or undecodable: use the SVG source
+        img = await loadImage(getSpriteSourceUrl(id))
+      }
+    } else {
+      img = await loadSpriteImage(id, this.scale)
+    }
+    await img.decode().catch(() => undefined)
+    // Rasterize once at draw size x scale instead of at every drawImage
+    const sprite = manifest.sprites.find((s) => s.id === id)!
+    return createImageBitmap(img, {
+      resizeWidth: Math.round(sprite.width * this.scale),
+      resizeHeight: Math.round(sprite.height * this.scale),
+      resizeQuality: "high",
+    })
+  }
+
+  private decodeInWorker(id: SpriteId, url: string) {
+    return new Promise<ImageBitmap>((resolve, reject) => {
+      this.pending.set(id, { resolve, reject })
+      this.worker!.postMessage({ id, url })
+    })
+  }
+}
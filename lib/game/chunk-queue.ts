@@ -0,0 +1,52 @@
+// Look-ahead world generation. Chunks of the world are generated ahead of
+// the player into a small ring of ready chunks, from idle time when the
+// host has some, and the simulation only pops a ready one when it scrolls
+// far enough. A chunk depends only on the chunk before it and on its own
+// random stream, never on when it was generated, so a run is the same
+// whether its chunks came from idle callbacks, a headless replay or (when
+// the look-ahead ran dry) a synchronous fill inside the step.
+
+export class ChunkQueue<C> {
+  private chunks: C[] = []
+  private head = 0 // Slot of the oldest ready chunk
+  size = 0
+
+  constructor(
+    create: () => C,
+    private generate: (chunk: C) => void,
+    capacity: number,
+  ) {
+    for (let i = 0; i < Math.max(1, capacity); i++) this.chunks.push(create())
+  }
+
+  get full() {
+    return this.size === this.chunks.length
+  }
+
+  // Generate one more chunk into a free slot; false when the look-ahead is full
+  prefetch() {
+    if (this.full) return false
+    this.generate(this.chunks[(this.head + this.size) % this.chunks.length])
+    this.size++
+    return true
+  }
+
+  // Oldest ready chunk, generated on the spot when none is. The chunk is
+  // only valid until the next prefetch() reuses its slot.
+  pop() {
+    if (this.size === 0) this.prefetch()
+    const chunk = this.chunks[this.head]
+    this.head = (this.head + 1) % this.chunks.length
+    this.size--
+    return chunk
+  }
+
+  // Drop the ready chunks (new run); `release` gets each one back first
+  clear(release?: (chunk: C) => void) {
+    if (release) {
+      for (let i = 0; i < this.size; i++) release(this.chunks[(this.head + i) % this.chunks.length])
+    }
+    this.head = 0
+    this.size = 0
+  }
+}
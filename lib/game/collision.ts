@@ -0,0 +1,190 @@
+// Continuous collision for the player box. Every test sweeps the box from
+// its position at the start of a simulation step along that step's
+// displacement, so a fast fall or a long step can't skip over a 6 px
+// platform, a drop or a coin. All functions write into a caller-owned
+// Contact and allocate nothing.
+
+export interface Rect {
+  x: number
+  y: number
+  width: number
+  height: number
+}
+
+export interface Contact {
+  time: number // Fraction of the step at first contact, 0..1
+  normalX: number // Surface normal of the target at contact, -1 | 0 | 1
+  normalY: number
+}
+
+export const createContact = (): Contact => ({ time: 0, normalX: 0, normalY: 0 })
+
+// Broad phase: bounds of the whole sweep against the target
+export function sweptBoundsOverlap(box: Rect, dx: number, dy: number, target: Rect) {
+  const minX = dx < 0 ? box.x + dx : box.x
+  const maxX = (dx > 0 ? box.x + dx : box.x) + box.width
+  const minY = dy < 0 ? box.y + dy : box.y
+  const maxY = (dy > 0 ? box.y + dy : box.y) + box.height
+  return minX <= target.x + target.width && maxX >= target.x && minY <= target.y + target.height && maxY >= target.y
+}
+
+// Box moving by (dx, dy) against a static target. Returns true and fills
+// `out` when they touch during the step. Boxes that already overlap at the
+// start report time 0 and the normal of least penetration.
+export function sweepAABB(box: Rect, dx: number, dy: number, target: Rect, out: Contact) {
+  if (!sweptBoundsOverlap(box, dx, dy, target)) return false
+
+  const boxRight = box.x + box.width
+  const boxBottom = box.y + box.height
+  const targetRight = target.x + target.width
+  const targetBottom = target.y + target.height
+
+  if (box.x < targetRight && boxRight > target.x && box.y < targetBottom && boxBottom > target.y) {
+    const overlapLeft = boxRight - target.x
+    const overlapRight = targetRight - box.x
+    const overlapTop = boxBottom - target.y
+    const overlapBottom = targetBottom - box.y
+    const minOverlap = Math.min(overlapLeft, overlapRight, overlapTop, overlapBottom)
+    out.time = 0
+    out.normalX = minOverlap === overlapLeft ? -1 : minOverlap === overlapRight ? 1 : 0
+    out.normalY = out.normalX !== 0 ? 0 : minOverlap === overlapTop ? -1 : 1
+    return true
+  }
+
+  let entryX = -Infinity
+  let exitX = Infinity
+  if (dx > 0) {
+    entryX = (target.x - boxRight) / dx
+    exitX = (targetRight - box.x) / dx
+  } else if (dx < 0) {
+    entryX = (targetRight - box.x) / dx
+    exitX = (target.x - boxRight) / dx
+  } else if (box.x >= targetRight || boxRight <= target.x) {
+    return false
+  }
+
+  let entryY = -Infinity
+  let exitY = Infinity
+  if (dy > 0) {
+    entryY = (target.y - boxBottom) / dy
+    exitY = (targetBottom - box.y) / dy
+  } else if (dy < 0) {
+    entryY = (targetBottom - box.y) / dy
+    exitY = (target.y - boxBottom) / dy
+  } else if (box.y >= targetBottom || boxBottom <= target.y) {
+    return false
+  }
+
+  const entry = Math.max(entryX, entryY)
+  const exit = Math.min(exitX, exitY)
+  if (entry >= exit || entry < 0 || entry > 1) return false
+
+  out.time = entry
+  if (entryX > entryY) {
+    out.normalX = dx > 0 ? -1 : 1
+    out.normalY = 0
+  } else {
+    out.normalX = 0
+    out.normalY = dy > 0 ? -1 : 1
+  }
+  return true
+}
+
+// Overlap length of [a, a + aSize) and [b, b + bSize)
+function overlapLength(a: number, aSize: number, b: number, bSize: number) {
+  return Math.max(0, Math.min(a + aSize, b + bSize) - Math.max(a, b))
+}
+
+// Smallest u in [0, limit] with a*u^2 + b*u + c = 0, or -1
+function smallestRoot(a: number, b: number, c: number, limit: number) {
+  if (Math.abs(a) < 1e-12) {
+    if (Math.abs(b) < 1e-12) return -1
+    const u = -c / b
+    return u >= 0 && u <= limit ? u : -1
+  }
+  const disc = b * b - 4 * a * c
+  if (disc < 0) return -1
+  const sq = Math.sqrt(disc)
+  const r1 = (-b - sq) / (2 * a)
+  const r2 = (-b + sq) / (2 * a)
+  const lo = Math.min(r1, r2)
+  const hi = Math.max(r1, r2)
+  if (lo >= 0 && lo <= limit) return lo
+  if (hi >= 0 && hi <= limit) return hi
+  return -1
+}
+
+const breakpoints = new Float64Array(10)
+
+// Append the times in (0, 1) where an edge of [start, start + size) moving
+// by d crosses an edge of [targetStart, targetStart + targetSize)
+function addEdgeCrossings(count: number, start: number, size: number, targetStart: number, targetSize: number, d: number) {
+  if (d === 0) return count
+  const targetEnd = targetStart + targetSize
+  count = addCrossing(count, (targetStart - start - size) / d)
+  count = addCrossing(count, (targetStart - start) / d)
+  count = addCrossing(count, (targetEnd - start - size) / d)
+  return addCrossing(count, (targetEnd - start) / d)
+}
+
+function addCrossing(count: number, t: number) {
+  if (t > 0 && t < 1) breakpoints[count++] = t
+  return count
+}
+
+// Hazards (fires, drops) trigger once the overlap covers `fraction` of the
+// box's area. The overlap along a sweep is piecewise bilinear in time, so
+// the earliest such moment is found exactly between edge-crossing times.
+export function sweepOverlapFraction(
+  box: Rect,
+  dx: number,
+  dy: number,
+  target: Rect,
+  fraction: number,
+  out: Contact,
+) {
+  if (!sweepAABB(box, dx, dy, target, out)) return false
+  const needed = fraction * box.width * box.height
+
+  let count = 0
+  breakpoints[count++] = 0
+  breakpoints[count++] = 1
+  count = addEdgeCrossings(count, box.x, box.width, target.x, target.width, dx)
+  count = addEdgeCrossings(count, box.y, box.height, target.y, target.height, dy)
+  // Insertion sort (at most 10 entries)
+  for (let i = 1; i < count; i++) {
+    const t = breakpoints[i]
+    let j = i
+    while (j > 0 && breakpoints[j - 1] > t) {
+      breakpoints[j] = breakpoints[j - 1]
+      j--
+    }
+    breakpoints[j] = t
+  }
+
+  for (let i = 0; i < count; i++) {
+    const ta = breakpoints[i]
+    const wa = overlapLength(box.x + dx * ta, box.width, target.x, target.width)
+    const ha = overlapLength(box.y + dy * ta, box.height, target.y, target.height)
+    if (wa * ha >= needed) {
+      out.time = ta
+      return true
+    }
+    if (i + 1 === count) break
+
+    // Both overlap lengths are linear up to the next breakpoint
+    const tb = breakpoints[i + 1]
+    const span = tb - ta
+    if (span <= 0) continue
+    const wb = overlapLength(box.x + dx * tb, box.width, target.x, target.width)
+    const hb = overlapLength(box.y + dy * tb, box.height, target.y, target.height)
+    const kw = (wb - wa) / span
+    const kh = (hb - ha) / span
+    const u = smallestRoot(kw * kh, wa * kh + ha * kw, wa * ha - needed, span)
+    if (u >= 0) {
+      out.time = ta + u
+      return true
+    }
+  }
+  return false
+}
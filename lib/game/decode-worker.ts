@@ -0,0 +1,19 @@
+// Fetches raster sprites and decodes them into ImageBitmaps off the main thread.
+// SVG sources can't be decoded here (no DOM); the loader handles those itself.
+
+export type DecodeRequest = { id: string; url: string }
+export type DecodeResponse = { id: string; bitmap?: ImageBitmap; error?: string }
+
+const ctx = self as unknown as Worker
+
+ctx.onmessage = async (event: MessageEvent<DecodeRequest>) => {
+  const { id, url } = event.data
+  try {
+    const response = await fetch(url)
+    if (!response.ok) throw new Error(`${response.status} ${url}`)
+    const bitmap = await createImageBitmap(await response.blob())
+    ctx.postMessage({ id, bitmap } satisfies DecodeResponse, [bitmap])
+  } catch (error) {
+    ctx.postMessage({ id, error: String(error) } satisfies DecodeResponse)
+  }
+}
@@ -0,0 +1,1312 @@
+import { ChunkQueue } from "./chunk-queue"
+import { createContact, sweepAABB, sweepOverlapFraction, type Rect } from "./collision"
+import { SIM_STEP_MS } from "./fixed-step"
+import { PlacementGrid } from "./placement-grid"
+import {
+  OL,
+  OPENING_CLOUD_RECORD,
+  OPENING_COIN_RECORD,
+  OPENING_DROP,
+  OPENING_FIRE,
+  OPENING_LEVEL_VERSION,
+  OPENING_PLATFORM_RECORD,
+  OPENING_UP,
+  diffOpeningLevels,
+  getOpeningLevel,
+} from "./opening-level"
+import { ObjectPool } from "./pool"
+import { SpatialIndex } from "./spatial-index"
+import {
+  BOTTOM_BOUND,
+  CANVAS_W,
+  TOP_BOUND,
+  createCloud,
+  createCoin,
+  createCoinEffect,
+  createPlatform,
+  type Cloud,
+  type Coin,
+  type GameState,
+  type Platform,
+} from "./world"
+
+// The game simulation without React, DOM or wall-clock time: world
+// generation, physics, collisions, damage states and scoring. Time only
+// advances with step(), and everything the UI reacts to (score, lives,
+// sounds, game over) goes out through the event listener, so the same run
+// replays identically and can go headless far faster than real time.
+
+export const FRAME_MS = 1000 / 60 // Physics constants are tuned per 60 fps frame
+export const STEP_MULTIPLIER = SIM_STEP_MS / FRAME_MS // 0.5 at 120 Hz
+export const DEFAULT_SEED = 12345 // Fixed seed for consistent game generation
+
+const MAX_LIVES = 3
+const DEATH_DELAY_MS = 2000 // DEAD state shown before the game is over
+const NEAR_PLAYER_MARGIN = 64 // Collision query padding; far more than one step of movement
+const CHUNK_PLATFORMS = 12
+const CHUNK_CLOUDS = 12
+const CLOUD_CHUNK_W = CHUNK_CLOUDS * 130
+const DEFAULT_LOOKAHEAD_CHUNKS = 2
+// Platforms still ahead of the player when a chunk is needed; chunk
+// difficulty assumes this many fewer passed platforms than its first id
+const DIFFICULTY_LAG = 6
+
+export type EngineSound = "vortex" | "land" | "coin" | "flame" | "drop-hit" | "level-up"
+
+export type EngineEvent =
+  | { type: "score"; score: number }
+  | { type: "lives"; lives: number }
+  | { type: "level"; level: number }
+  | { type: "sound"; sound: EngineSound }
+  | { type: "game-over"; score: number }
+
+// Held buttons, sampled by the engine every step
+export interface EngineInput {
+  left: boolean
+  right: boolean
+  jump: boolean
+}
+
+export interface EngineOptions {
+  seed?: number
+  onEvent?: (event: EngineEvent) => void
+  lookaheadChunks?: number // Ready world chunks kept ahead of the player
+  bakedOpening?: boolean // Start DEFAULT_SEED runs from the build-time bake (default true)
+}
+
+// Seeded random number generator for consistent game generation
+export class SeededRandom {
+  private seed: number
+  constructor(seed: number) {
+    this.seed = seed
+  }
+  next(): number {
+    this.seed = (this.seed * 9301 + 49297) % 233280
+    return this.seed / 233280
+  }
+  // Position in the sequence, to resume a stream from a baked level
+  get state() {
+    return this.seed
+  }
+  set state(value: number) {
+    this.seed = value
+  }
+}
+
+// Scratch shapes for the collision sweeps
+const sweepBox: Rect = { x: 0, y: 0, width: 0, height: 0 }
+const targetRect: Rect = { x: 0, y: 0, width: 0, height: 0 }
+const contact = createContact()
+const firstContact = createContact()
+
+const isUncollected = (coin: Coin) => !coin.collected
+const byX = (a: { x: number }, b: { x: number }) => a.x - b.x
+
+type PlatformItems = { hasFire: boolean; hasDrop: boolean; dropDirection: 'up' | 'down' }
+
+// Fixed item placement pattern for platforms (repeating cycle of 25)
+// Pattern maintains: 20% flames, 44% drops, 36% nothing
+const PLATFORM_ITEMS: PlatformItems[] = [
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 1: nothing
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 2: nothing
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 3: nothing
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 4: drop (down)
+  { hasFire: false, hasDrop: true, dropDirection: 'up' },         // 5: drop (up)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 6: nothing
+  { hasFire: true, hasDrop: false, dropDirection: 'down' },       // 7: flame (down)
+  { hasFire: false, hasDrop: true, dropDirection: 'up' },         // 8: drop (up)
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 9: drop (down)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 10: nothing
+  { hasFire: false, hasDrop: true, dropDirection: 'up' },         // 11: drop (up)
+  { hasFire: true, hasDrop: false, dropDirection: 'down' },       // 12: flame (down)
+  { hasFire: true, hasDrop: false, dropDirection: 'down' },       // 13: flame (down)
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 14: drop (down)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 15: nothing
+  { hasFire: true, hasDrop: false, dropDirection: 'up' },         // 16: flame (up)
+  { hasFire: false, hasDrop: true, dropDirection: 'up' },         // 17: drop (up)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 18: nothing
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 19: drop (down)
+  { hasFire: false, hasDrop: true, dropDirection: 'up' },         // 20: drop (up)
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 21: drop (down)
+  { hasFire: true, hasDrop: false, dropDirection: 'up' },         // 22: flame (up)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 23: nothing
+  { hasFire: false, hasDrop: true, dropDirection: 'down' },       // 24: drop (down)
+  { hasFire: false, hasDrop: false, dropDirection: 'down' },      // 25: nothing
+]
+
+export function getPlatformItems(platformId: number) {
+  // Cycle through pattern for all platforms (1-based indexing)
+  return PLATFORM_ITEMS[(platformId - 1) % 25]
+}
+
+const noop = () => {}
+
+let openingLevelChecked = false
+
+// A stale bake would silently change the first levels: say so in development
+function checkOpeningLevel(level: Float64Array) {
+  if (openingLevelChecked) return
+  openingLevelChecked = true
+  const index = GameEngine.verifyOpeningLevel(level)
+  if (index >= 0) {
+    console.error(`Baked opening level differs from the generator at value ${index}; run python3 bake_opening_level.py`)
+  }
+}
+
+// Pre-generated world pieces (see chunk-queue.ts)
+interface PlatformChunk {
+  platforms: Platform[]
+  coins: Coin[]
+  endX: number // lastPlatformX once the chunk is in the world
+  nextId: number
+}
+
+interface CloudChunk {
+  clouds: Cloud[]
+}
+
+export class GameEngine {
+  state!: GameState
+  input: EngineInput = { left: false, right: false, jump: false }
+  aiMode = false
+  ended = false // Set once game-over has been emitted
+  tick = 0 // Steps taken since reset()
+  seed: number
+
+  private bakedOpening: boolean
+  private random: SeededRandom // Platforms and coins
+  private cloudRandom: SeededRandom // Own stream: cloud chunks are generated on their own schedule
+  private emit: (event: EngineEvent) => void
+  // Entity records recycled across chunks and games
+  private pools = {
+    platforms: new ObjectPool(createPlatform),
+    coins: new ObjectPool(createCoin),
+    clouds: new ObjectPool(createCloud),
+    coinEffects: new ObjectPool(createCoinEffect),
+  }
+  // Look-ahead world chunks and where the next ones start
+  private platformChunks: ChunkQueue<PlatformChunk>
+  private cloudChunks: ChunkQueue<CloudChunk>
+  private nextChunkX = 0
+  private nextChunkId = 0
+  private nextCloudX = 0
+  private coinCandidate = createCoin()
+  // Coins and the fire/drop of each platform of the batch being generated
+  private placement = new PlacementGrid()
+
+  constructor(options: EngineOptions = {}) {
+    this.seed = options.seed ?? DEFAULT_SEED
+    this.random = new SeededRandom(this.seed)
+    this.cloudRandom = new SeededRandom(this.seed + 1)
+    this.emit = options.onEvent ?? noop
+    this.bakedOpening = options.bakedOpening ?? true
+    const lookahead = options.lookaheadChunks ?? DEFAULT_LOOKAHEAD_CHUNKS
+    this.platformChunks = new ChunkQueue(
+      () => ({ platforms: [], coins: [], endX: 0, nextId: 0 }),
+      (chunk) => this.generatePlatformChunk(chunk),
+      lookahead,
+    )
+    this.cloudChunks = new ChunkQueue(() => ({ clouds: [] }), (chunk) => this.generateCloudChunk(chunk), lookahead)
+    this.reset()
+  }
+
+  // True while the look-ahead has room for more chunks
+  get needsPrefetch() {
+    return !this.ended && (!this.platformChunks.full || !this.cloudChunks.full)
+  }
+
+  // Generate look-ahead chunks while `hasTime()` (an idle deadline) allows.
+  // Returns whether the look-ahead still has room.
+  prefetch(hasTime: () => boolean) {
+    while (this.needsPrefetch && hasTime()) {
+      if (!this.platformChunks.prefetch()) this.cloudChunks.prefetch()
+    }
+    return this.needsPrefetch
+  }
+
+  // Next CHUNK_PLATFORMS platforms with their coins, continuing the last chunk
+  private generatePlatformChunk(chunk: PlatformChunk) {
+    const startId = this.nextChunkId
+    const platformsPassed = Math.max(0, startId - 1 - DIFFICULTY_LAG)
+    const platforms = this.generatePlatforms(this.nextChunkX, CHUNK_PLATFORMS, startId, platformsPassed, chunk.platforms)
+    this.generateCoinsForPlatforms(platforms, chunk.coins)
+    const tail = platforms[platforms.length - 1]
+    chunk.endX = tail.x + tail.width + 200
+    chunk.nextId = startId + platforms.length
+    this.nextChunkX = chunk.endX
+    this.nextChunkId = chunk.nextId
+  }
+
+  private generateCloudChunk(chunk: CloudChunk) {
+    this.generateClouds(this.nextCloudX, CHUNK_CLOUDS, chunk.clouds)
+    this.nextCloudX += CLOUD_CHUNK_W
+  }
+
+  // Generate clouds
+  private generateClouds(startX: number, count = 12, newClouds: Cloud[] = []) {
+    const random = this.cloudRandom
+    newClouds.length = 0
+    for (let i = 0; i < count; i++) {
+      // First cloud in each batch is type 3 (one per level), rest are 50/50 type 1 and 2
+      let cloudType: 1 | 2 | 3
+      if (i === 0) {
+        cloudType = 3 // First cloud is always CLOUD_3 (one per level)
+      } else {
+        cloudType = random.next() < 0.5 ? 1 : 2 // 50/50 split for the rest
+      }
+
+      let finalSize: number
+
+      if (cloudType === 3) {
+        // CLOUD_3 always has the same fixed size (10% bigger than base)
+        finalSize = 132
+      } else {
+        // Other clouds get random sizes
+        const baseScale = 1.6 + random.next() * 0.4
+        const bump = 1.2 + random.next() * 0.2 // +20% to +40%
+        let sizeMultiplier = baseScale * bump
+
+        // For CLOUD_2 only, randomly apply size variation: same (1.0), larger (1.3), or smaller (0.7)
+        if (cloudType === 2) {
+          const sizeVariations = [1.0, 1.3, 0.7]
+          const randomVariation = sizeVariations[Math.floor(random.next() * 3)]
+          sizeMultiplier *= randomVariation
+        }
+
+        // Use one base size and maintain aspect ratio (width:height = 1:1)
+        const baseSize = 60 + random.next() * 40 // Random base size 60-100
+        finalSize = baseSize * sizeMultiplier
+      }
+
+      const cloud = this.pools.clouds.acquire()
+      cloud.x = startX + i * (50 + random.next() * 80)
+      cloud.y = 20 + random.next() * 140
+      cloud.width = finalSize
+      cloud.height = finalSize // Maintain 1:1 aspect ratio (square)
+      cloud.opacity = 0.25 + random.next() * 0.4
+      cloud.type = cloudType
+      newClouds.push(cloud)
+    }
+    return newClouds
+  }
+
+  // Generate platforms (dynamic difficulty from the score so far)
+  private generatePlatforms(
+    startX: number,
+    count = 10,
+    startId = 1,
+    platformsPassed = 0,
+    newPlatforms: Platform[] = [],
+  ) {
+    const random = this.random
+    newPlatforms.length = 0
+    const runnerHeight = 33 // Character height (named "runner")
+    const minSpacing = runnerHeight * 2 // 66px
+    const platformHeight = 6
+
+    const currentScore = platformsPassed
+    const p = Math.min(1, currentScore / 600)
+    // Make level 2 easier by reducing horizontal spacing
+    const currentLevel = Math.floor(platformsPassed / 20) + 1
+    const level2Bonus = currentLevel === 2 ? 20 : 0 // Reduce spacing by 20px in level 2
+
+    let currentX = startX
+    for (let i = 0; i < count; i++) {
+      // Difficulty-scaled base width: larger early, smaller later
+      let baseWidth = 100 - 30 * p
+      // Early width bonus up to score 50: +20 at score 0, +10 at score 25, 0 at score 50
+      if (currentScore < 50) {
+        baseWidth += (50 - currentScore) * 0.4
+      }
+
+      // Choose a ratio in {1, 2, 3}
+      const r = random.next()
+      const ratio = r < 0.34 ? 1 : r < 0.67 ? 2 : 3
+
+      // Final width with gentle jitter and clamped bounds
+      const widthRaw = baseWidth * ratio
+      const width = Math.max(60, Math.min(300, widthRaw + (-6 + random.next() * 12)))
+
+      const numZones = Math.max(
+        1,
+        Math.floor((BOTTOM_BOUND - TOP_BOUND - platformHeight) / (platformHeight + minSpacing)),
+      )
+      const zoneHeight = (BOTTOM_BOUND - TOP_BOUND - platformHeight) / numZones
+      const zone = Math.floor(random.next() * numZones)
+      const yInZone = random.next() * Math.max(1, zoneHeight - platformHeight - minSpacing)
+      const platformY = TOP_BOUND + zone * zoneHeight + yInZone + minSpacing / 2
+
+      // Horizontal step keeps a bit of overlap and some randomness
+      // Special case: make platforms 25 and 26 closer together
+      const platformId = startId + i
+      const platform25_26Bonus = (platformId === 25 || platformId === 26) ? 30 : 0 // Reduce spacing by 30px for platforms 25 and 26
+
+      const overlapMin = 25 - 10 * p
+      const jitter = -5 + random.next() * 10
+      const step = Math.max(40, width - overlapMin + jitter - level2Bonus - platform25_26Bonus)
+
+      // Get fixed item placement for this platform
+      const platformItems = getPlatformItems(platformId)
+
+      const platform = this.pools.platforms.acquire()
+      platform.x = currentX
+      platform.y = Math.max(TOP_BOUND + 64, Math.min(platformY, BOTTOM_BOUND - platformHeight - 64))
+      platform.width = width
+      platform.height = platformHeight
+      platform.color = "#8B4513"
+      platform.passed = false
+      platform.hasFire = platformItems.hasFire
+      platform.hasDrop = platformItems.hasDrop
+      platform.dropDirection = platformItems.dropDirection
+      platform.id = platformId // Assign unique platform ID
+      newPlatforms.push(platform)
+
+      currentX += step
+    }
+
+    // ensure min vertical spacing across overlaps
+    newPlatforms.sort(byX)
+    for (let i = 1; i < newPlatforms.length; i++) {
+      const current = newPlatforms[i]
+      const previous = newPlatforms[i - 1]
+      const minVSpace = runnerHeight * 2 // Minimum vertical gap = 2x runner height (66px) - NEVER OVERRIDE
+      const pHeight = 8
+      const horizontalOverlap = !(current.x > previous.x + previous.width || previous.x > current.x + current.width)
+      if (horizontalOverlap) {
+        const verticalDistance = Math.abs(current.y - previous.y)
+        if (verticalDistance < minVSpace) {
+          if (current.y > previous.y) {
+            current.y = Math.min(previous.y + minVSpace, BOTTOM_BOUND - pHeight - 64)
+          } else {
+            current.y = Math.max(previous.y - minVSpace, TOP_BOUND + 64)
+          }
+        }
+      }
+    }
+
+    return newPlatforms
+  }
+
+  // Block coin spots on a platform's own flame and drop. A hazard only
+  // blocks coins proposed for the same platform.
+  private addHazards(platform: Platform) {
+    const owner = platform.id ?? 0
+    if (platform.hasFire) {
+      const fireWidth = 35
+      const fireHeight = 42
+      const centerX = platform.x + (platform.width - fireWidth) / 2
+      const fireY = platform.dropDirection === 'up' ? platform.y - fireHeight - 1 : platform.y + platform.height + 1
+      this.placement.insert(centerX, fireY, fireWidth, fireHeight, owner)
+    }
+    if (platform.hasDrop) {
+      const dropWidth = 42
+      const dropHeight = 42
+      const dropX = platform.x + platform.width - dropWidth - 5
+      const dropY = platform.dropDirection === 'up' ? platform.y - dropHeight - 1 : platform.y + platform.height + 1
+      this.placement.insert(dropX, dropY, dropWidth, dropHeight, owner)
+    }
+  }
+
+  // Check if coin overlaps with the batch's coins or the platform's flame or drop
+  private checkCoinCollision(newCoin: Coin, platform: Platform) {
+    return this.placement.overlaps(newCoin.x, newCoin.y, newCoin.width, newCoin.height, platform.id ?? 0)
+  }
+
+  // Accept a coin spot: it now blocks later candidates of the batch
+  private placeCoin(coin: Coin, coins: Coin[]) {
+    coins.push(coin)
+    this.placement.insert(coin.x, coin.y, coin.width, coin.height)
+  }
+
+  // Generate coins on platforms with collision avoidance
+  private generateCoinsForPlatforms(platforms: Platform[], coins: Coin[] = []) {
+    const random = this.random
+    coins.length = 0
+    const pool = this.pools.coins
+    this.placement.clear()
+    for (let i = 0; i < platforms.length; i++) this.addHazards(platforms[i])
+    const COIN_W = 26
+    const COIN_H = 26
+    const DROP_W = 42
+
+    platforms.forEach((platform) => {
+      // If platform has a drop, place 3 coins near the drop (more challenging)
+      if (platform.hasDrop && random.next() < 0.85) {
+        // Calculate drop position
+        const dropX = platform.x + platform.width - DROP_W - 5
+        const dropCenterX = dropX + DROP_W / 2
+
+        // Place 3 coins near the drop at half the distance (25-40px instead of 50-80px)
+        // Use specific horizontal positions, all aligned at same vertical position
+        const coinOffsets = [-40, -25, 30]  // Left, center-left, right from drop center
+
+        // Calculate Y position - consistent 8px gap from platform
+        let coinY
+        if (platform.dropDirection === 'up') {
+          // Drop is above, place coins above platform with 8px gap
+          coinY = platform.y - COIN_H - 8
+        } else {
+          // Drop is below, place coins below platform with 8px gap
+          coinY = platform.y + platform.height + 8
+        }
+
+        for (let coinIndex = 0; coinIndex < 3; coinIndex++) {
+          const offset = coinOffsets[coinIndex]
+          const coinX = dropCenterX + offset - COIN_W / 2
+
+          // Ensure coin stays within reasonable bounds
+          const finalX = Math.max(platform.x + 5, Math.min(coinX, platform.x + platform.width - COIN_W - 5))
+
+          const newCoin = pool.acquire()
+          newCoin.x = Math.round(finalX)
+          newCoin.y = Math.round(coinY)
+          newCoin.width = COIN_W
+          newCoin.height = COIN_H
+          newCoin.collected = false
+
+          // Skip collision check with other coins in this group, only check fire/drop
+          this.placeCoin(newCoin, coins)
+        }
+      }
+      // 78% chance to spawn a coin on each platform without fire/drop (60% * 1.3 = 78%)
+      else if (!platform.hasFire && !platform.hasDrop && random.next() < 0.78) {
+        let attempts = 0
+        let coinPlaced = false
+
+        // Try multiple positions to avoid collisions
+        while (attempts < 10 && !coinPlaced) {
+          const coinX = platform.x + platform.width / 2 - COIN_W / 2 + (random.next() - 0.5) * (platform.width * 0.6)
+          const coinY = platform.y - COIN_H - 8
+
+          // Ensure coin stays within platform bounds
+          const finalX = Math.max(platform.x + 5, Math.min(coinX, platform.x + platform.width - COIN_W - 5))
+
+          // Test a scratch candidate; only accepted spots take a pooled record
+          const newCoin = this.coinCandidate
+          newCoin.x = Math.round(finalX)
+          newCoin.y = Math.round(coinY)
+          newCoin.width = COIN_W
+          newCoin.height = COIN_H
+
+          if (!this.checkCoinCollision(newCoin, platform)) {
+            this.placeCoin(Object.assign(pool.acquire(), newCoin), coins)
+            coinPlaced = true
+          }
+          attempts++
+        }
+      }
+
+      // 30% chance to spawn a coin under the platform (only for safe platforms)
+      if (!platform.hasFire && !platform.hasDrop && random.next() < 0.3) {
+        let attempts = 0
+        let coinPlaced = false
+
+        // Try multiple positions to avoid collisions
+        while (attempts < 10 && !coinPlaced) {
+          const coinX = platform.x + platform.width / 2 - COIN_W / 2 + (random.next() - 0.5) * (platform.width * 0.6)
+          const coinY = platform.y + platform.height + 8 // Under the platform
+
+          // Ensure coin stays within platform bounds
+          const finalX = Math.max(platform.x + 5, Math.min(coinX, platform.x + platform.width - COIN_W - 5))
+
+          // Test a scratch candidate; only accepted spots take a pooled record
+          const newCoin = this.coinCandidate
+          newCoin.x = Math.round(finalX)
+          newCoin.y = Math.round(coinY)
+          newCoin.width = COIN_W
+          newCoin.height = COIN_H
+
+          if (!this.checkCoinCollision(newCoin, platform)) {
+            this.placeCoin(Object.assign(pool.acquire(), newCoin), coins)
+            coinPlaced = true
+          }
+          attempts++
+        }
+      }
+    })
+
+    return coins
+  }
+
+  // Extra coins spread across an opening platform: `count` coins at 1/(count+1)
+  // steps. Continues the batch of the last generateCoinsForPlatforms call.
+  private addOpeningCoins(platform: Platform, count: number, coins: Coin[]) {
+    const COIN_W = 26
+    const COIN_H = 26
+
+    for (let i = 0; i < count; i++) {
+      let attempts = 0
+      let coinPlaced = false
+
+      while (attempts < 10 && !coinPlaced) {
+        // Try different positions around the planned location
+        const baseX = platform.x + (i + 1) * (platform.width / (count + 1))
+        const coinX = baseX + (this.random.next() - 0.5) * 30 - COIN_W / 2 // Add some randomness
+        const coinY = platform.y - COIN_H - 8
+
+        // Ensure coin stays within platform bounds
+        const finalX = Math.max(platform.x + 5, Math.min(coinX, platform.x + platform.width - COIN_W - 5))
+
+        const newCoin = this.coinCandidate
+        newCoin.x = Math.round(finalX)
+        newCoin.y = Math.round(coinY)
+        newCoin.width = COIN_W
+        newCoin.height = COIN_H
+
+        if (!this.checkCoinCollision(newCoin, platform)) {
+          this.placeCoin(Object.assign(this.pools.coins.acquire(), newCoin), coins)
+          coinPlaced = true
+        }
+        attempts++
+      }
+    }
+  }
+
+  // The fixed opening platforms plus the first generated chunk, their coins
+  // and the first clouds. Also positions the streams and chunk cursors.
+  private generateOpeningLevel() {
+    const pickRatioWidth = () => {
+      const r = this.random.next()
+      const ratio = r < 0.34 ? 1 : r < 0.67 ? 2 : 3
+      const baseWidth = 100 // start wider; dynamic difficulty will shrink later
+      return Math.max(60, Math.min(300, baseWidth * ratio))
+    }
+
+    // Get fixed item placement for initial platforms
+    const platform2Items = getPlatformItems(2)
+    const platform3Items = getPlatformItems(3)
+    const platform4Items = getPlatformItems(4)
+    const platform5Items = getPlatformItems(5)
+
+    const platforms: Platform[] = [
+      // First bottom platform - positioned further left but not as far
+      { x: -100, y: 317, width: 267, height: 6, color: "#8B4513", passed: false, hasFire: false, hasDrop: false, dropDirection: 'down', id: 1 },
+      // First top platform - same length and aligned with bottom platform
+      { x: -100, y: 250, width: 267, height: 6, color: "#8B4513", passed: false, hasFire: false, hasDrop: false, dropDirection: 'down', id: 2 },
+      {
+        x: 200,
+        y: 100,
+        width: pickRatioWidth(),
+        height: 6,
+        color: "#8B4513",
+        passed: false,
+        hasFire: platform2Items.hasFire,
+        hasDrop: platform2Items.hasDrop,
+        dropDirection: platform2Items.dropDirection,
+        id: 3,
+      },
+      {
+        x: 330,
+        y: 240,
+        width: pickRatioWidth() * 1.4, // Make platform 4 40% longer
+        height: 6,
+        color: "#8B4513",
+        passed: false,
+        hasFire: platform3Items.hasFire,
+        hasDrop: platform3Items.hasDrop,
+        dropDirection: platform3Items.dropDirection,
+        id: 4,
+      },
+      {
+        x: 480,
+        y: 110,
+        width: pickRatioWidth(),
+        height: 6,
+        color: "#8B4513",
+        passed: false,
+        hasFire: platform4Items.hasFire,
+        hasDrop: platform4Items.hasDrop,
+        dropDirection: platform4Items.dropDirection,
+        id: 5,
+      },
+      {
+        x: 640,
+        y: 200,
+        width: pickRatioWidth(),
+        height: 6,
+        color: "#8B4513",
+        passed: false,
+        hasFire: platform5Items.hasFire,
+        hasDrop: platform5Items.hasDrop,
+        dropDirection: platform5Items.dropDirection,
+        id: 6,
+      },
+    ]
+
+    const coins = this.generateCoinsForPlatforms(platforms)
+
+    // Add 3 extra coins to platform 4 (index 4) and 5 to platform 3 (index 2)
+    this.addOpeningCoins(platforms[4], 3, coins)
+    this.addOpeningCoins(platforms[2], 5, coins)
+
+    const generatedPlatforms = this.generatePlatforms(800, 20, 7) // Start from ID 7
+    platforms.push(...generatedPlatforms)
+
+    // Generate coins for platforms 7-26
+    const additionalCoins = this.generateCoinsForPlatforms(generatedPlatforms)
+    coins.push(...additionalCoins)
+
+    // Manual placement tweaks:
+    // 1) Place platform 25 closer to platform 24 (horizontal only)
+    if (platforms.length >= 25) {
+      const p24 = platforms[23]
+      const p25 = platforms[24]
+      const closeGap = 10 // small horizontal gap
+      p25.x = p24.x + p24.width + closeGap
+    }
+
+    // 2) Place platform 13 further from platform 12 (both horizontal and vertical)
+    if (platforms.length >= 13) {
+      const p12 = platforms[11]
+      const p13 = platforms[12]
+
+      // Horizontal: ensure at least this much gap
+      const extraGapX = 60
+      p13.x = Math.max(p13.x, p12.x + p12.width + extraGapX)
+
+      // Vertical: move away from p12 by a bit, clamped to bounds
+      const extraGapY = 50
+      const minY = TOP_BOUND + 64
+      const maxY = BOTTOM_BOUND - 64
+      const targetY = p12.y < (TOP_BOUND + BOTTOM_BOUND) / 2 ? p12.y + extraGapY : p12.y - extraGapY
+      p13.y = Math.max(minY, Math.min(maxY, targetY))
+    }
+
+    const clouds = this.generateClouds(0, 20)
+
+    // The streamed world continues from the opening level
+    const lastPlatform = platforms[platforms.length - 1]
+    this.nextChunkX = lastPlatform.x + lastPlatform.width + 200
+    this.nextChunkId = 27 // Next platforms will start from 27
+    this.nextCloudX = 20 * 130
+
+    return { platforms, coins, clouds }
+  }
+
+  // Same result as generateOpeningLevel, copied from the build-time bake
+  private loadOpeningLevel(level: Float64Array) {
+    const pools = this.pools
+    this.random.state = level[OL.RANDOM_STATE]
+    this.cloudRandom.state = level[OL.CLOUD_RANDOM_STATE]
+    this.nextChunkX = level[OL.NEXT_CHUNK_X]
+    this.nextChunkId = level[OL.NEXT_CHUNK_ID]
+    this.nextCloudX = level[OL.NEXT_CLOUD_X]
+
+    let o = OL.HEADER
+    const platforms: Platform[] = []
+    for (let i = 0; i < level[OL.PLATFORMS]; i++, o += OPENING_PLATFORM_RECORD) {
+      const platform = pools.platforms.acquire()
+      const flags = level[o + 4]
+      platform.x = level[o]
+      platform.y = level[o + 1]
+      platform.width = level[o + 2]
+      platform.height = level[o + 3]
+      platform.color = "#8B4513"
+      platform.passed = false
+      platform.hasFire = (flags & OPENING_FIRE) !== 0
+      platform.hasDrop = (flags & OPENING_DROP) !== 0
+      platform.dropDirection = flags & OPENING_UP ? 'up' : 'down'
+      platform.id = level[o + 5]
+      platforms.push(platform)
+    }
+    const coins: Coin[] = []
+    for (let i = 0; i < level[OL.COINS]; i++, o += OPENING_COIN_RECORD) {
+      const coin = pools.coins.acquire()
+      coin.x = level[o]
+      coin.y = level[o + 1]
+      coin.width = level[o + 2]
+      coin.height = level[o + 3]
+      coin.collected = false
+      coins.push(coin)
+    }
+    const clouds: Cloud[] = []
+    for (let i = 0; i < level[OL.CLOUDS]; i++, o += OPENING_CLOUD_RECORD) {
+      const cloud = pools.clouds.acquire()
+      cloud.x = level[o]
+      cloud.y = level[o + 1]
+      cloud.width = level[o + 2]
+      cloud.height = level[o + 3]
+      cloud.opacity = level[o + 4]
+      cloud.type = level[o + 5] as Cloud["type"]
+      clouds.push(cloud)
+    }
+    return { platforms, coins, clouds }
+  }
+
+  // The freshly reset world in the bake layout (dev-time bake validation)
+  private encodeOpeningLevel() {
+    const st = this.state
+    const values = [
+      OPENING_LEVEL_VERSION,
+      this.seed,
+      this.random.state,
+      this.cloudRandom.state,
+      this.nextChunkX,
+      this.nextChunkId,
+      this.nextCloudX,
+      st.platforms.size,
+      st.coins.size,
+      st.clouds.size,
+    ]
+    st.platforms.forEach((platform) => {
+      const flags =
+        (platform.hasFire ? OPENING_FIRE : 0) |
+        (platform.hasDrop ? OPENING_DROP : 0) |
+        (platform.dropDirection === 'up' ? OPENING_UP : 0)
+      values.push(platform.x, platform.y, platform.width, platform.height, flags, platform.id ?? 0)
+    })
+    st.coins.forEach((coin) => values.push(coin.x, coin.y, coin.width, coin.height))
+    st.clouds.forEach((cloud) => values.push(cloud.x, cloud.y, cloud.width, cloud.height, cloud.opacity, cloud.type))
+    return Float64Array.from(values)
+  }
+
+  // Development builds: compare the bake with a live generation, once
+  static verifyOpeningLevel(level: Float64Array) {
+    const live = new GameEngine({ seed: level[OL.SEED], bakedOpening: false }).encodeOpeningLevel()
+    return diffOpeningLevels(level, live)
+  }
+
+  // Start a new run, from a different seed if given
+  reset(seed = this.seed) {
+    this.seed = seed
+    this.random = new SeededRandom(seed)
+    this.cloudRandom = new SeededRandom(seed + 1)
+    this.ended = false
+    this.tick = 0
+    this.input.left = this.input.right = this.input.jump = false
+
+    // Return the previous run's entities to the pools
+    const pools = this.pools
+    const previous = this.state
+    if (previous) {
+      previous.platforms.clear()
+      previous.coins.clear()
+      previous.clouds.clear()
+      previous.coinEffects.forEach((effect) => pools.coinEffects.release(effect))
+      previous.coinEffects.length = 0
+    }
+    // Chunks generated ahead for the previous run
+    this.platformChunks.clear((chunk) => {
+      chunk.platforms.forEach((platform) => pools.platforms.release(platform))
+      chunk.coins.forEach((coin) => pools.coins.release(coin))
+    })
+    this.cloudChunks.clear((chunk) => chunk.clouds.forEach((cloud) => pools.clouds.release(cloud)))
+
+    const baked = this.bakedOpening && seed === DEFAULT_SEED ? getOpeningLevel() : null
+    const { platforms, coins, clouds } = baked ? this.loadOpeningLevel(baked) : this.generateOpeningLevel()
+    if (baked && process.env.NODE_ENV !== "production") checkOpeningLevel(baked)
+
+    this.state = {
+      player: {
+        x: 20,
+        y: 273,
+        width: 44,
+        height: 44,
+        velocityX: 0,
+        velocityY: 0,
+        onGround: true,
+        wasOnGround: true, // Start as true to prevent landing sound on first frame
+        color: "#FF0000",
+      },
+      platforms: SpatialIndex.from(platforms, pools.platforms),
+      clouds: SpatialIndex.from(clouds, pools.clouds),
+      camera: { x: 0, y: 0 },
+
+      pullSpeed: 8.5, // Instant pull speed when flipping gravity
+      pullDirection: 1, // Start pulling down
+
+      // runtime
+      timeMs: 0,
+
+      gameSpeed: 2.5, // Start at 2.5 speed
+      score: 0,
+      lives: MAX_LIVES,
+      platformsPassed: 0,
+      lastPlatformX: this.nextChunkX,
+      nextPlatformId: this.nextChunkId,
+      lastCloudX: this.nextCloudX,
+      invulnerable: false,
+      invulnerableTime: 0,
+      fireStateStartTime: 0,
+      dropHitCount: 0,
+      isDead: false,
+      deadStartTime: 0,
+      level: 1,
+      lastLandTime: -Infinity,
+      checkpointFlag: undefined,
+
+      coins: SpatialIndex.from(coins, pools.coins),
+      coinEffects: [],
+      levelBoundaries: [],
+    }
+  }
+
+  // Flip helper (instant snap with natural curves). Returns false when dead.
+  flip() {
+    const st = this.state
+    if (this.ended || st.isDead) return false
+
+    // Instant gravity direction flip
+    st.pullDirection = -st.pullDirection // ±1 to ∓1
+    // Instantly set velocity to strong pull in new direction
+    st.player.velocityY = st.pullSpeed * st.pullDirection
+    this.emit({ type: "sound", sound: "vortex" })
+    return true
+  }
+
+  private addScore() {
+    this.state.score++
+    this.emit({ type: "score", score: this.state.score })
+  }
+
+  private end() {
+    this.ended = true
+    this.emit({ type: "game-over", score: this.state.score })
+  }
+
+  // Platform fire collision (30% overlap at any point of the step) - NOW GIVES LIFE
+  private checkFireCollision(box: Rect, dx: number, dy: number, platform: Platform) {
+    if (!platform.hasFire) return false
+    const fireWidth = 35 // 30% bigger (27 * 1.3)
+    const fireHeight = 42 // 30% bigger (32 * 1.3)
+
+    // Position fire based on direction
+    const centerX = platform.x + (platform.width - fireWidth) / 2
+    let fireY
+    if (platform.dropDirection === 'up') {
+      fireY = platform.y - fireHeight - 1
+    } else {
+      fireY = platform.y + platform.height + 1
+    }
+    targetRect.x = centerX
+    targetRect.y = fireY
+    targetRect.width = fireWidth
+    targetRect.height = fireHeight
+    if (sweepOverlapFraction(box, dx, dy, targetRect, 0.3, contact)) return true
+
+    // After score 150 and wide platform, add two side fires to increase difficulty
+    const currentScore = this.state.platformsPassed
+    if (currentScore > 150 && platform.width > 150) {
+      targetRect.x = platform.x + 10
+      if (sweepOverlapFraction(box, dx, dy, targetRect, 0.3, contact)) return true
+      targetRect.x = platform.x + platform.width - fireWidth - 10
+      if (sweepOverlapFraction(box, dx, dy, targetRect, 0.3, contact)) return true
+    }
+    return false
+  }
+
+  // Platform drop collision (30% overlap at any point of the step) - TAKES LIFE
+  private checkDropCollision(box: Rect, dx: number, dy: number, platform: Platform) {
+    if (!platform.hasDrop) return false
+    const dropWidth = 42
+    const dropHeight = 42
+
+    // Position drop based on direction
+    let dropX, dropY
+    if (platform.dropDirection === 'up') {
+      dropY = platform.y - dropHeight - 1
+      dropX = platform.x + platform.width - dropWidth - 5
+    } else {
+      dropY = platform.y + platform.height + 1
+      dropX = platform.x + platform.width - dropWidth - 5
+    }
+
+    targetRect.x = dropX
+    targetRect.y = dropY
+    targetRect.width = dropWidth
+    targetRect.height = dropHeight
+    return sweepOverlapFraction(box, dx, dy, targetRect, 0.3, contact)
+  }
+
+  // One simulation step of deltaMultiplier 60 fps frames. Returns false once
+  // the game has ended.
+  step(deltaMultiplier: number = STEP_MULTIPLIER) {
+    if (this.ended) return false
+    this.tick++
+
+    const st = this.state
+    const input = this.input
+    const { player, platforms, clouds, camera } = st
+    st.timeMs += deltaMultiplier * FRAME_MS
+
+    // Show the DEAD state for a while, then end the game
+    if (st.isDead && st.timeMs - st.deadStartTime >= DEATH_DELAY_MS) {
+      this.end()
+      return false
+    }
+
+    // Level-based speed progression
+    const currentLevel = Math.floor(st.platformsPassed / 20) + 1
+
+    // Level-based speed progression - consistent speed per level, 30% increase each level
+    const baseSpeed = 2.5
+    const speedMultiplier = Math.pow(1.3, currentLevel - 1) // 30% increase per level
+    const targetSpeed = baseSpeed * speedMultiplier
+    st.gameSpeed = targetSpeed
+
+    // Update level when crossing platform 20 boundaries
+    if (currentLevel !== st.level) {
+      st.level = currentLevel
+      this.emit({ type: "level", level: currentLevel })
+      this.emit({ type: "sound", sound: "level-up" })
+    }
+
+    // Add level boundary markers when platforms are generated
+    // Check if we need to add a boundary marker for upcoming level transitions
+    const nextLevelPlatform = Math.floor((st.platformsPassed + 1) / 20) * 20 // Next multiple of 20
+    const platformsAhead = nextLevelPlatform - st.platformsPassed
+
+    // If we're close to a level transition and haven't marked it yet
+    if (platformsAhead <= 15 && platformsAhead > 0) {
+      const nextLevel = Math.floor(nextLevelPlatform / 20) + 1
+      const boundaryX = player.x + platformsAhead * 150 // Approximate distance ahead
+
+      // Check if we already have a boundary for this level
+      let existingBoundary = false
+      for (let i = 0; i < st.levelBoundaries.length; i++) {
+        if (st.levelBoundaries[i].level === nextLevel) existingBoundary = true
+      }
+      if (!existingBoundary) {
+        st.levelBoundaries.push({ x: boundaryX, level: nextLevel })
+        st.levelBoundaries.sort(byX) // Kept sorted for eviction and background segments
+      }
+    }
+
+    // Invulnerability timeout
+    if (st.invulnerable && st.timeMs > st.invulnerableTime) {
+      st.invulnerable = false
+    }
+
+    // Stream in more platforms (with their coins) from the look-ahead
+    if (player.x > st.lastPlatformX - 800) {
+      const chunk = this.platformChunks.pop()
+      platforms.pushAll(chunk.platforms)
+      st.coins.pushAll(chunk.coins)
+      st.lastPlatformX = chunk.endX
+      st.nextPlatformId = chunk.nextId
+    }
+
+    // Stream in more clouds
+    if (player.x > st.lastCloudX - 800) {
+      clouds.pushAll(this.cloudChunks.pop().clouds)
+      st.lastCloudX += CLOUD_CHUNK_W
+    }
+
+    // Remove old items (evicted records go back to the pools)
+    platforms.evictBefore(camera.x - 400)
+    clouds.evictBefore(camera.x - 400)
+    st.coins.evictBefore(camera.x - 100)
+    // Remove old level boundaries
+    while (st.levelBoundaries.length > 0 && st.levelBoundaries[0].x <= camera.x - 200) {
+      st.levelBoundaries.shift()
+    }
+
+    // Move clouds
+    clouds.translate(st.gameSpeed * 0.5 * deltaMultiplier)
+
+    // AI Mode: Simple and effective gameplay logic
+    if (this.aiMode && !st.isDead && player.onGround) {
+      // Find the closest platform ahead
+      const ahead = platforms.upperBound(player.x + 20)
+      const nextPlatform =
+        ahead < platforms.size && platforms.get(ahead).x < player.x + 400 ? platforms.get(ahead) : undefined
+
+      if (nextPlatform) {
+        const playerCenterY = player.y + player.height / 2
+        const platformCenterY = nextPlatform.y + nextPlatform.height / 2
+
+        // Simple rule: if platform is far from current position, flip
+        const verticalDistance = Math.abs(playerCenterY - platformCenterY)
+        const needsFlip = verticalDistance > 80 // Platform is significantly off
+
+        if (needsFlip) {
+          // Check direction: should we flip?
+          // Gravity down: flip if platform is above us; gravity up: flip if platform is below us
+          if (st.pullDirection > 0 ? platformCenterY < playerCenterY - 40 : platformCenterY > playerCenterY + 40) {
+            this.flip()
+          }
+        }
+      }
+    }
+
+    // Horizontal input (disabled in AI mode)
+    if (!this.aiMode) {
+      if (input.left) {
+        player.velocityX = Math.max(player.velocityX - 0.2 * deltaMultiplier, -2.4)
+      } else if (input.right) {
+        player.velocityX = Math.min(player.velocityX + 0.2 * deltaMultiplier, 3.2)
+      } else {
+        player.velocityX *= Math.pow(0.82, deltaMultiplier)
+      }
+    } else {
+      // AI mode: minimal horizontal movement
+      player.velocityX *= Math.pow(0.82, deltaMultiplier)
+    }
+
+    // Jump (opposite of gravity direction)
+    if (input.jump && player.onGround) {
+      player.velocityY = st.pullDirection > 0 ? -5 : 5
+      player.onGround = false
+    }
+
+    // Dead state: fall through platforms off-screen
+    if (st.isDead) {
+      // Keep horizontal position fixed (no auto-scroll)
+      player.velocityX = 0
+
+      // Fast fall: constant downward movement to fall off-screen
+      player.velocityY = 7 // Fast constant fall downward
+    } else {
+      // Hybrid pull gravity: strong base pull + accumulating acceleration
+      if (!player.onGround) {
+        // If just left ground, start with strong pull velocity
+        if (player.wasOnGround) {
+          player.velocityY = st.pullSpeed * st.pullDirection
+        }
+        // Add acceleration each frame (Reduced gravity: 0.50)
+        player.velocityY += 0.50 * st.pullDirection * deltaMultiplier
+      } else {
+        player.velocityY = 0 // Locked to platform when grounded
+      }
+    }
+
+    // Position (auto-scroll included so the collision sweep covers the whole
+    // step; paused when dead to show DEAD state)
+    const fromX = player.x
+    const fromY = player.y
+    player.x += player.velocityX * deltaMultiplier + (st.isDead ? 0 : st.gameSpeed * deltaMultiplier)
+    player.y += player.velocityY * deltaMultiplier
+    const stepX = player.x - fromX
+    const stepY = player.y - fromY
+    sweepBox.x = fromX
+    sweepBox.y = fromY
+    sweepBox.width = player.width
+    sweepBox.height = player.height
+
+    // Platform collisions and scoring (skip when dead)
+    if (!st.isDead) {
+      player.wasOnGround = player.onGround
+      player.onGround = false
+    }
+
+    // Only platforms near the player's sweep can touch it (or be passed) this step
+    const endPlatform = platforms.lowerBound(Math.max(fromX, player.x) + player.width + NEAR_PLAYER_MARGIN)
+    const firstPlatform = platforms.rangeStart(Math.min(fromX, player.x) - NEAR_PLAYER_MARGIN)
+    for (let i = firstPlatform; i < endPlatform && !st.isDead; i++) {
+      const platform = platforms.get(i)
+      // ============================================================================
+      // FLAME COLLISION - Heals 1 damage state + gives 1 life
+      // ============================================================================
+      // State progression (reverse): Dead → State 3 → State 2 → State 1 (Idle)
+      // Each flame touch moves back ONE state and adds 1 life (max 3)
+      // ============================================================================
+      if (this.checkFireCollision(sweepBox, stepX, stepY, platform)) {
+        st.lives = Math.min(st.lives + 1, MAX_LIVES) // Add 1 life (max 3)
+        this.emit({ type: "lives", lives: st.lives })
+        this.emit({ type: "sound", sound: "flame" })
+        st.fireStateStartTime = st.timeMs // Fire visual effect for 1.8s
+
+        // Cancel invulnerability when touching flame
+        st.invulnerable = false
+        st.invulnerableTime = 0
+
+        // FLAME HEALS: Reduce drop damage by 1 state
+        st.dropHitCount = Math.max(0, st.dropHitCount - 1)
+
+        // Mark flame as collected
+        platform.hasFire = false
+      }
+
+      // ============================================================================
+      // DROP COLLISION - Damages 1 state + removes 1 life
+      // ============================================================================
+      // State progression: Idle → State 2 → State 3 → Dead
+      // Each drop increments damage state (no time window)
+      // States persist until changed by flame healing
+      // ============================================================================
+      if (!st.invulnerable && this.checkDropCollision(sweepBox, stepX, stepY, platform)) {
+        this.emit({ type: "sound", sound: "drop-hit" })
+        st.lives--
+        this.emit({ type: "lives", lives: st.lives })
+        st.fireStateStartTime = 0 // Cancel fire visual effect
+
+        // Simple increment: each drop = +1 damage state (no time window)
+        st.dropHitCount++
+
+        // Mark drop as collected IMMEDIATELY (before any early returns)
+        platform.hasDrop = false
+
+        // 3rd drop or out of lives: DEAD state, game over after DEATH_DELAY_MS
+        if (st.dropHitCount >= 3 || st.lives <= 0) {
+          st.isDead = true
+          st.deadStartTime = st.timeMs
+          return true
+        }
+
+        // Normal drop hit: 1 second invulnerability
+        st.invulnerable = true
+        st.invulnerableTime = st.timeMs + 1000
+      }
+    }
+
+    // Solid platforms: resolve the earliest swept contact, then slide along
+    // it for the rest of the step
+    let moveX = stepX
+    let moveY = stepY
+    for (let pass = 0; pass < 2 && !st.isDead; pass++) {
+      let hitPlatform: Platform | null = null
+      for (let i = firstPlatform; i < endPlatform; i++) {
+        const platform = platforms.get(i)
+        // Platform rect with tiny pavements
+        targetRect.x = platform.x
+        targetRect.y = platform.y - 1
+        targetRect.width = platform.width
+        targetRect.height = platform.height + 2
+        if (!sweepAABB(sweepBox, moveX, moveY, targetRect, contact)) continue
+
+        // Surfaces only stop the player when moving into them
+        const blocks =
+          (contact.normalY < 0 && player.velocityY > 0) ||
+          (contact.normalY > 0 && player.velocityY < 0) ||
+          (contact.normalX < 0 && player.velocityX > 0) ||
+          (contact.normalX > 0 && player.velocityX < 0)
+        if (blocks && (!hitPlatform || contact.time < firstContact.time)) {
+          hitPlatform = platform
+          firstContact.time = contact.time
+          firstContact.normalX = contact.normalX
+          firstContact.normalY = contact.normalY
+        }
+      }
+      if (!hitPlatform) break
+
+      const platformTop = hitPlatform.y - 1
+      const platformBottom = hitPlatform.y + hitPlatform.height + 1
+      const t = firstContact.time
+      if (firstContact.normalY !== 0) {
+        player.y = firstContact.normalY < 0 ? platformTop - player.height : platformBottom
+        player.velocityY = 0
+        // Landing means touching the surface that faces against gravity
+        const landed = st.pullDirection > 0 ? firstContact.normalY < 0 : firstContact.normalY > 0
+        if (landed) {
+          // Only play landing sound when falling onto platform (not walking),
+          // at most once per 200ms
+          if (!player.wasOnGround && st.timeMs - st.lastLandTime > 200) {
+            this.emit({ type: "sound", sound: "land" })
+            st.lastLandTime = st.timeMs
+          }
+          player.onGround = true
+        }
+        // Continue horizontally from the contact point
+        sweepBox.x += moveX * t
+        sweepBox.y = player.y
+        moveX *= 1 - t
+        moveY = 0
+      } else {
+        if (firstContact.normalX < 0) {
+          player.x = hitPlatform.x - player.width
+          player.velocityX = Math.max(player.velocityX * 0.5, 0)
+        } else {
+          player.x = hitPlatform.x + hitPlatform.width
+          player.velocityX = Math.min(player.velocityX * 0.5, 0)
+        }
+        // Continue vertically from the contact point
+        sweepBox.x = player.x
+        sweepBox.y += moveY * t
+        moveX = 0
+        moveY *= 1 - t
+      }
+    }
+
+    for (let i = firstPlatform; i < endPlatform && !st.isDead; i++) {
+      const platform = platforms.get(i)
+      // Score when passing platform
+      if (!platform.passed && player.x > platform.x + platform.width) {
+        platform.passed = true
+        st.platformsPassed++
+        this.addScore()
+      }
+    }
+
+    // Coin pickups
+    let coinCollected = false
+    // Sweep the whole step, start to resolved end, so fast moves can't skip a coin
+    sweepBox.x = fromX
+    sweepBox.y = fromY
+    const coinStepX = player.x - fromX
+    const coinStepY = player.y - fromY
+    const endCoin = st.coins.lowerBound(Math.max(fromX, player.x) + player.width)
+    for (let i = st.coins.rangeStart(Math.min(fromX, player.x)); i < endCoin && !st.isDead; i++) {
+      const coin = st.coins.get(i)
+      if (coin.collected) continue
+      if (sweepAABB(sweepBox, coinStepX, coinStepY, coin, contact)) {
+        coin.collected = true
+        coinCollected = true
+        this.addScore()
+        this.emit({ type: "sound", sound: "coin" })
+
+        // Add coin effect animation
+        const effect = this.pools.coinEffects.acquire()
+        effect.x = effect.startX = coin.x + coin.width / 2
+        effect.y = effect.startY = coin.y + coin.height / 2
+        effect.startTime = st.timeMs
+        effect.duration = 800 // 800ms animation
+        st.coinEffects.push(effect)
+      }
+    }
+    // Collected coins leave the buffer (in place; records are recycled)
+    if (coinCollected) st.coins.compact(isUncollected)
+
+    // Update coin effects, compacting finished ones out in place
+    const effects = st.coinEffects
+    let liveEffects = 0
+    for (let i = 0; i < effects.length; i++) {
+      const effect = effects[i]
+      const elapsed = st.timeMs - effect.startTime
+      if (elapsed >= effect.duration) {
+        this.pools.coinEffects.release(effect)
+        continue
+      }
+
+      const progress = elapsed / effect.duration
+      const easeOut = 1 - Math.pow(1 - progress, 3) // cubic ease-out
+
+      // Move towards top-right corner of the score area (approximate screen position)
+      const targetX = camera.x + CANVAS_W - 50 // near score area
+      const targetY = camera.y - 30 // above the game area
+
+      effect.x = effect.startX + (targetX - effect.startX) * easeOut
+      effect.y = effect.startY + (targetY - effect.startY) * easeOut
+      effects[liveEffects++] = effect
+    }
+    effects.length = liveEffects
+
+    // Checkpoint
+    if (st.checkpointFlag && !st.checkpointFlag.passed) {
+      const flag = st.checkpointFlag
+      if (player.x > flag.x + flag.width) {
+        flag.passed = true
+        st.level = 2
+        this.emit({ type: "level", level: 2 })
+        st.gameSpeed += 0.3
+      }
+    }
+
+    // World bounds: game over once 60% is outside (skip if in DEAD state)
+    if (!st.isDead) {
+      const overTop = Math.max(0, TOP_BOUND - player.y)
+      const overBottom = Math.max(0, player.y + player.height - BOTTOM_BOUND)
+      const outside = Math.max(overTop, overBottom)
+      const outsideFraction = outside / player.height
+
+      if (outsideFraction >= 0.6) {
+        this.end()
+        return false
+      }
+    }
+
+    // Camera (auto-scroll is applied with the player's position above)
+    st.camera.x = player.x - CANVAS_W / 3
+    st.camera.y = 0
+    return true
+  }
+}
@@ -0,0 +1,53 @@
+// Fixed-timestep simulation clock. Frame time is accumulated and drained in
+// constant steps, so physics behaves the same at 60, 120 or 144 Hz and a long
+// frame (tab switch, GC pause) can't move the player through a 6 px platform
+// in one update. Rendering interpolates between the last two steps with
+// `alpha`.
+
+export const SIM_HZ = 120
+export const SIM_STEP_MS = 1000 / SIM_HZ
+
+// Most steps run for one frame; anything beyond is dropped (the game slows
+// down instead of spiralling when the device can't keep up)
+export const MAX_CATCH_UP_STEPS = 8
+
+export class FixedStepper {
+  private accumulator = 0
+  private lastTime = 0
+  private steps = 0
+  alpha = 0
+
+  reset(timeMs: number) {
+    this.lastTime = timeMs
+    this.accumulator = 0
+    this.steps = 0
+    this.alpha = 0
+  }
+
+  // Number of simulation steps to run for a frame at `timeMs`
+  advance(timeMs: number) {
+    this.accumulator += Math.max(0, timeMs - this.lastTime)
+    this.lastTime = timeMs
+
+    let steps = Math.floor(this.accumulator / SIM_STEP_MS)
+    if (steps > MAX_CATCH_UP_STEPS) {
+      steps = MAX_CATCH_UP_STEPS
+      this.accumulator = 0
+    } else {
+      this.accumulator -= steps * SIM_STEP_MS
+    }
+    this.alpha = this.accumulator / SIM_STEP_MS
+    this.steps = steps
+    return steps
+  }
+
+  // Simulated time (on the advance() clock) at the end of step `i` of the
+  // last advance(); input timestamped up to then is applied before step `i`
+  stepEnd(i: number) {
+    return this.lastTime - this.accumulator - (this.steps - 1 - i) * SIM_STEP_MS
+  }
+}
+
+export function lerp(from: number, to: number, alpha: number) {
+  return from + (to - from) * alpha
+}
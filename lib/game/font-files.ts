@@ -0,0 +1,7 @@
+// Generated by build_fonts.py - do not edit by hand
+
+// Self-hosted subset fonts in public/fonts/ (app/fonts.css)
+export const FONT_FILES: { family: string; weight: string; url: string }[] = []
+
+// Hosted stylesheet for the families not built yet (null once all are)
+export const FONT_STYLESHEET: string | null = "https://fonts.googleapis.com/css2?family=Rethink+Sans:wght@400..700&family=Instrument+Sans:wght@500..600&display=swap"
@@ -0,0 +1,152 @@
+import { LayerCache, rasterize, type Layer, type LayerContext } from "./layer-cache"
+
+// Pre-rasterized glyphs for text drawn every frame. Each character is
+// rendered once into a cell of a single atlas image; a string is then a
+// row of drawImage blits with no font switching or text shaping. Glyphs
+// advance by their measured width, so there is no kerning: use it for
+// short labels, not prose. Labels drawn over and over (LEVEL n, +1) can
+// go through drawString, which caches each whole string as one layer.
+
+export interface GlyphStyle {
+  font: string // Canvas font shorthand, e.g. "bold 18px Rethink Sans, sans-serif"
+  size: number // Font size in CSS px, sizes the atlas cells
+  fill: string
+  stroke?: string // Outline drawn under the fill
+  lineWidth?: number
+}
+
+export class GlyphAtlas {
+  readonly cellHeight: number
+  private cellWidth: number
+  private pad: number
+  private image: Layer | null = null
+  private slots = new Int16Array(128).fill(-1) // Char code -> cell index
+  private advances: Float32Array
+  private strings: LayerCache<string>
+
+  constructor(
+    private pixelRatio: number,
+    private chars: string,
+    private style: GlyphStyle,
+  ) {
+    this.pad = Math.ceil(style.size * 0.1 + (style.stroke ? (style.lineWidth ?? 1) : 0))
+    this.cellWidth = Math.ceil(style.size * 1.2) + this.pad * 2
+    this.cellHeight = Math.ceil(style.size * 1.4)
+    this.advances = new Float32Array(chars.length)
+    for (let i = 0; i < chars.length; i++) this.slots[chars.charCodeAt(i)] = i
+    this.strings = new LayerCache(pixelRatio, 32)
+  }
+
+  // Rasterize the atlas now (after the web font loaded) instead of on first use
+  prepare() {
+    this.build()
+  }
+
+  // Width of `text` in CSS px; characters missing from the atlas count as 0
+  measure(text: string) {
+    this.build()
+    let width = 0
+    for (let i = 0; i < text.length; i++) {
+      const slot = this.slotOf(text.charCodeAt(i))
+      if (slot >= 0) width += this.advances[slot]
+    }
+    return width
+  }
+
+  // Width of a non-negative integer's digits, without building its string
+  measureInt(value: number) {
+    this.build()
+    let width = 0
+    for (let rest = Math.floor(value); ; rest = Math.floor(rest / 10)) {
+      const slot = this.slotOf(48 + (rest % 10)) // "0".charCodeAt(0) === 48
+      if (slot >= 0) width += this.advances[slot]
+      if (rest < 10) return width
+    }
+  }
+
+  // Draw `text` with its left edge at x and its vertical center at y,
+  // optionally scaled (same glyphs at another size)
+  draw(ctx: LayerContext, text: string, x: number, y: number, scale = 1) {
+    const image = this.build()
+    const top = y - (this.cellHeight * scale) / 2
+    let penX = x
+    for (let i = 0; i < text.length; i++) {
+      penX = this.blit(ctx, image, this.slotOf(text.charCodeAt(i)), penX, top, scale)
+    }
+  }
+
+  // Like draw, for a non-negative integer without building its string
+  drawInt(ctx: LayerContext, value: number, x: number, y: number) {
+    const image = this.build()
+    const top = y - this.cellHeight / 2
+    const n = Math.floor(value)
+    let divisor = 1
+    while (divisor * 10 <= n) divisor *= 10
+    let penX = x
+    for (; divisor >= 1; divisor /= 10) {
+      penX = this.blit(ctx, image, this.slotOf(48 + (Math.floor(n / divisor) % 10)), penX, top, 1)
+    }
+  }
+
+  // Like draw, but blits `text` from a per-string cached layer
+  drawString(ctx: LayerContext, text: string, x: number, y: number, align: "left" | "center" = "left") {
+    const { pad, cellHeight } = this
+    const width = this.measure(text)
+    const layerWidth = Math.ceil(width) + pad * 2
+    const layer =
+      this.strings.get(text) ??
+      this.strings.render(text, layerWidth, cellHeight, (layerCtx) => this.draw(layerCtx, text, pad, cellHeight / 2))
+    const left = align === "center" ? x - width / 2 : x
+    ctx.drawImage(layer, left - pad, y - cellHeight / 2, layerWidth, cellHeight)
+  }
+
+  // Drop the atlas (the font changed); it is rebuilt on the next draw
+  clear() {
+    if (this.image && "close" in this.image) this.image.close()
+    this.image = null
+    this.strings.clear()
+  }
+
+  // One glyph cell at penX; returns the pen position after it
+  private blit(ctx: LayerContext, image: Layer, slot: number, penX: number, top: number, scale: number) {
+    if (slot < 0) return penX
+    const { cellWidth, cellHeight, pad, pixelRatio } = this
+    ctx.drawImage(
+      image,
+      slot * cellWidth * pixelRatio,
+      0,
+      cellWidth * pixelRatio,
+      cellHeight * pixelRatio,
+      penX - pad * scale,
+      top,
+      cellWidth * scale,
+      cellHeight * scale,
+    )
+    return penX + this.advances[slot] * scale
+  }
+
+  private slotOf(code: number) {
+    return code < 128 ? this.slots[code] : -1
+  }
+
+  private build() {
+    if (this.image) return this.image
+    const { chars, cellWidth, cellHeight, pad, style, advances } = this
+    this.image = rasterize(cellWidth * chars.length, cellHeight, this.pixelRatio, (ctx) => {
+      ctx.font = style.font
+      ctx.fillStyle = style.fill
+      ctx.textBaseline = "middle"
+      if (style.stroke) {
+        ctx.strokeStyle = style.stroke
+        ctx.lineWidth = style.lineWidth ?? 1
+        ctx.lineJoin = "round"
+      }
+      for (let i = 0; i < chars.length; i++) {
+        advances[i] = ctx.measureText(chars[i]).width
+        if (style.stroke) ctx.strokeText(chars[i], i * cellWidth + pad, cellHeight / 2)
+        ctx.fillText(chars[i], i * cellWidth + pad, cellHeight / 2)
+      }
+    })
+    return this.image
+  }
+}
@@ -0,0 +1,88 @@
+import type { GameEngine } from "./engine"
+import { INPUT_JUMP, INPUT_LEFT, INPUT_RIGHT, type ReplayRecorder } from "./replay"
+
+// Timestamped input between the DOM and the fixed-step simulation. Event
+// handlers only enqueue; the game loop drains the queue before each step,
+// and an event lands on the first step whose simulated time reaches the
+// event's timestamp. Flips therefore always happen between steps, at the
+// tick the recorder writes down, instead of in the middle of a frame.
+
+const FLIP = -1 // Event marker; other events carry the held buttons after a change
+
+// Timestamp of a DOM event on the performance.now() clock (the clock of
+// requestAnimationFrame); very old engines report epoch milliseconds
+export function eventTimeMs(event: Event) {
+  const now = performance.now()
+  return event.timeStamp > 0 && event.timeStamp <= now ? event.timeStamp : now
+}
+
+export class InputQueue {
+  private times = new Float64Array(64)
+  private events = new Int8Array(64)
+  private head = 0
+  private size = 0
+  private lastHeld = 0 // Held buttons after the newest queued event
+  held = 0 // INPUT_LEFT | INPUT_RIGHT | INPUT_JUMP as of the last drained event
+
+  // Held buttons changed at `timeMs` (repeats of the same state are dropped)
+  pushHeld(left: boolean, right: boolean, jump: boolean, timeMs: number) {
+    const bits = (left ? INPUT_LEFT : 0) | (right ? INPUT_RIGHT : 0) | (jump ? INPUT_JUMP : 0)
+    if (bits === this.lastHeld) return
+    this.lastHeld = bits
+    this.push(bits, timeMs)
+  }
+
+  pushFlip(timeMs: number) {
+    this.push(FLIP, timeMs)
+  }
+
+  // Apply the events due by `untilMs` before the engine's next step: held
+  // buttons first, then flips, each recorded at the engine's current tick
+  apply(engine: GameEngine, untilMs: number, recorder: ReplayRecorder | null) {
+    const { times, events } = this
+    let flips = 0
+    while (this.size > 0 && times[this.head] <= untilMs) {
+      const event = events[this.head]
+      if (event === FLIP) flips++
+      else this.held = event
+      this.head = (this.head + 1) % times.length
+      this.size--
+    }
+    const input = engine.input
+    input.left = (this.held & INPUT_LEFT) !== 0
+    input.right = (this.held & INPUT_RIGHT) !== 0
+    input.jump = (this.held & INPUT_JUMP) !== 0
+    recorder?.capture(engine.tick, input)
+    for (; flips > 0; flips--) {
+      if (engine.flip()) recorder?.flip(engine.tick)
+    }
+  }
+
+  // Drop pending flips (a run starting or ending); held buttons carry over
+  clear() {
+    this.held = this.lastHeld
+    this.head = 0
+    this.size = 0
+  }
+
+  private push(event: number, timeMs: number) {
+    if (this.size === this.times.length) this.grow()
+    const slot = (this.head + this.size) % this.times.length
+    this.times[slot] = timeMs
+    this.events[slot] = event
+    this.size++
+  }
+
+  private grow() {
+    const times = new Float64Array(this.times.length * 2)
+    const events = new Int8Array(this.events.length * 2)
+    for (let i = 0; i < this.size; i++) {
+      const slot = (this.head + i) % this.times.length
+      times[i] = this.times[slot]
+      events[i] = this.events[slot]
+    }
+    this.times = times
+    this.events = events
+    this.head = 0
+  }
+}
@@ -0,0 +1,72 @@
+// Pre-rendered canvas layers. Anything drawn with gradients, paths or text
+// that looks the same every frame (a platform of a given width, a level
+// boundary label) is rasterized once at the canvas pixel ratio and then
+// blitted with a single drawImage. Least recently used layers are dropped
+// once the cache is full.
+
+export type Layer = ImageBitmap | HTMLCanvasElement
+
+export type LayerContext = OffscreenCanvasRenderingContext2D | CanvasRenderingContext2D
+
+// Draw into a fresh width x height (CSS px) canvas at `pixelRatio`
+export function rasterize(
+  width: number,
+  height: number,
+  pixelRatio: number,
+  draw: (ctx: LayerContext) => void,
+): Layer {
+  const pixelWidth = Math.max(1, Math.ceil(width * pixelRatio))
+  const pixelHeight = Math.max(1, Math.ceil(height * pixelRatio))
+  if (typeof OffscreenCanvas !== "undefined") {
+    const canvas = new OffscreenCanvas(pixelWidth, pixelHeight)
+    const ctx = canvas.getContext("2d")!
+    ctx.scale(pixelRatio, pixelRatio)
+    draw(ctx)
+    return canvas.transferToImageBitmap()
+  }
+  const canvas = document.createElement("canvas")
+  canvas.width = pixelWidth
+  canvas.height = pixelHeight
+  const ctx = canvas.getContext("2d")!
+  ctx.scale(pixelRatio, pixelRatio)
+  draw(ctx)
+  return canvas
+}
+
+export class LayerCache<K> {
+  private layers = new Map<K, Layer>()
+
+  constructor(
+    private pixelRatio: number,
+    private capacity = 48,
+  ) {}
+
+  get(key: K) {
+    const layer = this.layers.get(key)
+    if (layer) {
+      // Map keeps insertion order: re-insert to mark as most recently used
+      this.layers.delete(key)
+      this.layers.set(key, layer)
+    }
+    return layer
+  }
+
+  // Rasterize a width x height (CSS px) layer and cache it under `key`
+  render(key: K, width: number, height: number, draw: (ctx: LayerContext) => void) {
+    const layer = rasterize(width, height, this.pixelRatio, draw)
+    this.layers.set(key, layer)
+    if (this.layers.size > this.capacity) {
+      const [oldestKey, oldest] = this.layers.entries().next().value as [K, Layer]
+      this.layers.delete(oldestKey)
+      if ("close" in oldest) oldest.close()
+    }
+    return layer
+  }
+
+  clear() {
+    this.layers.forEach((layer) => {
+      if ("close" in layer) layer.close()
+    })
+    this.layers.clear()
+  }
+}
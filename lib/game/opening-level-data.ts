@@ -0,0 +1,4 @@
+// Generated by bake_opening_level.py - do not edit by hand
+// Opening level of seed 12345: 26 platforms, 47 coins, 20 clouds
+export const OPENING_LEVEL_BASE64 =
+  "AAAAAAAA8D8AAAAAgBzIQAAAAADI2gZBAAAAAKiPCUHBK+VV5V60QAAAAAAAADtAAAAAAABQpEAAAAAAAAA6QAAAAAAAgEdAAAAAAAAANEAAAAAAAABZwAAAAAAA0HNAAAAAAACwcEAAAAAAAAAYQAAAAAAAAAAAAAAAAAAA8D8AAAAAAABZwAAAAAAAQG9AAAAAAACwcEAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAAEAAAAAAAABpQAAAAAAAAFlAAAAAAAAAaUAAAAAAAAAYQAAAAAAAAAAAAAAAAAAACEAAAAAAAKB0QAAAAAAAAG5AAAAAAACAYUAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAEEAAAAAAAAB+QAAAAAAAgFtAAAAAAAAAaUAAAAAAAAAYQAAAAAAAAABAAAAAAAAAFEAAAAAAAACEQAAAAAAAAGlAAAAAAAAAWUAAAAAAAAAYQAAAAAAAABhAAAAAAAAAGEAAAAAAAACJQPMsgEvx/mdAg+5sxWkQbkAAAAAAAAAYQAAAAAAAAPA/AAAAAAAAHEDnM2F4ZqmPQEujR1SwBHFAMKUQj+ebXUAAAAAAAAAYQAAAAAAAABhAAAAAAAAAIECOYQ8Jy1WRQO5T+cpe3npAlD7pkz4XbkAAAAAAAAAYQAAAAAAAAABAAAAAAAAAIkAHIJhSKL2UQAAAAAAAAFBA+6iiBJa0bUAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAJECHEzKDBBeYQGNWGj1y5XpAM/THdW8VX0AAAAAAAAAYQAAAAAAAABhAAAAAAAAAJkA4yfvrIJOZQAAAAAAA0IFArbajyX1FbkAAAAAAAAAYQAAAAAAAAPA/AAAAAAAAKEAOQDCl0EueQAAAAAAAQIBAAAAAAADAckAAAAAAAAAYQAAAAAAAAPA/AAAAAAAAKkA/F9lxV5ygQBPaS2jvNHtAxSa46tr3XEAAAAAAAAAYQAAAAAAAAABAAAAAAAAALECCq679lFOhQBPaS2jvFHdAAAAAAADAckAAAAAAAAAYQAAAAAAAAAAAAAAAAAAALkDAEhm35XCjQBPaS2jv9HJAAAAAAADAckAAAAAAAAAYQAAAAAAAABRAAAAAAAAAMED09bqiX5ClQAXZhoDS8H9AAAAAAADAckAAAAAAAAAYQAAAAAAAABhAAAAAAAAAMUDEJrjqCrSnQFW+sjtGUlxAAAAAAADAckAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAMkDbFKOG/92pQPGisLEWs2hAHAbd2Yo3XkAAAAAAAAAYQAAAAAAAAABAAAAAAAAAM0B7+MabDpyqQAAAAAAAAFBAAAAAAADAckAAAAAAAAAYQAAAAAAAABhAAAAAAAAANECmV6C5ocOsQDWoiTinJXZAR5P7KsyVXUAAAAAAAAAYQAAAAAAAAABAAAAAAAAANUCsslC/3HWtQEoMpToBi2hAAAAAAADAckAAAAAAAAAYQAAAAAAAABRAAAAAAAAANkAKXimvipqvQFzzwyJ1+HVA5wlvTzlKbkAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAN0C4q2+SB6SwQFGqEwix3XpAAAAAAADAckAAAAAAAAAYQAAAAAAAAABAAAAAAAAAOEC4q2+SB9qxQIZSnUD4+HVA/vdZ6x3cbUAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAOUDBK+VV5WqyQFSQbQgoXl1AAAAAAADAckAAAAAAAAAYQAAAAAAAAAAAAAAAAAAAOkAAAAAAAIBLwAAAAAAAAGtAAAAAAAAAOkAAAAAAAAA6QAAAAAAAADvAAAAAAACwcUAAAAAAAAA6QAAAAAAAADpAAAAAAABgakAAAAAAAIBQQAAAAAAAADpAAAAAAAAAOkAAAAAAAOBvQAAAAAAAgFBAAAAAAAAAOkAAAAAAAAA6QAAAAAAAAHJAAAAAAACAUEAAAAAAAAA6QAAAAAAAADpAAAAAAADAdEAAAAAAAIBQQAAAAAAAADpAAAAAAAAAOkAAAAAAALB2QAAAAAAAgFBAAAAAAAAAOkAAAAAAAAA6QAAAAAAA4HZAAAAAAADAaUAAAAAAAAA6QAAAAAAAADpAAAAAAACYgEAAAAAAAABTQAAAAAAAADpAAAAAAAAAOkAAAAAAAJCBQAAAAAAAAFNAAAAAAAAAOkAAAAAAAAA6QAAAAAAAyIJAAAAAAAAAX0AAAAAAAAA6QAAAAAAAADpAAAAAAAAgg0AAAAAAAABTQAAAAAAAADpAAAAAAAAAOkAAAAAAAECDQAAAAAAAAF9AAAAAAAAAOkAAAAAAAAA6QAAAAAAASIRAAAAAAAAAX0AAAAAAAAA6QAAAAAAAADpAAAAAAACohEAAAAAAAMBkQAAAAAAAADpAAAAAAAAAOkAAAAAAACCFQAAAAAAAwGRAAAAAAAAAOkAAAAAAAAA6QAAAAAAAKIZAAAAAAADAZEAAAAAAAAA6QAAAAAAAADpAAAAAAAB0kEAAAAAAAMBtQAAAAAAAADpAAAAAAAAAOkAAAAAAALCQQAAAAAAAwG1AAAAAAAAAOkAAAAAAAAA6QAAAAAAANJFAAAAAAADAbUAAAAAAAAA6QAAAAAAAADpAAAAAAADck0AAAAAAAMB7QAAAAAAAADpAAAAAAAAAOkAAAAAAABiUQAAAAAAAwHtAAAAAAAAAOkAAAAAAAAA6QAAAAAAAnJRAAAAAAADAe0AAAAAAAAA6QAAAAAAAADpAAAAAAADMmEAAAAAAAMB4QAAAAAAAADpAAAAAAAAAOkAAAAAAAAiZQAAAAAAAwHhAAAAAAAAAOkAAAAAAAAA6QAAAAAAAjJlAAAAAAADAeEAAAAAAAAA6QAAAAAAAADpAAAAAAADmoEAAAAAAABB8QAAAAAAAADpAAAAAAAAAOkAAAAAAAAShQAAAAAAAEHxAAAAAAAAAOkAAAAAAAAA6QAAAAAAARqFAAAAAAAAQfEAAAAAAAAA6QAAAAAAAADpAAAAAAADgoUAAAAAAAPB0QAAAAAAAADpAAAAAAAAAOkAAAAAAAEqnQAAAAAAA0H1AAAAAAAAAOkAAAAAAAAA6QAAAAAAAaKdAAAAAAADQfUAAAAAAAAA6QAAAAAAAADpAAAAAAACqp0AAAAAAANB9QAAAAAAAADpAAAAAAAAAOkAAAAAAADKqQAAAAAAAgGpAAAAAAAAAOkAAAAAAAAA6QAAAAAAAUKpAAAAAAACAakAAAAAAAAA6QAAAAAAAADpAAAAAAACSqkAAAAAAAIBqQAAAAAAAADpAAAAAAAAAOkAAAAAAAFasQAAAAAAAAD5AAAAAAAAAOkAAAAAAAAA6QAAAAAAAdKxAAAAAAAAAPkAAAAAAAAA6QAAAAAAAADpAAAAAAAC2rEAAAAAAAAA+QAAAAAAAADpAAAAAAAAAOkAAAAAAABKtQAAAAAAAAHdAAAAAAAAAOkAAAAAAAAA6QAAAAAAAMK1AAAAAAAAAd0AAAAAAAAA6QAAAAAAAADpAAAAAAAByrUAAAAAAAAB3QAAAAAAAADpAAAAAAAAAOkAAAAAAAIGxQAAAAAAAwHtAAAAAAAAAOkAAAAAAAAA6QAAAAAAAkLFAAAAAAADAe0AAAAAAAAA6QAAAAAAAADpAAAAAAACxsUAAAAAAAMB7QAAAAAAAADpAAAAAAAAAOkAAAAAAACWyQAAAAAAA4HNAAAAAAAAAOkAAAAAAAAA6QAAAAAAArbJAAAAAAADAVEAAAAAAAAA6QAAAAAAAADpAAAAAAAAAAAAqyDYEFF9hQAAAAAAAgGBAAAAAAACAYECJGs/o4sbTPwAAAAAAAAhAnOT9dTAGXkBRqhMIkQVhQD8ag0W0eGJAPxqDRbR4YkAUqesnxvXXPwAAAAAAAPA/UHzO1HLBbUBVVVVVVaFQQDlncoyet2pAOWdyjJ63akAkJWx9T/XiPwAAAAAAAPA/wgHzLIDLbkDSUW/7VKpcQAqAixul8mJACoCLG6XyYkABQ77HtNrSPwAAAAAAAABAiqFUJxByb0CCA+ZZAENhQM+pUEYLbWdAz6lQRgttZ0BduKtvkvfiPwAAAAAAAPA/p1vzwyL1d0DdMcIvOIReQKALiy+yPmZAoAuLL7I+ZkB6c1O7aODQPwAAAAAAAPA/7lP5yu5OgUB8ztRy4bZhQHntkd/6CGhAee2R3/oIaEBIzAGAFyfbPwAAAAAAAPA/YpEy8HT7gkAsu2OEXzRgQO6ZBJS5ZHBA7pkElLlkcEDNPtl2YwfQPwAAAAAAAPA/UBNx7oHig0Cm0SMqyPpYQMwqLCNycG9AzCosI3Jwb0CD6RAMtVfgPwAAAAAAAABADphnAVxMiUDuU/nK7thTQOiepXclVGFA6J6ldyVUYUAujlZO5z3iPwAAAAAAAPA/0iMqyDaEjUCjGQ9dT6pSQEkt8/4urWxASS3z/i6tbEDQ0mCDJ3PgPwAAAAAAAPA/WaQMPN3sjUAHnm7NDzNXQOdKxdQz7GpA50rF1DPsakAK58BLHwzfPwAAAAAAAABA+mGRMvDikUALd/VN8kZjQHptZWltqmZAem1laW2qZkAnFoefE3vQPwAAAAAAAPA/pHWZw4tOk0D93o1MluBYQMwf4FbSbmRAzB/gVtJuZEC6G2reBsfbPwAAAAAAAABAXhQ21s5glUDzld0xwo9JQGmAvtxVymBAaYC+3FXKYEBCKTf5Un3jPwAAAAAAAABAPmdquXAPlkBCtiGg+CZjQJOqfwI2EmdAk6p/AjYSZ0DOA8HDkB7gPwAAAAAAAPA/dl6r2O8dlkBruXBX3/BYQGVOtxxSAF9AZU63HFIAX0DQdc1tJ1nZPwAAAAAAAABAPyxSBp4fmkB4jPALDjBSQGHVekRpQ2RAYdV6RGlDZEAXV0iC1aDhPwAAAAAAAPA/c0oMpTp5mkDPArgUzQRTQDMPWXzE7GdAMw9ZfMTsZ0CSgG9eTTzfPwAAAAAAAPA/flikDDzBnEBCTcS5B6o1QC56As2VtmlALnoCzZW2aUCoBw9yyOLhPwAAAAAAAABA"
@@ -0,0 +1,55 @@
+import { OPENING_LEVEL_BASE64 } from "./opening-level-data"
+
+// The opening level of the default seed, baked at build time by
+// bake_opening_level.py. Every run from that seed starts with the same
+// platforms, coins and clouds, so a restart copies them from one
+// Float64Array instead of generating them again.
+
+export const OL = {
+  VERSION: 0,
+  SEED: 1,
+  RANDOM_STATE: 2, // Platform/coin stream after the opening level
+  CLOUD_RANDOM_STATE: 3,
+  NEXT_CHUNK_X: 4,
+  NEXT_CHUNK_ID: 5,
+  NEXT_CLOUD_X: 6,
+  PLATFORMS: 7, // Record counts; records are x-sorted, like the spatial indexes
+  COINS: 8,
+  CLOUDS: 9,
+  HEADER: 10,
+}
+
+export const OPENING_LEVEL_VERSION = 1
+export const OPENING_PLATFORM_RECORD = 6 // x, y, width, height, flags, id
+export const OPENING_COIN_RECORD = 4 // x, y, width, height
+export const OPENING_CLOUD_RECORD = 6 // x, y, width, height, opacity, type
+
+export const OPENING_FIRE = 1
+export const OPENING_DROP = 2
+export const OPENING_UP = 4
+
+let openingLevel: Float64Array | null | undefined
+
+// The baked level, or null when it is missing or from another layout
+export function getOpeningLevel() {
+  if (openingLevel === undefined) {
+    openingLevel = null
+    if (OPENING_LEVEL_BASE64 && typeof atob === "function") {
+      const binary = atob(OPENING_LEVEL_BASE64)
+      const bytes = new Uint8Array(binary.length)
+      for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i)
+      const level = new Float64Array(bytes.buffer) // Little endian, like every supported platform
+      if (level[OL.VERSION] === OPENING_LEVEL_VERSION) openingLevel = level
+    }
+  }
+  return openingLevel
+}
+
+// Index of the first value that differs, or -1 when the levels match
+export function diffOpeningLevels(a: Float64Array, b: Float64Array) {
+  const length = Math.max(a.length, b.length)
+  for (let i = 0; i < length; i++) {
+    if (a[i] !== b[i]) return i
+  }
+  return -1
+}
@@ -0,0 +1,135 @@
+import type { GameState } from "./world"
+
+// Frame timing for the Dev Tools performance HUD. Samples live in ring
+// buffers with a matching bucket histogram, so recording is O(1) and a
+// percentile is one walk over the buckets; nothing allocates per frame.
+// The HUD values are republished a few times a second and drawn by the
+// renderer from a cached layer, so the overlay costs a blit, not text
+// layout, on most frames.
+
+const SAMPLES = 240 // ~2 s at 120 Hz, 4 s at 60 Hz
+const BUCKET_MS = 0.1
+const BUCKETS = 500 // 0..50 ms; slower samples land in the last bucket
+const LONG_FRAME_MS = 50 // Same threshold as long animation frames
+const PUBLISH_MS = 250
+
+export class FrameTimeHistogram {
+  private samples = new Float32Array(SAMPLES)
+  private buckets = new Uint16Array(BUCKETS)
+  private next = 0
+  count = 0
+
+  push(ms: number) {
+    if (this.count === SAMPLES) {
+      this.buckets[bucketOf(this.samples[this.next])]--
+    } else {
+      this.count++
+    }
+    // Bucket the stored (float32) value so eviction decrements the same bucket
+    this.samples[this.next] = ms
+    this.buckets[bucketOf(this.samples[this.next])]++
+    this.next = (this.next + 1) % SAMPLES
+  }
+
+  // Upper edge of the bucket holding quantile q (0..1) of the recent samples
+  percentile(q: number) {
+    if (this.count === 0) return 0
+    const rank = Math.ceil(q * this.count)
+    let seen = 0
+    for (let i = 0; i < BUCKETS; i++) {
+      seen += this.buckets[i]
+      if (seen >= rank) return (i + 1) * BUCKET_MS
+    }
+    return BUCKETS * BUCKET_MS
+  }
+
+  clear() {
+    this.buckets.fill(0)
+    this.next = 0
+    this.count = 0
+  }
+}
+
+const bucketOf = (ms: number) => Math.min(BUCKETS - 1, Math.max(0, Math.floor(ms / BUCKET_MS)))
+
+// Published HUD values, in the order the renderer reads them
+export const HUD = {
+  VERSION: 0, // Bumped on every publish; the renderer re-rasterizes on change
+  UPDATE_P50: 1,
+  UPDATE_P95: 2,
+  UPDATE_P99: 3,
+  RENDER_P50: 4,
+  RENDER_P95: 5,
+  RENDER_P99: 6,
+  FRAME_P50: 7,
+  FRAME_P95: 8,
+  FRAME_P99: 9,
+  LONG_FRAMES: 10,
+  PLATFORMS: 11,
+  COINS: 12,
+  CLOUDS: 13,
+  EFFECTS: 14,
+  COMMITS: 15,
+  COMMITS_PER_SEC: 16,
+  LENGTH: 17,
+}
+
+export class PerfStats {
+  update = new FrameTimeHistogram() // Simulation steps of one frame
+  render = new FrameTimeHistogram() // Packing + drawing one frame
+  frame = new FrameTimeHistogram() // rAF-to-rAF interval
+  longFrames = 0
+  commits = 0 // React commits of the game component
+  hud = new Float64Array(HUD.LENGTH)
+
+  private lastFrameTime = -1
+  private lastPublish = -Infinity
+  private commitsAtPublish = 0
+
+  // Call once per rAF with its timestamp
+  frameStart(time: number) {
+    if (this.lastFrameTime >= 0) {
+      const interval = time - this.lastFrameTime
+      this.frame.push(interval)
+      if (interval > LONG_FRAME_MS) this.longFrames++
+    }
+    this.lastFrameTime = time
+  }
+
+  // Refresh the HUD values at most every PUBLISH_MS
+  publish(time: number, st: GameState) {
+    const elapsed = time - this.lastPublish
+    if (elapsed < PUBLISH_MS) return
+    const hud = this.hud
+    hud[HUD.VERSION]++
+    hud[HUD.UPDATE_P50] = this.update.percentile(0.5)
+    hud[HUD.UPDATE_P95] = this.update.percentile(0.95)
+    hud[HUD.UPDATE_P99] = this.update.percentile(0.99)
+    hud[HUD.RENDER_P50] = this.render.percentile(0.5)
+    hud[HUD.RENDER_P95] = this.render.percentile(0.95)
+    hud[HUD.RENDER_P99] = this.render.percentile(0.99)
+    hud[HUD.FRAME_P50] = this.frame.percentile(0.5)
+    hud[HUD.FRAME_P95] = this.frame.percentile(0.95)
+    hud[HUD.FRAME_P99] = this.frame.percentile(0.99)
+    hud[HUD.LONG_FRAMES] = this.longFrames
+    hud[HUD.PLATFORMS] = st.platforms.size
+    hud[HUD.COINS] = st.coins.size
+    hud[HUD.CLOUDS] = st.clouds.size
+    hud[HUD.EFFECTS] = st.coinEffects.length
+    hud[HUD.COMMITS] = this.commits
+    hud[HUD.COMMITS_PER_SEC] = Number.isFinite(elapsed) ? ((this.commits - this.commitsAtPublish) * 1000) / elapsed : 0
+    this.commitsAtPublish = this.commits
+    this.lastPublish = time
+  }
+
+  // Start measuring afresh (new run, HUD shown again)
+  reset() {
+    this.update.clear()
+    this.render.clear()
+    this.frame.clear()
+    this.longFrames = 0
+    this.lastFrameTime = -1
+    this.lastPublish = -Infinity
+    this.commitsAtPublish = this.commits
+  }
+}
@@ -0,0 +1,74 @@
+// Uniform-grid spatial hash for placement-time overlap tests. World
+// generation proposes coin spots one at a time and rejects any that overlap
+// something already placed; with a grid, each test looks at the handful of
+// rects in the cells the candidate covers instead of every coin in the
+// chunk. Cell lists are recycled between batches.
+
+export const ANY_OWNER = -1 // Blocks candidates of every owner
+
+export class PlacementGrid {
+  private cells = new Map<number, number[]>()
+  private spare: number[][] = []
+  private rects: number[] = [] // x, y, width, height, owner per rect
+
+  constructor(private cellSize = 64) {}
+
+  clear() {
+    this.cells.forEach((cell) => {
+      cell.length = 0
+      this.spare.push(cell)
+    })
+    this.cells.clear()
+    this.rects.length = 0
+  }
+
+  // Add a rect; one with an owner only blocks candidates of that owner
+  insert(x: number, y: number, width: number, height: number, owner = ANY_OWNER) {
+    const index = this.rects.length
+    this.rects.push(x, y, width, height, owner)
+    const { cellSize } = this
+    const maxCx = Math.floor((x + width) / cellSize)
+    const maxCy = Math.floor((y + height) / cellSize)
+    for (let cx = Math.floor(x / cellSize); cx <= maxCx; cx++) {
+      for (let cy = Math.floor(y / cellSize); cy <= maxCy; cy++) {
+        const key = cellKey(cx, cy)
+        let cell = this.cells.get(key)
+        if (!cell) {
+          cell = this.spare.pop() ?? []
+          this.cells.set(key, cell)
+        }
+        cell.push(index)
+      }
+    }
+  }
+
+  // Does the candidate strictly overlap a rect owned by nobody or by `owner`?
+  overlaps(x: number, y: number, width: number, height: number, owner: number) {
+    const { cellSize, rects } = this
+    const maxCx = Math.floor((x + width) / cellSize)
+    const maxCy = Math.floor((y + height) / cellSize)
+    for (let cx = Math.floor(x / cellSize); cx <= maxCx; cx++) {
+      for (let cy = Math.floor(y / cellSize); cy <= maxCy; cy++) {
+        const cell = this.cells.get(cellKey(cx, cy))
+        if (!cell) continue
+        for (let i = 0; i < cell.length; i++) {
+          const r = cell[i]
+          const rectOwner = rects[r + 4]
+          if (rectOwner !== ANY_OWNER && rectOwner !== owner) continue
+          if (
+            x < rects[r] + rects[r + 2] &&
+            x + width > rects[r] &&
+            y < rects[r + 1] + rects[r + 3] &&
+            y + height > rects[r + 1]
+          ) {
+            return true
+          }
+        }
+      }
+    }
+    return false
+  }
+}
+
+// Cells are keyed by column and row; rows stay within +-2^15 of the canvas
+const cellKey = (cx: number, cy: number) => cx * 65536 + (cy + 32768)
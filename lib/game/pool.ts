@@ -0,0 +1,18 @@
+// Recycled entity records. After the first few chunks every platform, coin,
+// cloud and coin effect comes from a free list, so a long run stops feeding
+// the garbage collector.
+
+export class ObjectPool<T> {
+  private free: T[] = []
+
+  constructor(private create: () => T) {}
+
+  acquire() {
+    return this.free.pop() ?? this.create()
+  }
+
+  release(item: T) {
+    this.free.push(item)
+  }
+}
+
@@ -0,0 +1,169 @@
+import { lerp } from "./fixed-step"
+import { HUD } from "./perf-stats"
+import { CANVAS_W, type GameState, type StepSnapshot } from "./world"
+
+// A frame is everything the renderer needs, packed into one Float64Array:
+// a fixed header followed by fixed-size records for the visible entities.
+// The same buffer is drawn directly on the main thread or transferred to
+// the render worker, and nothing in it refers back to the game state.
+
+export const F = {
+  CAMERA_X: 0,
+  CAMERA_Y: 1,
+  PLAYER_X: 2,
+  PLAYER_Y: 3,
+  PLAYER_W: 4,
+  PLAYER_H: 5,
+  PULL_DIRECTION: 6,
+  DROP_HITS: 7,
+  IS_DEAD: 8,
+  FIRE_STATE_MS: 9, // Time since a flame was touched, -1 when not showing
+  CLOCK_MS: 10, // rAF timestamp driving sprite animation
+  LEVEL: 11,
+  PLATFORMS: 12, // Record counts
+  COINS: 13,
+  CLOUDS: 14,
+  BOUNDARIES: 15,
+  EFFECTS: 16,
+  PLATFORM_NUMBERS: 17, // 1 to label platforms with their ids
+  HUD: 18, // Performance HUD values after the records (HUD.LENGTH), 0 when hidden
+  HEADER: 19,
+}
+
+export const PLATFORM_RECORD = 6 // x, y, width, height, flags, id
+export const COIN_RECORD = 4 // x, y, width, height
+export const CLOUD_RECORD = 6 // x, y, width, height, opacity, type
+export const BOUNDARY_RECORD = 2 // x, level
+export const EFFECT_RECORD = 3 // x, y, progress
+
+export const PLATFORM_FIRE = 1
+export const PLATFORM_DROP = 2
+export const PLATFORM_UP = 4 // Items sit above the platform
+
+// Dev Tools overlays drawn into the frame
+export interface FrameOverlays {
+  platformNumbers: boolean
+  hud: Float64Array | null // PerfStats.hud
+}
+
+const FIRE_STATE_MS = 1800
+const VIEW_MARGIN = 50
+
+// Upper bound on the frame size for the current state
+export function frameCapacity(st: GameState) {
+  return (
+    F.HEADER +
+    st.platforms.size * PLATFORM_RECORD +
+    st.coins.size * COIN_RECORD +
+    st.clouds.size * CLOUD_RECORD +
+    st.levelBoundaries.length * BOUNDARY_RECORD +
+    st.coinEffects.length * EFFECT_RECORD +
+    HUD.LENGTH
+  )
+}
+
+// Pack the visible world, interpolated `alpha` of the way from the previous
+// simulation step to the current one. Returns the number of values written.
+export function writeFrame(
+  out: Float64Array,
+  st: GameState,
+  prev: StepSnapshot,
+  alpha: number,
+  clockMs: number,
+  overlays?: FrameOverlays,
+) {
+  const { player } = st
+  const cameraX = lerp(prev.cameraX, st.camera.x, alpha)
+  const cloudLag = prev.cloudDrift * (1 - alpha)
+  const minX = cameraX - VIEW_MARGIN
+  const maxX = cameraX + CANVAS_W + VIEW_MARGIN
+
+  const fireElapsed = st.timeMs - st.fireStateStartTime
+  const showFireState = st.fireStateStartTime > 0 && fireElapsed < FIRE_STATE_MS && !st.isDead
+
+  out[F.CAMERA_X] = cameraX
+  out[F.CAMERA_Y] = st.camera.y
+  out[F.PLAYER_X] = lerp(prev.playerX, player.x, alpha)
+  out[F.PLAYER_Y] = lerp(prev.playerY, player.y, alpha)
+  out[F.PLAYER_W] = player.width
+  out[F.PLAYER_H] = player.height
+  out[F.PULL_DIRECTION] = st.pullDirection
+  out[F.DROP_HITS] = st.dropHitCount
+  out[F.IS_DEAD] = st.isDead ? 1 : 0
+  out[F.FIRE_STATE_MS] = showFireState ? fireElapsed : -1
+  out[F.CLOCK_MS] = clockMs
+  out[F.LEVEL] = Math.floor(st.platformsPassed / 20) + 1
+  out[F.PLATFORM_NUMBERS] = overlays?.platformNumbers ? 1 : 0
+
+  let o = F.HEADER
+  let count = 0
+  const endPlatform = st.platforms.lowerBound(maxX)
+  for (let i = st.platforms.rangeStart(minX); i < endPlatform; i++) {
+    const platform = st.platforms.get(i)
+    if (platform.x + platform.width <= minX) continue
+    out[o++] = platform.x
+    out[o++] = platform.y
+    out[o++] = platform.width
+    out[o++] = platform.height
+    out[o++] =
+      (platform.hasFire ? PLATFORM_FIRE : 0) |
+      (platform.hasDrop ? PLATFORM_DROP : 0) |
+      (platform.dropDirection === "up" ? PLATFORM_UP : 0)
+    out[o++] = platform.id ?? -1
+    count++
+  }
+  out[F.PLATFORMS] = count
+
+  count = 0
+  const endCoin = st.coins.lowerBound(maxX)
+  for (let i = st.coins.rangeStart(minX); i < endCoin; i++) {
+    const coin = st.coins.get(i)
+    if (coin.collected || coin.x + coin.width <= minX) continue
+    out[o++] = coin.x
+    out[o++] = coin.y
+    out[o++] = coin.width
+    out[o++] = coin.height
+    count++
+  }
+  out[F.COINS] = count
+
+  count = 0
+  const endCloud = st.clouds.lowerBound(maxX + cloudLag)
+  for (let i = st.clouds.rangeStart(minX + cloudLag); i < endCloud; i++) {
+    const cloud = st.clouds.get(i)
+    const cloudX = cloud.x - cloudLag
+    if (cloudX + cloud.width <= minX) continue
+    out[o++] = cloudX
+    out[o++] = cloud.y
+    out[o++] = cloud.width
+    out[o++] = cloud.height
+    out[o++] = cloud.opacity
+    out[o++] = cloud.type
+    count++
+  }
+  out[F.CLOUDS] = count
+
+  // All boundaries: they also split the background into level colors
+  for (let i = 0; i < st.levelBoundaries.length; i++) {
+    out[o++] = st.levelBoundaries[i].x
+    out[o++] = st.levelBoundaries[i].level
+  }
+  out[F.BOUNDARIES] = st.levelBoundaries.length
+
+  for (let i = 0; i < st.coinEffects.length; i++) {
+    const effect = st.coinEffects[i]
+    out[o++] = effect.x
+    out[o++] = effect.y
+    out[o++] = (st.timeMs - effect.startTime) / effect.duration
+  }
+  out[F.EFFECTS] = st.coinEffects.length
+
+  const hud = overlays?.hud
+  if (hud) {
+    out.set(hud, o)
+    o += hud.length
+  }
+  out[F.HUD] = hud ? hud.length : 0
+
+  return o
+}
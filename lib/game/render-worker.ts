@@ -0,0 +1,58 @@
+import { FONT_FILES } from "./font-files"
+import { GameRenderer, type RenderSprites } from "./renderer"
+
+// Render worker: owns the transferred OffscreenCanvas and draws the frames
+// the main thread packs each rAF. Frame buffers are transferred both ways,
+// so steady-state drawing copies and allocates nothing.
+
+export type RenderWorkerRequest =
+  | { type: "init"; canvas: OffscreenCanvas; pixelRatio: number }
+  | { type: "sprites"; sprites: Partial<RenderSprites> }
+  | { type: "frame"; frame: Float64Array }
+  | { type: "fonts-loaded" }
+
+export type RenderWorkerReply = { type: "frame-done"; frame: Float64Array }
+
+const ctx = self as unknown as Worker
+let renderer: GameRenderer | null = null
+
+// Workers don't see the page's @font-face rules: load the self-hosted face
+// the canvas text uses (app/fonts.css) here, then rebuild the glyph atlases
+function loadFonts() {
+  if (typeof FontFace === "undefined") return
+  const fonts = (self as unknown as { fonts?: FontFaceSet }).fonts
+  const file = FONT_FILES.find((font) => font.family === "Rethink Sans")
+  if (!fonts || !file) return // Not self-hosted yet: keep the fallback face
+  const face = new FontFace(file.family, `url("${file.url}")`, { weight: file.weight })
+  face.load().then(
+    (loaded) => {
+      fonts.add(loaded)
+      renderer?.clearTextLayers()
+    },
+    () => {},
+  )
+}
+
+ctx.onmessage = (event: MessageEvent<RenderWorkerRequest>) => {
+  const message = event.data
+  switch (message.type) {
+    case "init": {
+      const canvasCtx = message.canvas.getContext("2d")
+      if (canvasCtx) renderer = new GameRenderer(canvasCtx, message.pixelRatio)
+      loadFonts()
+      break
+    }
+    case "sprites":
+      renderer?.setSprites(message.sprites)
+      break
+    case "frame": {
+      renderer?.draw(message.frame)
+      // Hand the buffer back for reuse
+      ctx.postMessage({ type: "frame-done", frame: message.frame } satisfies RenderWorkerReply, [message.frame.buffer])
+      break
+    }
+    case "fonts-loaded":
+      renderer?.clearTextLayers()
+      break
+  }
+}
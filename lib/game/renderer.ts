@@ -0,0 +1,587 @@
+import { AnimationClock } from "./animation-clock"
+import { GlyphAtlas } from "./glyph-atlas"
+import { LayerCache, type LayerContext } from "./layer-cache"
+import { HUD } from "./perf-stats"
+import {
+  BOUNDARY_RECORD,
+  CLOUD_RECORD,
+  COIN_RECORD,
+  EFFECT_RECORD,
+  F,
+  PLATFORM_DROP,
+  PLATFORM_FIRE,
+  PLATFORM_RECORD,
+  PLATFORM_UP,
+} from "./render-frame"
+import { CANVAS_H, CANVAS_W, PLATFORM_DIRT_H, PLATFORM_GRASS_H } from "./world"
+
+// Draws packed frames (see render-frame.ts) onto a 2D context. It holds no
+// game state and touches no DOM, so the same class runs on the main thread
+// or inside the render worker.
+
+export interface RenderSprites {
+  character: ImageBitmap[] | null
+  fireState: ImageBitmap[] | null
+  dead: ImageBitmap | null
+  cloud: ImageBitmap[] | null
+  fire: ImageBitmap[] | null
+  drop: ImageBitmap | null
+  coin: ImageBitmap[] | null
+}
+
+// What the game loop talks to, whichever thread does the drawing
+export interface FrameRenderer {
+  setSprites(sprites: Partial<RenderSprites>): void
+  // A buffer with room for `capacity` values; ownership passes back with draw()
+  acquireFrame(capacity: number): Float64Array
+  draw(frame: Float64Array): void
+  // Web fonts finished loading: re-rasterize cached text
+  clearTextLayers(): void
+}
+
+const BOUNDARY_LAYER_W = 120 // Cached level boundary layer: dashed line + centered label
+const PLAYER_COLOR = "#FF0000" // Fallback before the character sprites load
+const HUD_W = 230
+const HUD_H = 86
+const TEXT_FONT = "Rethink Sans, sans-serif"
+const COIN_GLYPH_SIZE = 15 // "$" atlas size; 0.6 x the 26 px coin
+const NUMBER_TAG_H = 28 // Platform number tag along the bottom edge
+const NUMBER_TAG_PAD = 8
+
+// Get background color based on level
+export function getLevelBackgroundColor(level: number) {
+  const colors = [
+    "#1a237e", // Level 1: Blue
+    "#4a148c", // Level 2: Purple
+    "#1b5e20", // Level 3: Green
+    "#bf360c", // Level 4: Red-orange
+    "#3e2723", // Level 5: Brown
+    "#263238", // Level 6: Blue-grey
+    "#1a1a1a", // Level 7: Dark grey
+    "#4a0e4e", // Level 8: Dark purple
+  ]
+  return colors[(level - 1) % colors.length]
+}
+
+// Coin flip: 0(front) -> 1(tilt) -> 2(edge) -> 3(tilt)
+const COIN_FRAME_SCALE_X = [1, 0.5, 0.1, 0.5]
+
+// Draw a coin with 4-frame horizontal flip animation (mimics Figma variants)
+function drawCoin(
+  ctx: LayerContext,
+  dollar: GlyphAtlas,
+  x: number,
+  y: number,
+  w: number,
+  h: number,
+  frame: number,
+) {
+  ctx.save()
+  ctx.translate(x + w / 2, y + h / 2)
+
+  const sx = COIN_FRAME_SCALE_X[(frame % 4 + 4) % 4]
+
+  // Special rendering for edge state (frame 2) - Figma variant
+  if (frame === 2) {
+    // Draw edge view with subtle 3D effect (darker right edge)
+    const barWidth = Math.max(1, w * 0.05) // Very thin bar
+    const rightEdgeWidth = Math.max(0.5, barWidth * 0.3)
+
+    // Main bar (golden-brown)
+    ctx.fillStyle = "#daa520"
+    ctx.fillRect(-barWidth / 2, -h / 2, barWidth, h)
+
+    // Right edge (darker for 3D effect)
+    ctx.fillStyle = "#b8860b"
+    ctx.fillRect(barWidth / 2 - rightEdgeWidth, -h / 2, rightEdgeWidth, h)
+
+    // Left highlight (lighter)
+    ctx.fillStyle = "#ffd700"
+    ctx.fillRect(-barWidth / 2, -h / 2, Math.max(0.5, barWidth * 0.2), h)
+  } else {
+    // Normal coin rendering for other frames
+    ctx.scale(sx, 1)
+
+    // Outer coin
+    ctx.fillStyle = "#ffd700"
+    ctx.strokeStyle = "#b8860b"
+    ctx.lineWidth = 1.5
+    ctx.beginPath()
+    ctx.arc(0, 0, w / 2, 0, Math.PI * 2)
+    ctx.fill()
+    ctx.stroke()
+
+    // Inner disc only if visible enough
+    if (sx > 0.15) {
+      ctx.fillStyle = "#daa520"
+      ctx.beginPath()
+      ctx.arc(0, 0, w / 2 - 2, 0, Math.PI * 2)
+      ctx.fill()
+    }
+
+    // Dollar sign only when mostly facing front
+    if (sx > 0.4) {
+      const scale = Math.floor(w * 0.6) / COIN_GLYPH_SIZE
+      dollar.draw(ctx, "$", (-dollar.measure("$") * scale) / 2, 0, scale)
+    }
+  }
+
+  ctx.restore()
+}
+
+function drawStyledPlatform(ctx: LayerContext, x: number, y: number, w: number) {
+  // Simplified platform design for better performance
+  const grassH = PLATFORM_GRASS_H
+  const dirtH = PLATFORM_DIRT_H
+  const topRadius = 8 // Border radius for grass (top)
+  const bottomRadius = 4 // Border radius for dirt (bottom)
+
+  // Grass cap (simple gradient, no patches or fringe) - 8px rounded corners on top
+  const grassTopY = y - grassH
+  const grassGrad = ctx.createLinearGradient(0, grassTopY, 0, y)
+  grassGrad.addColorStop(0, "#d7ff6a")
+  grassGrad.addColorStop(1, "#b6ef53")
+  ctx.fillStyle = grassGrad
+  ctx.beginPath()
+  ctx.moveTo(x + topRadius, grassTopY)
+  ctx.lineTo(x + w - topRadius, grassTopY)
+  ctx.arcTo(x + w, grassTopY, x + w, grassTopY + topRadius, topRadius)
+  ctx.lineTo(x + w, y)
+  ctx.lineTo(x, y)
+  ctx.lineTo(x, grassTopY + topRadius)
+  ctx.arcTo(x, grassTopY, x + topRadius, grassTopY, topRadius)
+  ctx.closePath()
+  ctx.fill()
+
+  // Dirt body (simple gradient, no waves or pebbles) - 4px rounded corners on bottom
+  const dirtTopY = y
+  const dirtGrad = ctx.createLinearGradient(0, dirtTopY, 0, dirtTopY + dirtH)
+  dirtGrad.addColorStop(0, "#bf6b32")
+  dirtGrad.addColorStop(1, "#8a421f")
+  ctx.fillStyle = dirtGrad
+  ctx.beginPath()
+  ctx.moveTo(x, dirtTopY)
+  ctx.lineTo(x + w, dirtTopY)
+  ctx.lineTo(x + w, dirtTopY + dirtH - bottomRadius)
+  ctx.arcTo(x + w, dirtTopY + dirtH, x + w - bottomRadius, dirtTopY + dirtH, bottomRadius)
+  ctx.lineTo(x + bottomRadius, dirtTopY + dirtH)
+  ctx.arcTo(x, dirtTopY + dirtH, x, dirtTopY + dirtH - bottomRadius, bottomRadius)
+  ctx.lineTo(x, dirtTopY)
+  ctx.closePath()
+  ctx.fill()
+
+  // Simple highlight line at top of grass (optional, minimal cost) - follows 8px rounded corner
+  ctx.save()
+  ctx.globalAlpha = 0.3
+  ctx.strokeStyle = "#f0ffb0"
+  ctx.lineWidth = 1
+  ctx.beginPath()
+  ctx.moveTo(x + topRadius, grassTopY + 0.5)
+  ctx.lineTo(x + w - topRadius, grassTopY + 0.5)
+  ctx.stroke()
+  ctx.restore()
+}
+
+// Rounded tag behind a platform number
+function drawNumberTag(ctx: LayerContext, width: number) {
+  ctx.fillStyle = "#e5e7eb"
+  ctx.beginPath()
+  ctx.roundRect(0, 0, width, NUMBER_TAG_H, 4)
+  ctx.fill()
+}
+
+// Performance HUD panel for one published set of values (see perf-stats.ts)
+function drawPerfHud(ctx: LayerContext, frame: Float64Array, at: number) {
+  const v = (field: number) => frame[at + field]
+  const ms = (field: number) => v(field).toFixed(1).padStart(5)
+  ctx.fillStyle = "rgba(0, 0, 0, 0.7)"
+  ctx.fillRect(0, 0, HUD_W, HUD_H)
+  ctx.fillStyle = "#ffffff"
+  ctx.font = "11px ui-monospace, monospace"
+  ctx.textBaseline = "top"
+  ctx.fillText("            p50   p95   p99 ms", 6, 5)
+  ctx.fillText(`update    ${ms(HUD.UPDATE_P50)} ${ms(HUD.UPDATE_P95)} ${ms(HUD.UPDATE_P99)}`, 6, 18)
+  ctx.fillText(`render    ${ms(HUD.RENDER_P50)} ${ms(HUD.RENDER_P95)} ${ms(HUD.RENDER_P99)}`, 6, 31)
+  ctx.fillText(`frame     ${ms(HUD.FRAME_P50)} ${ms(HUD.FRAME_P95)} ${ms(HUD.FRAME_P99)}`, 6, 44)
+  ctx.fillText(
+    `plat ${v(HUD.PLATFORMS)}  coin ${v(HUD.COINS)}  cloud ${v(HUD.CLOUDS)}  fx ${v(HUD.EFFECTS)}`,
+    6,
+    57,
+  )
+  ctx.fillStyle = v(HUD.LONG_FRAMES) > 0 ? "#ffb4b4" : "#ffffff"
+  ctx.fillText(
+    `long ${v(HUD.LONG_FRAMES)}  commits ${v(HUD.COMMITS)} (${v(HUD.COMMITS_PER_SEC).toFixed(0)}/s)`,
+    6,
+    70,
+  )
+}
+
+// Dashed boundary line, centered in a BOUNDARY_LAYER_W layer
+function drawLevelBoundary(ctx: LayerContext) {
+  const x = BOUNDARY_LAYER_W / 2
+  ctx.strokeStyle = "#ffffff"
+  ctx.lineWidth = 3
+  ctx.globalAlpha = 0.8
+  ctx.setLineDash([10, 5])
+  ctx.beginPath()
+  ctx.moveTo(x, 0)
+  ctx.lineTo(x, CANVAS_H)
+  ctx.stroke()
+}
+
+export class GameRenderer implements FrameRenderer {
+  private sprites: RenderSprites = {
+    character: null,
+    fireState: null,
+    dead: null,
+    cloud: null,
+    fire: null,
+    drop: null,
+    coin: null,
+  }
+  private clock = new AnimationClock()
+  private platformLayers: LayerCache<number> // Keyed by rounded platform width
+  private boundaryLayer: LayerCache<number> // The one dashed line layer, key 0
+  private hudLayer: LayerCache<number> // Latest HUD panel, keyed by HUD version
+  private numberTags: LayerCache<number> // Keyed by tag width (whole CSS px)
+  // Text is blitted from glyph atlases; no fillText or font switches per frame
+  private digits: GlyphAtlas
+  private levelText: GlyphAtlas
+  private effectText: GlyphAtlas
+  private dollar: GlyphAtlas
+  private levelLabels: string[] = [] // "LEVEL n" by level, built once each
+  private frame = new Float64Array(1024)
+
+  constructor(
+    private ctx: LayerContext,
+    pixelRatio: number,
+  ) {
+    // HiDPI: the backing store is pixelRatio x the CSS size
+    ctx.setTransform(pixelRatio, 0, 0, pixelRatio, 0, 0)
+    ctx.imageSmoothingEnabled = false
+    // Disable anti-aliasing for better mobile performance
+    ctx.imageSmoothingQuality = "low"
+    this.platformLayers = new LayerCache(pixelRatio)
+    this.boundaryLayer = new LayerCache(pixelRatio, 1)
+    this.hudLayer = new LayerCache(pixelRatio, 1)
+    this.numberTags = new LayerCache(pixelRatio, 32)
+    this.digits = new GlyphAtlas(pixelRatio, "0123456789", {
+      font: `bold 18px ${TEXT_FONT}`,
+      size: 18,
+      fill: "#000000",
+    })
+    this.levelText = new GlyphAtlas(pixelRatio, "LEV 0123456789", {
+      font: `bold 16px ${TEXT_FONT}`,
+      size: 16,
+      fill: "#ffffff",
+    })
+    this.effectText = new GlyphAtlas(pixelRatio, "+1", {
+      font: `bold 10px ${TEXT_FONT}`,
+      size: 10,
+      fill: "#ffffff",
+      stroke: "#000000",
+      lineWidth: 2,
+    })
+    this.dollar = new GlyphAtlas(pixelRatio, "$", {
+      font: `${COIN_GLYPH_SIZE}px ${TEXT_FONT}`,
+      size: COIN_GLYPH_SIZE,
+      fill: "#8b4513",
+    })
+  }
+
+  setSprites(sprites: Partial<RenderSprites>) {
+    Object.assign(this.sprites, sprites)
+  }
+
+  acquireFrame(capacity: number) {
+    if (this.frame.length < capacity) this.frame = new Float64Array(capacity * 2)
+    return this.frame
+  }
+
+  // Re-rasterize the glyph atlases right away, so the web font is in place
+  // before the next frame needs it
+  clearTextLayers() {
+    this.hudLayer.clear()
+    for (const atlas of [this.digits, this.levelText, this.effectText, this.dollar]) {
+      atlas.clear()
+      atlas.prepare()
+    }
+  }
+
+  draw(frame: Float64Array) {
+    const { ctx, sprites } = this
+    const cameraX = frame[F.CAMERA_X]
+    const cameraY = frame[F.CAMERA_Y]
+    this.clock.tick(frame[F.CLOCK_MS])
+
+    let o = F.HEADER
+    const platformsAt = o
+    o += frame[F.PLATFORMS] * PLATFORM_RECORD
+    const coinsAt = o
+    o += frame[F.COINS] * COIN_RECORD
+    const cloudsAt = o
+    o += frame[F.CLOUDS] * CLOUD_RECORD
+    const boundariesAt = o
+    o += frame[F.BOUNDARIES] * BOUNDARY_RECORD
+    const effectsAt = o
+    o += frame[F.EFFECTS] * EFFECT_RECORD
+    const hudAt = o
+
+    // Background with level-based colors - draw segments between boundaries
+    ctx.imageSmoothingEnabled = false
+    const boundaryCount = frame[F.BOUNDARIES]
+    if (boundaryCount > 0) {
+      // Draw segment before first boundary
+      const firstLevel = frame[boundariesAt + 1]
+      ctx.fillStyle = getLevelBackgroundColor(firstLevel - 1)
+      const firstSegmentWidth = Math.max(0, frame[boundariesAt] - cameraX)
+      ctx.fillRect(0, 0, firstSegmentWidth, CANVAS_H)
+
+      // Draw segments between boundaries (kept sorted by x)
+      for (let i = 0; i < boundaryCount; i++) {
+        const b = boundariesAt + i * BOUNDARY_RECORD
+        ctx.fillStyle = getLevelBackgroundColor(frame[b + 1])
+        const segmentStartX = frame[b] - cameraX
+        const segmentWidth =
+          i + 1 < boundaryCount ? frame[b + BOUNDARY_RECORD] - frame[b] : CANVAS_W - segmentStartX + 100
+        ctx.fillRect(segmentStartX, 0, segmentWidth, CANVAS_H)
+      }
+    } else {
+      // No boundaries yet, use current level color
+      ctx.fillStyle = getLevelBackgroundColor(frame[F.LEVEL])
+      ctx.fillRect(0, 0, CANVAS_W, CANVAS_H)
+    }
+
+    // Camera
+    ctx.save()
+    ctx.translate(-cameraX, -cameraY)
+
+    // Draw level boundary lines
+    for (let i = 0; i < boundaryCount; i++) {
+      const b = boundariesAt + i * BOUNDARY_RECORD
+      const x = frame[b]
+      if (x > cameraX - 50 && x < cameraX + CANVAS_W + 50) {
+        const layer =
+          this.boundaryLayer.get(0) ??
+          this.boundaryLayer.render(0, BOUNDARY_LAYER_W, CANVAS_H, drawLevelBoundary)
+        ctx.drawImage(layer, x - BOUNDARY_LAYER_W / 2, cameraY, BOUNDARY_LAYER_W, CANVAS_H)
+
+        // Level indicator text
+        ctx.globalAlpha = 0.9
+        this.levelText.drawString(ctx, this.levelLabel(frame[b + 1]), x, cameraY + 25, "center")
+        ctx.globalAlpha = 1
+      }
+    }
+
+    // Clouds
+    if (sprites.cloud && sprites.cloud.length >= 2) {
+      for (let i = 0; i < frame[F.CLOUDS]; i++) {
+        const c = cloudsAt + i * CLOUD_RECORD
+        const cloudImage = sprites.cloud[frame[c + 5] - 1] // type 1 -> index 0, type 2 -> index 1
+        ctx.globalAlpha = frame[c + 4]
+        ctx.drawImage(cloudImage, frame[c], frame[c + 1], frame[c + 2], frame[c + 3])
+      }
+      ctx.globalAlpha = 1
+    }
+
+    // Animation frames derived from the rAF timestamp (no React state)
+    const fireFrame = this.clock.frame("platformFire")
+
+    // Platforms and platform fires
+    for (let i = 0; i < frame[F.PLATFORMS]; i++) {
+      const p = platformsAt + i * PLATFORM_RECORD
+      const x = frame[p]
+      const y = frame[p + 1]
+      const width = frame[p + 2]
+      const height = frame[p + 3]
+      const flags = frame[p + 4]
+      const itemsUp = (flags & PLATFORM_UP) !== 0
+
+      // Stylized platform (grass + fringe + dirt), rasterized once per width
+      const layerWidth = Math.round(width)
+      const layerHeight = PLATFORM_GRASS_H + PLATFORM_DIRT_H
+      const platformLayer =
+        this.platformLayers.get(layerWidth) ??
+        this.platformLayers.render(layerWidth, layerWidth, layerHeight, (layerCtx) =>
+          drawStyledPlatform(layerCtx, 0, PLATFORM_GRASS_H, layerWidth),
+        )
+      ctx.drawImage(platformLayer, x, y - PLATFORM_GRASS_H, width, layerHeight)
+
+      // Platform fire drawing
+      if (flags & PLATFORM_FIRE && sprites.fire) {
+        const fireWidth = 35 // 30% bigger (27 * 1.3)
+        const fireHeight = 42 // 30% bigger (32 * 1.3)
+
+        // Fire above platform (upright) or below it (upside down)
+        const fireY = itemsUp ? y - fireHeight - 1 : y + height + 1
+
+        // Render single centered fire for all platforms
+        const centerX = x + (width - fireWidth) / 2
+
+        // If fire is below platform, flip it vertically
+        if (!itemsUp) {
+          ctx.save()
+          ctx.translate(centerX + fireWidth / 2, fireY + fireHeight / 2)
+          ctx.scale(1, -1)
+          ctx.drawImage(sprites.fire[fireFrame], -fireWidth / 2, -fireHeight / 2, fireWidth, fireHeight)
+          ctx.restore()
+        } else {
+          ctx.drawImage(sprites.fire[fireFrame], centerX, fireY, fireWidth, fireHeight)
+        }
+      }
+
+      // Platform drop drawing
+      if (flags & PLATFORM_DROP && sprites.drop) {
+        const dropWidth = 42
+        const dropHeight = 42
+        const dropY = itemsUp ? y - dropHeight - 1 : y + height + 1
+        const dropX = x + width - dropWidth - 5
+
+        // Render drop normally (not flipped) for both above and below platform
+        ctx.drawImage(sprites.drop, dropX, dropY, dropWidth, dropHeight)
+      }
+    }
+
+    // Coins (collectibles)
+    for (let i = 0; i < frame[F.COINS]; i++) {
+      const c = coinsAt + i * COIN_RECORD
+      const x = frame[c]
+      const y = frame[c + 1]
+      // Per-coin phase to avoid synchronous flipping (stable from position)
+      const phase = Math.floor(x * 0.07 + y * 0.11) & 3 // 0..3
+      const coinFrame = this.clock.frame("coin", phase)
+      if (sprites.coin && sprites.coin[coinFrame]) {
+        ctx.drawImage(sprites.coin[coinFrame], x, y, frame[c + 2], frame[c + 3])
+      } else {
+        // Fallback to programmatic drawing if images aren't loaded
+        drawCoin(ctx, this.dollar, x, y, frame[c + 2], frame[c + 3], coinFrame)
+      }
+    }
+
+    // Coin effects
+    for (let i = 0; i < frame[F.EFFECTS]; i++) {
+      const e = effectsAt + i * EFFECT_RECORD
+      const progress = frame[e + 2]
+      const alpha = 1 - progress // fade out
+      const scale = 0.5 + (1 - progress) * 0.5 // shrink as it moves
+
+      ctx.save()
+      ctx.globalAlpha = alpha
+      ctx.translate(frame[e], frame[e + 1])
+      ctx.scale(scale, scale)
+
+      // Draw a small golden coin
+      ctx.fillStyle = "#ffd700"
+      ctx.strokeStyle = "#b8860b"
+      ctx.lineWidth = 1
+      ctx.beginPath()
+      ctx.arc(0, 0, 6, 0, Math.PI * 2)
+      ctx.fill()
+      ctx.stroke()
+
+      // Draw +1 text
+      this.effectText.drawString(ctx, "+1", 0, -12, "center")
+
+      ctx.restore()
+    }
+
+    this.drawPlayer(frame)
+    ctx.restore()
+
+    if (frame[F.PLATFORM_NUMBERS]) this.drawPlatformNumbers(frame, platformsAt)
+
+    // Performance HUD (screen space), re-rasterized only when republished
+    if (frame[F.HUD] > 0) {
+      const version = frame[hudAt + HUD.VERSION]
+      const layer =
+        this.hudLayer.get(version) ??
+        this.hudLayer.render(version, HUD_W, HUD_H, (layerCtx) => drawPerfHud(layerCtx, frame, hudAt))
+      ctx.drawImage(layer, 6, 6, HUD_W, HUD_H)
+    }
+  }
+
+  // The same string every frame, so the label-layer lookup allocates nothing
+  private levelLabel(level: number) {
+    let label = this.levelLabels[level]
+    if (label === undefined) label = this.levelLabels[level] = `LEVEL ${level}`
+    return label
+  }
+
+  // Platform ids along the bottom edge, centered under their platforms
+  private drawPlatformNumbers(frame: Float64Array, platformsAt: number) {
+    const { ctx, digits } = this
+    const cameraX = frame[F.CAMERA_X]
+    const tagY = CANVAS_H - NUMBER_TAG_H - 6
+    for (let i = 0; i < frame[F.PLATFORMS]; i++) {
+      const p = platformsAt + i * PLATFORM_RECORD
+      const id = frame[p + 5]
+      if (id < 0) continue
+      const textWidth = digits.measureInt(id)
+      const tagWidth = Math.ceil(textWidth) + NUMBER_TAG_PAD * 2
+      const tag =
+        this.numberTags.get(tagWidth) ??
+        this.numberTags.render(tagWidth, tagWidth, NUMBER_TAG_H, (layerCtx) => drawNumberTag(layerCtx, tagWidth))
+      const centerX = frame[p] + frame[p + 2] / 2 - cameraX
+      ctx.drawImage(tag, centerX - tagWidth / 2, tagY, tagWidth, NUMBER_TAG_H)
+      digits.drawInt(ctx, id, centerX - textWidth / 2, tagY + NUMBER_TAG_H / 2)
+    }
+  }
+
+  // Player (with dead state, fire-state hurt animation)
+  private drawPlayer(frame: Float64Array) {
+    const { ctx, sprites } = this
+    const playerX = frame[F.PLAYER_X]
+    const playerY = frame[F.PLAYER_Y]
+    const width = frame[F.PLAYER_W]
+    const height = frame[F.PLAYER_H]
+    const isDead = frame[F.IS_DEAD] === 1
+    const timeSinceFireStart = frame[F.FIRE_STATE_MS]
+    const showFireState = timeSinceFireStart >= 0
+
+    let image: ImageBitmap | null = null
+    if (isDead) {
+      // Use DEAD.svg if loaded, otherwise fallback to first frame of normal character
+      image = sprites.dead ?? sprites.character?.[0] ?? null
+    } else if (showFireState && sprites.fireState) {
+      image = sprites.fireState[Math.floor((timeSinceFireStart / 300) % 3)]
+    } else if (sprites.character) {
+      image = sprites.character[this.clock.frame("player")]
+    }
+
+    if (!image && !isDead) {
+      ctx.fillStyle = PLAYER_COLOR
+      ctx.fillRect(playerX, playerY, width, height)
+      return
+    }
+
+    ctx.save()
+    if (frame[F.PULL_DIRECTION] < 0) {
+      ctx.translate(Math.round(playerX + width / 2), Math.round(playerY + height / 2))
+      ctx.scale(1, -1)
+      ctx.translate(-width / 2, -height / 2)
+    } else {
+      ctx.translate(Math.round(playerX), Math.round(playerY))
+    }
+
+    if (!image) {
+      // Last resort fallback: draw a dark red rectangle
+      ctx.fillStyle = "#8B0000"
+      ctx.fillRect(0, 0, width, height)
+    } else if (isDead) {
+      ctx.drawImage(image, 0, 0, width, height)
+    } else {
+      // Apply damage state filter
+      const dropHits = frame[F.DROP_HITS]
+      if (dropHits === 1) {
+        ctx.filter = 'saturate(0.6) brightness(0.8)'
+      } else if (dropHits === 2) {
+        ctx.filter = 'saturate(0) brightness(0.5)'
+      } else {
+        ctx.filter = 'saturate(1.2) brightness(1)'
+      }
+      ctx.drawImage(image, 0, 0, width, height)
+      ctx.filter = 'none'
+    }
+    ctx.restore()
+  }
+}
@@ -0,0 +1,179 @@
+import { GameEngine, type EngineInput } from "./engine"
+
+// Compact binary replays: the seed plus every input change, indexed by
+// simulation tick. Steps are fixed-size, so replaying the records into a
+// fresh engine reproduces the run exactly, on any device and any build
+// whose simulation is unchanged.
+//
+// Layout (little endian):
+//   0   "BRPL" magic
+//   4   u8   format version
+//   5   u8   flags (bit 0: AI mode)
+//   6   u32  seed
+//   10  u32  tick count of the whole run
+//   14  records: varint tick delta, u8 input bits
+
+const MAGIC = 0x4c505242 // "BRPL"
+const VERSION = 2 // Bumped whenever world generation changes (2: streamed chunks)
+const HEADER_SIZE = 14
+const FLAG_AI = 1
+
+export const INPUT_LEFT = 1
+export const INPUT_RIGHT = 2
+export const INPUT_JUMP = 4
+export const INPUT_FLIP = 8 // One-shot gravity flip before the tick's step
+
+const inputBits = (input: EngineInput) =>
+  (input.left ? INPUT_LEFT : 0) | (input.right ? INPUT_RIGHT : 0) | (input.jump ? INPUT_JUMP : 0)
+
+export class ReplayRecorder {
+  private bytes = new Uint8Array(1024)
+  private length = HEADER_SIZE
+  private lastTick = 0
+  private held = 0
+
+  constructor(private seed: number) {}
+
+  // Call before every step: records the held buttons when they change
+  capture(tick: number, input: EngineInput) {
+    const bits = inputBits(input)
+    if (bits !== this.held) {
+      this.held = bits
+      this.write(tick, bits)
+    }
+  }
+
+  // A flip applied between steps, before step `tick`
+  flip(tick: number) {
+    this.write(tick, this.held | INPUT_FLIP)
+  }
+
+  // The run is over after `ticks` steps
+  finish(ticks: number, aiMode: boolean) {
+    const view = new DataView(this.bytes.buffer)
+    view.setUint32(0, MAGIC, true)
+    view.setUint8(4, VERSION)
+    view.setUint8(5, aiMode ? FLAG_AI : 0)
+    view.setUint32(6, this.seed, true)
+    view.setUint32(10, ticks, true)
+    return this.bytes.slice(0, this.length)
+  }
+
+  private write(tick: number, bits: number) {
+    if (this.length + 6 > this.bytes.length) {
+      const grown = new Uint8Array(this.bytes.length * 2)
+      grown.set(this.bytes)
+      this.bytes = grown
+    }
+    let delta = tick - this.lastTick
+    this.lastTick = tick
+    while (delta >= 0x80) {
+      this.bytes[this.length++] = (delta & 0x7f) | 0x80
+      delta >>>= 7
+    }
+    this.bytes[this.length++] = delta
+    this.bytes[this.length++] = bits
+  }
+}
+
+export class ReplayPlayer {
+  readonly seed: number
+  readonly aiMode: boolean
+  readonly ticks: number
+  private offset = HEADER_SIZE
+  private nextTick = -1
+
+  constructor(private bytes: Uint8Array) {
+    const view = new DataView(bytes.buffer, bytes.byteOffset, bytes.byteLength)
+    if (bytes.byteLength < HEADER_SIZE || view.getUint32(0, true) !== MAGIC) {
+      throw new Error("Not a Baron replay")
+    }
+    if (view.getUint8(4) !== VERSION) {
+      throw new Error(`Unsupported replay version ${view.getUint8(4)}`)
+    }
+    this.aiMode = (view.getUint8(5) & FLAG_AI) !== 0
+    this.seed = view.getUint32(6, true)
+    this.ticks = view.getUint32(10, true)
+    this.nextTick = this.readTick(0)
+  }
+
+  // Reset `engine` to the replay's starting state
+  start(engine: GameEngine) {
+    this.offset = HEADER_SIZE
+    this.nextTick = this.readTick(0)
+    engine.reset(this.seed)
+    engine.aiMode = this.aiMode
+    engine.input.left = engine.input.right = engine.input.jump = false
+  }
+
+  // Apply every record for the engine's next step; call before each step
+  apply(engine: GameEngine) {
+    while (this.nextTick === engine.tick) {
+      const bits = this.bytes[this.offset++]
+      engine.input.left = (bits & INPUT_LEFT) !== 0
+      engine.input.right = (bits & INPUT_RIGHT) !== 0
+      engine.input.jump = (bits & INPUT_JUMP) !== 0
+      if (bits & INPUT_FLIP) engine.flip()
+      this.nextTick = this.readTick(this.nextTick)
+    }
+  }
+
+  done(engine: GameEngine) {
+    return engine.ended || engine.tick >= this.ticks
+  }
+
+  // Varint delta from `tick`, or -1 past the last record
+  private readTick(tick: number) {
+    if (this.offset >= this.bytes.length) return -1
+    let delta = 0
+    let shift = 0
+    let byte: number
+    do {
+      byte = this.bytes[this.offset++]
+      delta |= (byte & 0x7f) << shift
+      shift += 7
+    } while (byte & 0x80)
+    return tick + delta
+  }
+}
+
+// Run a whole replay headless (balancing runs, perf regression tests)
+export function simulateReplay(bytes: Uint8Array, engine = new GameEngine()) {
+  const replay = new ReplayPlayer(bytes)
+  replay.start(engine)
+  while (!replay.done(engine)) {
+    replay.apply(engine)
+    engine.step()
+  }
+  return engine
+}
+
+// Simulation steps per benchmark frame: a 60 Hz frame's worth of 120 Hz
+// steps, whatever the display's refresh rate or how late the frame runs
+export const BENCHMARK_STEPS_PER_FRAME = 2
+
+export interface BenchmarkResult {
+  frames: number
+  stepsPerFrame: number
+  meanMs: number
+  p50Ms: number
+  p95Ms: number
+  maxMs: number
+}
+
+// Summarize per-frame times (BENCHMARK_STEPS_PER_FRAME steps + render) of a
+// replay benchmark
+export function summarizeFrameTimes(samples: number[]): BenchmarkResult {
+  const sorted = samples.slice().sort((a, b) => a - b)
+  const at = (q: number) => sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))] ?? 0
+  let total = 0
+  for (let i = 0; i < sorted.length; i++) total += sorted[i]
+  return {
+    frames: sorted.length,
+    stepsPerFrame: BENCHMARK_STEPS_PER_FRAME,
+    meanMs: sorted.length ? total / sorted.length : 0,
+    p50Ms: at(0.5),
+    p95Ms: at(0.95),
+    maxMs: sorted.length ? sorted[sorted.length - 1] : 0,
+  }
+}
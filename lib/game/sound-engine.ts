@@ -0,0 +1,139 @@
+import manifest from "./asset-manifest.json"
+
+// One AudioContext for the whole game. Effects are decoded once into
+// AudioBuffers; each trigger is a throwaway AudioBufferSourceNode + GainNode,
+// which starts on the next audio quantum and can overlap itself (rapid coin
+// pickups). Per-sound voice limits stop the oldest voice when exceeded.
+// Long tracks flagged "stream" in the manifest stay on HTMLAudioElement.
+
+export type SoundId = (typeof manifest.sounds)[number]["id"]
+
+type Voice = { source: AudioBufferSourceNode; gain: GainNode }
+
+const effects = manifest.sounds.filter((sound) => !("stream" in sound && sound.stream))
+
+export class SoundEngine {
+  private context: AudioContext | null = null
+  private master: GainNode | null = null
+  private buffers = new Map<SoundId, AudioBuffer>()
+  private voices = new Map<SoundId, Voice[]>()
+
+  // Created suspended before the first user gesture; unlock() resumes it
+  private getContext() {
+    if (!this.context) {
+      const AudioCtx = window.AudioContext || (window as any).webkitAudioContext
+      this.context = new AudioCtx() as AudioContext
+      this.master = this.context.createGain()
+      this.master.connect(this.context.destination)
+    }
+    return this.context
+  }
+
+  // Fetch and decode every effect in the manifest
+  async load() {
+    const ctx = this.getContext()
+    await Promise.all(
+      effects.map(async (sound) => {
+        try {
+          const response = await fetch(sound.src)
+          const data = await response.arrayBuffer()
+          this.buffers.set(sound.id, await ctx.decodeAudioData(data))
+        } catch (error) {
+          console.error(`Failed to decode sound ${sound.id}:`, error)
+        }
+      }),
+    )
+  }
+
+  // Browser autoplay policy: call from a user gesture
+  unlock() {
+    const ctx = this.getContext()
+    if (ctx.state === "suspended") ctx.resume().catch(() => { /* no-op */ })
+  }
+
+  play(id: SoundId) {
+    const buffer = this.buffers.get(id)
+    if (!buffer || !this.context || !this.master) return
+    const sound = effects.find((s) => s.id === id)!
+
+    // Voice limiting: steal the oldest voice of this sound
+    const active = this.voices.get(id) ?? []
+    while (active.length >= (sound.voices ?? 1)) {
+      const oldest = active.shift()!
+      oldest.source.onended = null
+      try { oldest.source.stop() } catch { /* already stopped */ }
+      oldest.gain.disconnect()
+    }
+
+    const source = this.context.createBufferSource()
+    const gain = this.context.createGain()
+    source.buffer = buffer
+    gain.gain.value = sound.volume
+    source.connect(gain)
+    gain.connect(this.master)
+    const voice = { source, gain }
+    source.onended = () => {
+      const list = this.voices.get(id)
+      const index = list ? list.indexOf(voice) : -1
+      if (index >= 0) list!.splice(index, 1)
+      gain.disconnect()
+    }
+    active.push(voice)
+    this.voices.set(id, active)
+    source.start()
+  }
+
+  stop(id: SoundId) {
+    const active = this.voices.get(id)
+    if (!active) return
+    for (const voice of active) {
+      voice.source.onended = null
+      try { voice.source.stop() } catch { /* already stopped */ }
+      voice.gain.disconnect()
+    }
+    active.length = 0
+  }
+
+  // Gravity flip: three swept oscillators
+  playVortex() {
+    if (!this.context || !this.master) return
+    const ac = this.context
+    const startTime = ac.currentTime
+    const duration = 0.25
+
+    const masterGain = ac.createGain()
+    masterGain.gain.setValueAtTime(0.35, startTime)
+    masterGain.gain.exponentialRampToValueAtTime(0.01, startTime + duration)
+    masterGain.connect(this.master)
+
+    const layers: { type: OscillatorType; gain: number; sweep: [number, number][] }[] = [
+      { type: "sawtooth", gain: 0.25, sweep: [[100, 0], [60, 1]] },
+      { type: "triangle", gain: 0.2, sweep: [[220, 0], [500, 0.3], [180, 1]] },
+      { type: "sine", gain: 0.12, sweep: [[900, 0], [1200, 0.2], [450, 1]] },
+    ]
+    for (const layer of layers) {
+      const osc = ac.createOscillator()
+      const g = ac.createGain()
+      osc.type = layer.type
+      osc.frequency.setValueAtTime(layer.sweep[0][0], startTime)
+      for (const [freq, at] of layer.sweep.slice(1)) {
+        osc.frequency.exponentialRampToValueAtTime(freq, startTime + duration * at)
+      }
+      g.gain.setValueAtTime(layer.gain, startTime)
+      g.gain.exponentialRampToValueAtTime(0.01, startTime + duration)
+      osc.connect(g)
+      g.connect(masterGain)
+      osc.onended = () => masterGain.disconnect()
+      osc.start(startTime)
+      osc.stop(startTime + duration)
+    }
+  }
+
+  dispose() {
+    this.voices.clear()
+    this.buffers.clear()
+    this.context?.close().catch(() => { /* no-op */ })
+    this.context = null
+    this.master = null
+  }
+}
@@ -0,0 +1,170 @@
+import type { ObjectPool } from "./pool"
+
+// X-sorted ring buffer for world entities (platforms, coins, clouds).
+// The world only ever scrolls right: new entities arrive at the high-x end
+// and old ones leave from the low-x end, so eviction is a head bump instead
+// of an array rebuild. Range queries binary-search on x, which keeps
+// per-frame cost proportional to what's near the camera or the player.
+//
+// x and width live in typed-array columns next to the record slots, so
+// searches never touch the records. Records are treated as fixed in x once
+// pushed; move them with translate(). Evicted and compacted records go back
+// to the pool.
+
+export interface Spanned {
+  x: number
+  width: number
+}
+
+export class SpatialIndex<T extends Spanned> {
+  private items: (T | undefined)[]
+  private xs: Float64Array
+  private widths: Float64Array
+  private head = 0 // Slot of the lowest-x item
+  private maxWidth = 0 // Widest item seen, for overlap queries
+  size = 0
+
+  constructor(private pool?: ObjectPool<T>, capacity = 64) {
+    this.items = new Array(capacity)
+    this.xs = new Float64Array(capacity)
+    this.widths = new Float64Array(capacity)
+  }
+
+  static from<T extends Spanned>(items: T[], pool?: ObjectPool<T>) {
+    const index = new SpatialIndex<T>(pool, Math.max(64, items.length * 2))
+    index.pushAll(items)
+    return index
+  }
+
+  // i-th item in x order
+  get(i: number) {
+    return this.items[this.slot(i)]!
+  }
+
+  // Append an item. Generators emit in (almost) x order; a late item is
+  // moved back to its sorted slot.
+  push(item: T) {
+    if (this.size === this.items.length) this.grow()
+    let i = this.size++
+    while (i > 0 && this.xs[this.slot(i - 1)] > item.x) {
+      this.move(i - 1, i)
+      i--
+    }
+    this.set(i, item)
+    this.maxWidth = Math.max(this.maxWidth, item.width)
+  }
+
+  pushAll(items: T[]) {
+    for (let i = 0; i < items.length; i++) this.push(items[i])
+  }
+
+  // Drop items starting at or before x from the low end
+  evictBefore(x: number) {
+    while (this.size > 0 && this.xs[this.head] <= x) {
+      this.pool?.release(this.items[this.head]!)
+      this.items[this.head] = undefined
+      this.head = (this.head + 1) % this.items.length
+      this.size--
+    }
+  }
+
+  // Remove items failing `keep` without reordering the rest
+  compact(keep: (item: T) => boolean) {
+    let write = 0
+    for (let read = 0; read < this.size; read++) {
+      const item = this.get(read)
+      if (keep(item)) {
+        if (write !== read) this.move(read, write)
+        write++
+      } else {
+        this.pool?.release(item)
+      }
+    }
+    for (let i = write; i < this.size; i++) this.items[this.slot(i)] = undefined
+    this.size = write
+  }
+
+  // Shift every item (clouds drift as a group, so order is preserved)
+  translate(dx: number) {
+    for (let i = 0; i < this.size; i++) {
+      const slot = this.slot(i)
+      this.xs[slot] += dx
+      this.items[slot]!.x = this.xs[slot]
+    }
+  }
+
+  clear() {
+    this.compact(() => false)
+    this.head = 0
+  }
+
+  // First index whose item starts at or after x
+  lowerBound(x: number) {
+    let lo = 0
+    let hi = this.size
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1
+      if (this.xs[this.slot(mid)] < x) lo = mid + 1
+      else hi = mid
+    }
+    return lo
+  }
+
+  // First index whose item starts after x
+  upperBound(x: number) {
+    let lo = 0
+    let hi = this.size
+    while (lo < hi) {
+      const mid = (lo + hi) >> 1
+      if (this.xs[this.slot(mid)] <= x) lo = mid + 1
+      else hi = mid
+    }
+    return lo
+  }
+
+  // [rangeStart(minX), lowerBound(maxX)) holds every item that may overlap
+  // [minX, maxX). Callers still check `x + width > minX` near the start.
+  rangeStart(minX: number) {
+    return this.lowerBound(minX - this.maxWidth)
+  }
+
+  forEach(fn: (item: T) => void) {
+    for (let i = 0; i < this.size; i++) fn(this.get(i))
+  }
+
+  private slot(i: number) {
+    return (this.head + i) % this.items.length
+  }
+
+  private set(i: number, item: T) {
+    const slot = this.slot(i)
+    this.items[slot] = item
+    this.xs[slot] = item.x
+    this.widths[slot] = item.width
+  }
+
+  private move(from: number, to: number) {
+    const src = this.slot(from)
+    const dst = this.slot(to)
+    this.items[dst] = this.items[src]
+    this.xs[dst] = this.xs[src]
+    this.widths[dst] = this.widths[src]
+  }
+
+  private grow() {
+    const capacity = this.items.length * 2
+    const items: (T | undefined)[] = new Array(capacity)
+    const xs = new Float64Array(capacity)
+    const widths = new Float64Array(capacity)
+    for (let i = 0; i < this.size; i++) {
+      const slot = this.slot(i)
+      items[i] = this.items[slot]
+      xs[i] = this.xs[slot]
+      widths[i] = this.widths[slot]
+    }
+    this.items = items
+    this.xs = xs
+    this.widths = widths
+    this.head = 0
+  }
+}
@@ -0,0 +1,57 @@
+import manifest from "./asset-manifest.json"
+import built from "./built-sprite-sets.json"
+
+// Pre-rasterized sprite sets (see build_sprites.py). Each sprite is emitted at
+// its exact canvas draw size for every scale in the manifest; only the sets
+// listed in built-sprite-sets.json exist, the rest load the source SVG.
+
+export type SpriteId = (typeof manifest.sprites)[number]["id"]
+
+export const SPRITE_SCALES: number[] = manifest.scales
+const BUILT_SCALES: number[] = built.scales
+
+const spritesById = new Map(manifest.sprites.map((sprite) => [sprite.id, sprite]))
+
+// Canvas backing-store ratio (1.0 on mobile for performance, at most 1.5
+// elsewhere, so the manifest's scales stop at 2)
+export function getCanvasPixelRatio() {
+  const rawDpr = window.devicePixelRatio || 1
+  const isMobileDevice = window.innerWidth < 768
+  return isMobileDevice ? 1.0 : Math.min(1.5, Math.max(1, rawDpr))
+}
+
+// Smallest set that covers the backing store (1.5 → 2x), largest otherwise
+export function pickSpriteScale(pixelRatio: number) {
+  for (const scale of SPRITE_SCALES) {
+    if (scale >= pixelRatio) return scale
+  }
+  return SPRITE_SCALES[SPRITE_SCALES.length - 1]
+}
+
+export function hasSpriteSet(scale: number) {
+  return BUILT_SCALES.includes(scale)
+}
+
+export function getSpriteUrl(id: SpriteId, scale: number) {
+  return `${manifest.spriteDir}/${scale}x/${id}.png`
+}
+
+export function getSpriteSourceUrl(id: SpriteId) {
+  return spritesById.get(id)!.src
+}
+
+export function loadImage(url: string): Promise<HTMLImageElement> {
+  return new Promise((resolve, reject) => {
+    const img = new Image()
+    img.crossOrigin = "anonymous"
+    img.onload = () => resolve(img)
+    img.onerror = (e) => reject(e)
+    img.src = url
+  })
+}
+
+// Load the PNG for this scale when its set is built, the source SVG otherwise
+export function loadSpriteImage(id: SpriteId, scale: number) {
+  if (!hasSpriteSet(scale)) return loadImage(getSpriteSourceUrl(id))
+  return loadImage(getSpriteUrl(id, scale)).catch(() => loadImage(getSpriteSourceUrl(id)))
+}
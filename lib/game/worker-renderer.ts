@@ -0,0 +1,92 @@
+import { GameRenderer, type FrameRenderer, type RenderSprites } from "./renderer"
+import type { RenderWorkerReply, RenderWorkerRequest } from "./render-worker"
+
+// Optional off-main-thread drawing. With `?renderer=worker` the canvas is
+// handed to a worker through transferControlToOffscreen and the game loop
+// only packs frames; React, the header and the dev overlays can no longer
+// stall a draw. Everywhere else the same GameRenderer draws inline.
+
+const MAX_FRAMES_IN_FLIGHT = 2 // Beyond this the worker is behind: drop frames
+
+export class WorkerRenderer implements FrameRenderer {
+  private worker: Worker
+  private free: Float64Array[] = []
+  private inFlight = 0
+
+  constructor(canvas: OffscreenCanvas, pixelRatio: number) {
+    this.worker = new Worker(new URL("./render-worker.ts", import.meta.url))
+    this.worker.onmessage = (event: MessageEvent<RenderWorkerReply>) => {
+      this.inFlight--
+      this.free.push(event.data.frame)
+    }
+    this.post({ type: "init", canvas, pixelRatio }, [canvas])
+  }
+
+  private post(message: RenderWorkerRequest, transfer: Transferable[] = []) {
+    this.worker.postMessage(message, transfer)
+  }
+
+  setSprites(sprites: Partial<RenderSprites>) {
+    // ImageBitmaps are cloned: the asset loader still owns the originals
+    this.post({ type: "sprites", sprites })
+  }
+
+  acquireFrame(capacity: number) {
+    for (let i = this.free.length - 1; i >= 0; i--) {
+      const frame = this.free[i]
+      if (frame.length >= capacity) {
+        this.free[i] = this.free[this.free.length - 1]
+        this.free.pop()
+        return frame
+      }
+    }
+    return new Float64Array(capacity * 2)
+  }
+
+  draw(frame: Float64Array) {
+    if (this.inFlight >= MAX_FRAMES_IN_FLIGHT) {
+      this.free.push(frame)
+      return
+    }
+    this.inFlight++
+    this.post({ type: "frame", frame }, [frame.buffer])
+  }
+
+  clearTextLayers() {
+    this.post({ type: "fonts-loaded" })
+  }
+}
+
+function prefersWorkerRenderer() {
+  return (
+    new URLSearchParams(window.location.search).get("renderer") === "worker" &&
+    typeof OffscreenCanvas !== "undefined" &&
+    "transferControlToOffscreen" in HTMLCanvasElement.prototype
+  )
+}
+
+// Control of a canvas can be transferred only once, and StrictMode runs
+// effects twice, so each canvas keeps the renderer it was first given.
+const renderers = new WeakMap<HTMLCanvasElement, FrameRenderer>()
+
+// Size the canvas backing store for `pixelRatio` and create its renderer
+export function createFrameRenderer(canvas: HTMLCanvasElement, width: number, height: number, pixelRatio: number) {
+  const existing = renderers.get(canvas)
+  if (existing) return existing
+
+  // Set backing resolution, keep CSS size constant
+  canvas.width = width * pixelRatio
+  canvas.height = height * pixelRatio
+  canvas.style.width = `${width}px`
+  canvas.style.height = `${height}px`
+
+  let renderer: FrameRenderer | null = null
+  if (prefersWorkerRenderer()) {
+    renderer = new WorkerRenderer(canvas.transferControlToOffscreen(), pixelRatio)
+  } else {
+    const ctx = canvas.getContext("2d")
+    if (ctx) renderer = new GameRenderer(ctx, pixelRatio)
+  }
+  if (renderer) renderers.set(canvas, renderer)
+  return renderer
+}
@@ -0,0 +1,122 @@
+import type { SpatialIndex } from "./spatial-index"
+
+// World geometry and entity records shared by the simulation and the
+// renderer (main thread or worker).
+
+export const CANVAS_W = 390
+export const CANVAS_H = 640
+export const TOP_BOUND = 0
+export const BOTTOM_BOUND = CANVAS_H
+export const PLATFORM_GRASS_H = 8 // Visual grass cap above the collision rect
+export const PLATFORM_DIRT_H = 14 // Visual dirt body below the grass
+
+export interface Player {
+  x: number
+  y: number
+  width: number
+  height: number
+  velocityX: number
+  velocityY: number
+  onGround: boolean
+  wasOnGround: boolean
+  color: string
+}
+
+export interface Platform {
+  x: number
+  y: number
+  width: number
+  height: number
+  color: string
+  passed?: boolean
+  hasFire?: boolean
+  hasDrop?: boolean
+  dropDirection?: 'up' | 'down'
+  id?: number // Platform number for debugging
+}
+
+export interface Cloud {
+  x: number
+  y: number
+  width: number
+  height: number
+  opacity: number
+  type: 1 | 2 | 3 // 1 = cloud.svg, 2 = CLOUD_2.svg, 3 = CLOUD_3.svg
+}
+
+export interface Coin {
+  x: number
+  y: number
+  width: number
+  height: number
+  collected: boolean
+}
+
+export interface CoinEffect {
+  x: number
+  y: number
+  startX: number
+  startY: number
+  startTime: number
+  duration: number
+}
+
+export interface LevelBoundary {
+  x: number
+  level: number
+}
+
+export interface GameState {
+  player: Player
+  platforms: SpatialIndex<Platform>
+  clouds: SpatialIndex<Cloud>
+  camera: { x: number; y: number }
+
+  // Linear Pull Gravity (constant velocity)
+  pullSpeed: number // Constant velocity toward gravity direction
+  pullDirection: number // ±1 (1 for down, -1 for up)
+
+  // Runtime
+  timeMs: number // Simulated time since the run started
+
+  gameSpeed: number
+  score: number // Platforms passed + coins collected
+  lives: number
+  platformsPassed: number
+  lastPlatformX: number
+  nextPlatformId: number // ID of the first platform not streamed in yet
+  lastCloudX: number
+  invulnerable: boolean
+  invulnerableTime: number // Simulated time the invulnerability ends
+  fireStateStartTime: number // Simulated time a flame was touched, 0 when none
+  dropHitCount: number
+  isDead: boolean
+  deadStartTime: number
+  level: number
+  lastLandTime: number // Track last landing sound time for cooldown
+  checkpointFlag?: { x: number; y: number; width: number; height: number; passed: boolean }
+
+  // Collectibles
+  coins: SpatialIndex<Coin>
+  coinEffects: CoinEffect[]
+
+  // Level boundaries
+  levelBoundaries: LevelBoundary[]
+}
+
+// Blank records for the entity pools
+export const createPlatform = (): Platform => ({
+  x: 0, y: 0, width: 0, height: 0, color: "", passed: false,
+  hasFire: false, hasDrop: false, dropDirection: 'down', id: 0,
+})
+export const createCoin = (): Coin => ({ x: 0, y: 0, width: 0, height: 0, collected: false })
+export const createCloud = (): Cloud => ({ x: 0, y: 0, width: 0, height: 0, opacity: 0, type: 1 })
+export const createCoinEffect = (): CoinEffect => ({ x: 0, y: 0, startX: 0, startY: 0, startTime: 0, duration: 0 })
+
+// Positions before the latest simulation step, for render interpolation
+export interface StepSnapshot {
+  playerX: number
+  playerY: number
+  cameraX: number
+  cloudDrift: number // How far clouds moved during the latest step
+}
@@ -0,0 +1,110 @@
+// Generated by generate_service_worker.py - do not edit by hand
+const VERSION = "7a550be3dc6f"
+const PRECACHE = `coal-jack-precache-${VERSION}`
+const RUNTIME = `coal-jack-runtime-${VERSION}`
+const PRECACHE_URLS = [
+  "/",
+  "/Character_1.svg",
+  "/character_1.5.svg",
+  "/Character_2.svg",
+  "/Drop.svg",
+  "/COIN-1.svg",
+  "/COIN-2.svg",
+  "/COIN-3.svg",
+  "/COIN-4.svg",
+  "/coin-collect-sound.wav",
+  "/land-sound.wav"
+]
+const LAZY_URLS = new Set([
+  "/CLOUD_2.svg",
+  "/CLOUD_3.svg",
+  "/DEAD.svg",
+  "/ON_FIRE_1.svg",
+  "/ON_FIRE_2.svg",
+  "/ON_FIRE_3.svg",
+  "/background-music.mp3",
+  "/cloud.svg",
+  "/drop-hit-sound.mp3",
+  "/fire_1.svg",
+  "/fire_2.svg",
+  "/flame-touch-sound.mp3",
+  "/game-over-sound.wav",
+  "/level-up-sound.wav",
+  "/yeah-boy-02.mp3"
+])
+
+self.addEventListener("install", (event) => {
+  event.waitUntil(
+    caches.open(PRECACHE).then((cache) => cache.addAll(PRECACHE_URLS)).then(() => self.skipWaiting()),
+  )
+})
+
+// Versioned eviction: drop every cache this version doesn't own
+self.addEventListener("activate", (event) => {
+  event.waitUntil(
+    caches.keys()
+      .then((keys) => Promise.all(
+        keys
+          .filter((key) => key.startsWith("coal-jack-") && key !== PRECACHE && key !== RUNTIME)
+          .map((key) => caches.delete(key)),
+      ))
+      .then(() => self.clients.claim()),
+  )
+})
+
+const isCacheable = (url) =>
+  url.origin === self.location.origin &&
+  (LAZY_URLS.has(url.pathname) ||
+    url.pathname.startsWith("/_next/static/") ||
+    url.pathname.startsWith("/sprites/") ||
+    url.pathname.startsWith("/fonts/"))
+
+const cacheFirst = async (request) => {
+  const cached = await caches.match(request, { ignoreSearch: true })
+  if (cached) return cached
+  const response = await fetch(request)
+  if (response.ok) {
+    const cache = await caches.open(RUNTIME)
+    cache.put(request, response.clone())
+  }
+  return response
+}
+
+// Pages: network first so deploys show up, cached shell when offline
+const networkFirst = async (request) => {
+  try {
+    const response = await fetch(request)
+    if (response.ok) {
+      const cache = await caches.open(RUNTIME)
+      cache.put(request, response.clone())
+    }
+    return response
+  } catch (error) {
+    const cached = (await caches.match(request)) || (await caches.match("/"))
+    if (cached) return cached
+    throw error
+  }
+}
+
+self.addEventListener("fetch", (event) => {
+  const { request } = event
+  if (request.method !== "GET") return
+  const url = new URL(request.url)
+  if (request.mode === "navigate") {
+    event.respondWith(networkFirst(request))
+  } else if (PRECACHE_URLS.includes(url.pathname) || isCacheable(url)) {
+    event.respondWith(cacheFirst(request))
+  }
+})
+
+// The page posts the chunks it loaded before this worker took control
+self.addEventListener("message", (event) => {
+  if (event.data?.type !== "warm") return
+  event.waitUntil(
+    caches.open(RUNTIME).then((cache) =>
+      Promise.all(event.data.urls.map((url) =>
+        cache.match(url).then((hit) => hit || cache.add(url).catch(() => undefined)),
+      )),
+    ),
+  )
+})
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Run source patch scripts with a hot-path budget check after each one
+
+The patch scripts (fix_*.py, add_*.py, ...) rewrite Baron-web.tsx and the
+game modules with plain string replacement. This runner:
+
+- runs each script in order from the repo root
+- reports scripts that changed nothing (a replacement whose old text no
+  longer matches fails silently otherwise)
+- runs hot_path_lint.py's budget check; a patch that adds logging,
+  allocations, closures or React updates to the per-frame path is rolled
+  back and the run stops
+
+Usage:
+    python3 run_patch.py fix_drop_flip.py
+    python3 run_patch.py add_dead_state_debug.py --no-budget   # debugging only
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+
+from hot_path_lint import BUDGET_FILE, HOT_PATHS, check_budget
+
+# Files the patch scripts edit; restored when a patch fails
+PATCHED_FILES = ['Baron-web.tsx'] + [path for path in HOT_PATHS if path != 'Baron-web.tsx']
+
+
+def snapshot():
+    files = {}
+    for path in PATCHED_FILES:
+        if os.path.exists(path):
+            with open(path) as f:
+                files[path] = f.read()
+    return files
+
+
+def restore(files):
+    for path, content in files.items():
+        with open(path, 'w') as f:
+            f.write(content)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('scripts', nargs='+', help='patch scripts to run, in order')
+    parser.add_argument('--no-budget', action='store_true', help=f'skip the {BUDGET_FILE} check')
+    args = parser.parse_args()
+
+    for script in args.scripts:
+        before = snapshot()
+        result = subprocess.run([sys.executable, script])
+        if result.returncode != 0:
+            restore(before)
+            sys.exit(f"❌ {script} failed (exit {result.returncode}); files restored")
+
+        changed = [path for path, content in snapshot().items() if before.get(path) != content]
+        if not changed:
+            print(f"⚠️  {script}: no changes (its old text no longer matches?)")
+            continue
+
+        if not args.no_budget:
+            problems = check_budget()
+            if problems:
+                restore(before)
+                print(f"❌ {script} puts the hot path over budget; files restored:")
+                for problem in problems:
+                    print(f"  - {problem}")
+                sys.exit(1)
+        print(f"✅ {script}: {', '.join(changed)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+"""
+Simulate streamed platform generation at scale and check its constraints
+
+A vectorized NumPy port of GameEngine.generatePlatforms as used for streamed
+chunks (12 platforms, difficulty from the chunk's first id, see engine.ts).
+
+- Random stream: SeededRandom is an LCG with full period 233280, so every
+  chunk starts somewhere on one cycle. The cycle is precomputed once, and a
+  chunk's draws are a slice of it. With enough platforms every start offset
+  is enumerated, so the statistics cover every chunk the game can produce
+  (coin draws between chunks only decide which offset a run lands on).
+- Rules: widths, zones, the 64 px bound clamps, level2Bonus, the
+  minVSpace = 2 x runner height fix-up and the 200 px seam between chunks
+- Report per level: bound clamps, spacing violations left after the
+  fix-up, horizontal gap and vertical step distributions, reachability
+  under the Math.pow(1.3, level - 1) speed curve, and generation cost
+
+Reachability is a simplified flight model. From a flip on platform i the
+player crosses |dy| with the flip pull (8.5 px/frame plus 0.5 px/frame^2),
+moving right at gameSpeed plus at most +3.2 / -2.4 px/frame of input. The
+next platform is reachable if some take-off point on platform i lands on it.
+
+Usage:
+    python3 simulate_generation.py                      # 10^7 platforms, levels 1-8
+    python3 simulate_generation.py --platforms 1e6 --levels 12
+
+Requires numpy (pip install numpy).
+"""
+
+import argparse
+import math
+import time
+
+try:
+    import numpy as np
+except ImportError:
+    raise SystemExit("❌ numpy is required: pip install numpy")
+
+# LCG (engine.ts SeededRandom)
+LCG_A = 9301
+LCG_C = 49297
+LCG_M = 233280
+
+# Generation constants (engine.ts / world.ts)
+CANVAS_H = 640
+TOP_BOUND = 0
+BOTTOM_BOUND = CANVAS_H
+RUNNER_HEIGHT = 33
+MIN_SPACING = RUNNER_HEIGHT * 2
+PLATFORM_HEIGHT = 6
+CHUNK_PLATFORMS = 12
+DRAWS_PER_PLATFORM = 5
+FIRST_CHUNK_ID = 27  # Platforms 1-26 are the (baked) opening level
+DIFFICULTY_LAG = 6
+CHUNK_SEAM = 200  # lastPlatformX = tail.x + tail.width + 200
+
+# Player physics (per 60 fps frame)
+BASE_SPEED = 2.5
+SPEED_PER_LEVEL = 1.3
+PULL_SPEED = 8.5
+PULL_ACCEL = 0.5
+MAX_RIGHT = 3.2
+MAX_LEFT = 2.4
+
+BATCH_CHUNKS = 1 << 16
+
+
+def lcg_cycle():
+    """Every state of the LCG in sequence order, and each state's index"""
+    cycle = np.empty(LCG_M, dtype=np.int64)
+    block = 1024
+    state = 0
+    for i in range(block):
+        cycle[i] = state
+        state = (state * LCG_A + LCG_C) % LCG_M
+    # Jump ahead a whole block at once: x[n + block] = A * x[n] + C (mod m)
+    jump_a, jump_c = 1, 0
+    for _ in range(block):
+        jump_a, jump_c = (jump_a * LCG_A) % LCG_M, (jump_c * LCG_A + LCG_C) % LCG_M
+    for start in range(block, LCG_M, block):
+        previous = cycle[start - block:start]
+        end = min(start + block, LCG_M)
+        cycle[start:end] = ((previous * jump_a + jump_c) % LCG_M)[:end - start]
+    position = np.empty(LCG_M, dtype=np.int64)
+    position[cycle] = np.arange(LCG_M)
+    return cycle, position
+
+
+def level_of(platform_id):
+    return (platform_id - 1) // 20 + 1
+
+
+def game_speed(level):
+    return BASE_SPEED * SPEED_PER_LEVEL ** (level - 1)
+
+
+def flight_frames(dy):
+    """Frames to cross |dy| after a flip: dy = v0 t + a t^2 / 2"""
+    return (-PULL_SPEED + np.sqrt(PULL_SPEED ** 2 + 2 * PULL_ACCEL * dy)) / PULL_ACCEL
+
+
+def generate_chunks(cycle, offsets, start_id):
+    """x, y, width (chunks x 12) for chunks whose draws start after `offsets`"""
+    platforms_passed = max(0, start_id - 1 - DIFFICULTY_LAG)
+    p = min(1, platforms_passed / 600)
+    level2_bonus = 20 if math.floor(platforms_passed / 20) + 1 == 2 else 0
+    base_width = 100 - 30 * p
+    if platforms_passed < 50:
+        base_width += (50 - platforms_passed) * 0.4
+
+    draws = CHUNK_PLATFORMS * DRAWS_PER_PLATFORM
+    index = (offsets[:, None] + 1 + np.arange(draws)) % LCG_M
+    u = (cycle[index] / LCG_M).reshape(len(offsets), CHUNK_PLATFORMS, DRAWS_PER_PLATFORM)
+
+    ratio = np.where(u[..., 0] < 0.34, 1, np.where(u[..., 0] < 0.67, 2, 3))
+    width = np.clip(base_width * ratio + (-6 + u[..., 1] * 12), 60, 300)
+
+    num_zones = max(1, math.floor((BOTTOM_BOUND - TOP_BOUND - PLATFORM_HEIGHT) / (PLATFORM_HEIGHT + MIN_SPACING)))
+    zone_height = (BOTTOM_BOUND - TOP_BOUND - PLATFORM_HEIGHT) / num_zones
+    zone = np.floor(u[..., 2] * num_zones)
+    y_in_zone = u[..., 3] * max(1, zone_height - PLATFORM_HEIGHT - MIN_SPACING)
+    platform_y = TOP_BOUND + zone * zone_height + y_in_zone + MIN_SPACING / 2
+
+    ids = start_id + np.arange(CHUNK_PLATFORMS)
+    bonus_25_26 = np.where((ids == 25) | (ids == 26), 30, 0)
+    overlap_min = 25 - 10 * p
+    jitter = -5 + u[..., 4] * 10
+    step = np.maximum(40, width - overlap_min + jitter - level2_bonus - bonus_25_26)
+    x = np.concatenate([np.zeros((len(offsets), 1)), np.cumsum(step[:, :-1], axis=1)], axis=1)
+
+    low, high = TOP_BOUND + 64, BOTTOM_BOUND - PLATFORM_HEIGHT - 64
+    clamped = (platform_y < low) | (platform_y > high)
+    y = np.clip(platform_y, low, high)
+
+    # Steps are >= 40 px, so x is already sorted; the min-vertical-space pass
+    # depends on the previous (fixed) platform, so it runs column by column
+    for i in range(1, CHUNK_PLATFORMS):
+        overlap = ~((x[:, i] > x[:, i - 1] + width[:, i - 1]) | (x[:, i - 1] > x[:, i] + width[:, i]))
+        too_close = overlap & (np.abs(y[:, i] - y[:, i - 1]) < MIN_SPACING)
+        below = y[:, i] > y[:, i - 1]
+        fixed = np.where(
+            below,
+            np.minimum(y[:, i - 1] + MIN_SPACING, BOTTOM_BOUND - 8 - 64),
+            np.maximum(y[:, i - 1] - MIN_SPACING, TOP_BOUND + 64),
+        )
+        y[:, i] = np.where(too_close, fixed, y[:, i])
+
+    return x, y, width, clamped
+
+
+def spacing_violations(x, y, width):
+    """Overlapping pairs closer than MIN_SPACING, counted at the later platform
+
+    Returns per-column totals: consecutive pairs (i - 1, i) and any pair (j < i, i).
+    """
+    dy = np.abs(y[:, 1:] - y[:, :-1])
+    overlap = ~((x[:, 1:] > x[:, :-1] + width[:, :-1]) | (x[:, :-1] > x[:, 1:] + width[:, 1:]))
+    consecutive = np.concatenate([[0], (overlap & (dy < MIN_SPACING)).sum(axis=0)])
+
+    left, right = x, x + width
+    pair_overlap = (left[:, :, None] <= right[:, None, :]) & (left[:, None, :] <= right[:, :, None])
+    pair_close = np.abs(y[:, :, None] - y[:, None, :]) < MIN_SPACING
+    earlier = np.tril(np.ones((CHUNK_PLATFORMS, CHUNK_PLATFORMS), dtype=bool), k=-1)
+    any_pair = (pair_overlap & pair_close & earlier).sum(axis=(0, 2))
+    return consecutive, any_pair
+
+
+def reachable(x0, w0, x1, w1, dy, speed):
+    """Can a flip from somewhere on platform 0 land on platform 1?"""
+    t = flight_frames(dy)
+    near = x0 + (speed - MAX_LEFT) * t  # Take off at the left edge, hold left
+    far = x0 + w0 + (speed + MAX_RIGHT) * t  # Take off at the right edge, hold right
+    return (far >= x1) & (near <= x1 + w1)
+
+
+class LevelStats:
+    def __init__(self):
+        self.platforms = 0
+        self.clamped = 0
+        self.consecutive = 0
+        self.any_pair = 0
+        self.pairs = 0
+        self.reachable = 0
+        self.gaps = []
+        self.steps = []
+
+    def row(self, level):
+        gaps = np.concatenate(self.gaps)
+        steps = np.concatenate(self.steps)
+        g5, g50, g95 = np.percentile(gaps, [5, 50, 95])
+        d50, d95 = np.percentile(steps, [50, 95])
+        return (
+            f"{level:>5} {game_speed(level):>6.2f} {self.platforms:>11,} "
+            f"{100 * self.clamped / self.platforms:>7.2f}% "
+            f"{100 * self.consecutive / self.pairs:>7.3f}% {100 * self.any_pair / self.pairs:>7.3f}% "
+            f"{g5:>7.1f} {g50:>7.1f} {g95:>7.1f} {d50:>6.1f} {d95:>6.1f} "
+            f"{100 * self.reachable / self.pairs:>7.2f}%"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--platforms', type=float, default=1e7, help='platforms to generate (default 1e7)')
+    parser.add_argument('--levels', type=int, default=8, help='simulate chunks up to this level (default 8)')
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    cycle, _ = lcg_cycle()
+    cycle_ms = (time.perf_counter() - started) * 1000
+
+    start_ids = []
+    start_id = FIRST_CHUNK_ID
+    while level_of(start_id) <= args.levels:
+        start_ids.append(start_id)
+        start_id += CHUNK_PLATFORMS
+    per_chunk_id = max(1, min(LCG_M, int(args.platforms) // (CHUNK_PLATFORMS * len(start_ids))))
+    # Every offset when there is room, else evenly spread over the cycle
+    offsets = np.linspace(0, LCG_M, per_chunk_id, endpoint=False).astype(np.int64)
+
+    stats = {}
+    seam = {}
+    generated = 0
+    generate_s = 0.0
+    for start_id in start_ids:
+        for batch in range(0, len(offsets), BATCH_CHUNKS):
+            chunk_offsets = offsets[batch:batch + BATCH_CHUNKS]
+            t0 = time.perf_counter()
+            x, y, width, clamped = generate_chunks(cycle, chunk_offsets, start_id)
+            generate_s += time.perf_counter() - t0
+            generated += x.size
+
+            # Everything is attributed to the level of the platform it lands on;
+            # pair (i - 1, i) counts at platform i
+            levels = level_of(start_id + np.arange(CHUNK_PLATFORMS))
+            consecutive, any_pair = spacing_violations(x, y, width)
+            gaps = x[:, 1:] - (x[:, :-1] + width[:, :-1])
+            dy = np.abs(y[:, 1:] - y[:, :-1])
+            for level in np.unique(levels):
+                columns = levels == level
+                pairs = columns[1:]
+                s = stats.setdefault(int(level), LevelStats())
+                s.platforms += int(columns.sum()) * len(chunk_offsets)
+                s.clamped += int(clamped[:, columns].sum())
+                s.consecutive += int(consecutive[columns].sum())
+                s.any_pair += int(any_pair[columns].sum())
+                s.pairs += int(pairs.sum()) * len(chunk_offsets)
+                s.gaps.append(gaps[:, pairs].ravel())
+                s.steps.append(dy[:, pairs].ravel())
+                s.reachable += int(reachable(
+                    x[:, :-1][:, pairs], width[:, :-1][:, pairs],
+                    x[:, 1:][:, pairs], width[:, 1:][:, pairs],
+                    dy[:, pairs], game_speed(int(level)),
+                ).sum())
+
+            # Seam to the next chunk: its first platform starts 200 px past this tail
+            level = level_of(start_id + CHUNK_PLATFORMS)
+            head_x, head_y, head_w, _ = generate_chunks(cycle, (chunk_offsets + 7919) % LCG_M, start_id + CHUNK_PLATFORMS)
+            tail_end = x[:, -1] + width[:, -1]
+            seam_ok = reachable(
+                x[:, -1], width[:, -1], tail_end + CHUNK_SEAM, head_w[:, 0],
+                np.abs(head_y[:, 0] - y[:, -1]), game_speed(level),
+            )
+            total, ok = seam.get(level, (0, 0))
+            seam[level] = (total + len(seam_ok), ok + int(seam_ok.sum()))
+
+    elapsed = time.perf_counter() - started
+    chunks = generated // CHUNK_PLATFORMS
+    exhaustive = per_chunk_id == LCG_M
+
+    print(f"🧪 {generated:,} platforms in {chunks:,} chunks, chunk ids {start_ids[0]}..{start_ids[-1]}")
+    print(f"  - {per_chunk_id:,} start offsets per chunk id" + (" (every offset of the LCG cycle)" if exhaustive else ""))
+    print()
+    print("level  speed   platforms  clamped  adj<66  any<66   gap p5    p50     p95  |dy|50  |dy|95  reach")
+    for level in sorted(stats):
+        if level <= args.levels and stats[level].pairs:
+            print(stats[level].row(level))
+    print()
+    print("Chunk seams (200 px gap to the next chunk)")
+    for level in sorted(seam):
+        if level > args.levels:
+            continue
+        total, ok = seam[level]
+        print(f"  - level {level:>2}: {100 * ok / total:6.2f}% reachable")
+    print()
+    print(f"⏱️  {elapsed:.2f} s total, LCG cycle {cycle_ms:.0f} ms")
+    print(f"  - generation: {1e6 * generate_s / chunks:.2f} µs per chunk vectorized "
+          f"({CHUNK_PLATFORMS * DRAWS_PER_PLATFORM} platform draws per chunk; coin draws not simulated)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,256 @@
+#!/usr/bin/env python3
+"""
+Split top-level components and hooks out of Baron-web.tsx into their own modules
+
+Uses the token index from tsx_tokens.py (the one the patch tooling uses) to
+move whole declarations, so nothing is matched by hand-written text:
+
+- Moving: each name in SPLITS is cut from Baron-web.tsx with its leading
+  comment, exported, and written to its module with exactly the imports it
+  uses (from the source's imports and from other split modules)
+- Rewiring: Baron-web.tsx imports what it still references from the new
+  modules and drops imports only the moved code used
+- Lazy boundaries: modules marked lazy are loaded with next/dynamic, so
+  their code stays out of the bundle that has to parse and hydrate before
+  the first frame. Each gets a `load<Name>()` helper that the page calls in
+  idle time to warm the chunk before it is shown
+
+Names that are no longer in Baron-web.tsx are skipped, so re-running after a
+split is a no-op. Add entries to SPLITS to move more.
+
+Usage:
+    python3 split_modules.py              # split and rewrite
+    python3 split_modules.py --dry-run    # print the plan only
+"""
+
+import argparse
+import os
+import re
+import sys
+
+from tsx_tokens import TokenIndex
+
+SOURCE = 'Baron-web.tsx'
+
+# The engine, renderer and replay code already live in lib/game
+SPLITS = [
+    {'module': 'hooks/use-game-audio.ts', 'names': ['SOUND_LABELS', 'SoundSettings', 'useGameAudio']},
+    {'module': 'components/game-hud.tsx', 'names': ['GameHud']},
+    {'module': 'components/brand-header.tsx', 'names': ['BrandHeader'], 'lazy': True},
+    {'module': 'components/game-over-modal.tsx', 'names': ['GameOverModal'], 'lazy': True},
+]
+
+TYPE_KINDS = ('type', 'interface')
+MOVABLE_KINDS = ('function', 'class', 'interface', 'type', 'const', 'let', 'enum')
+
+
+def specifier(module):
+    """The "@/" import specifier of a module path"""
+    return '@/' + os.path.splitext(module)[0]
+
+
+def import_line(names, spec):
+    """`import { a, type B } from "spec"` for (name, is_type) pairs"""
+    names = sorted(names, key=lambda pair: pair[1])  # Values first, then types
+    if all(is_type for _, is_type in names):
+        return f'import type {{ {", ".join(name for name, _ in names)} }} from "{spec}"'
+    listed = ', '.join(f'type {name}' if is_type else name for name, is_type in names)
+    return f'import {{ {listed} }} from "{spec}"'
+
+
+def rebuild_import(imp, keep):
+    """The import statement without the names not in keep, or None when nothing is left"""
+    if not imp.names and not imp.default and not imp.namespace:
+        return None  # Side-effect import, left untouched by the caller
+    names = [(imported, local, is_type) for imported, local, is_type in imp.names if local in keep]
+    default = imp.default if imp.default in keep else None
+    namespace = imp.namespace if imp.namespace in keep else None
+    if not names and not default and not namespace:
+        return ''
+    parts = []
+    if default:
+        parts.append(default)
+    if namespace:
+        parts.append(f'* as {namespace}')
+    type_only = imp.type_only or (not default and not namespace and all(is_type for _, _, is_type in names))
+    if names:
+        listed = ', '.join(
+            (f'type {imported}' if is_type and not type_only else imported)
+            + (f' as {local}' if local != imported else '')
+            for imported, local, is_type in names
+        )
+        parts.append(f'{{ {listed} }}')
+    prefix = 'import type' if type_only else 'import'
+    return f'{prefix} {", ".join(parts)} from "{imp.specifier}"'
+
+
+def plan_splits(index):
+    """Modules to write: (split, declarations) for splits with something left to move"""
+    declarations = {d.name: d for d in index.declarations() if d.kind in MOVABLE_KINDS}
+    plan = []
+    for split in SPLITS:
+        found = [
+            declarations[name]
+            for name in split['names']
+            if name in declarations and f'load{name}' not in index.names_in(declarations[name].start, declarations[name].end)
+        ]
+        if found:
+            plan.append((split, found))
+    return plan, declarations
+
+
+def module_source(index, split, found, moved_to, declarations, directive):
+    """Text of a new module and the source imports it uses"""
+    source = index.source
+    used = set()
+    blocks = []
+    for decl in found:
+        start = index.comment_start(decl.start)
+        used |= index.names_in(decl.start, decl.end)
+        block = source[start:decl.end]
+        if not decl.exported:
+            head = source[start:decl.start]
+            block = head + 'export ' + source[decl.start:decl.end]
+        blocks.append(block)
+    own = {decl.name for decl in found}
+
+    lines = []
+    for imp in index.imports():
+        kept = rebuild_import(imp, used)
+        if kept:
+            lines.append(kept)
+    by_module = {}
+    for name in sorted(used - own, key=lambda n: declarations[n].start if n in declarations else 0):
+        if name not in declarations:
+            continue
+        if name not in moved_to:
+            sys.exit(f"❌ {split['module']}: {name} stays in {SOURCE} (move it too, or pass it in)")
+        if moved_to[name] != split['module']:
+            by_module.setdefault(moved_to[name], []).append((name, declarations[name].kind in TYPE_KINDS))
+    for module, names in by_module.items():
+        lines.append(import_line(names, specifier(module)))
+
+    parts = [f'"{directive}"'] if directive else []
+    if lines:
+        parts.append('\n'.join(lines))
+    parts += blocks
+    return '\n\n'.join(parts) + '\n', used
+
+
+def remove_ranges(source, ranges):
+    """Cut (start, end) ranges and the blank lines after each"""
+    for start, end in sorted(ranges, reverse=True):
+        tail = re.match(r'[ \t]*\n(?:[ \t]*\n)*', source[end:])
+        source = source[:start] + source[end + (tail.end() if tail else 0):]
+    return source
+
+
+def rewire_source(index, plan, moved_used):
+    """Baron-web.tsx without the moved declarations, importing what it still uses"""
+    ranges = [(index.comment_start(d.start), d.end) for _, found in plan for d in found]
+    source = remove_ranges(index.source, ranges)
+    rest = TokenIndex(SOURCE, source)
+    still_used = set()
+    for decl in rest.declarations():
+        if decl.kind != 'import':
+            still_used |= rest.names_in(decl.start, decl.end)
+
+    # Imports the moved code took along and the rest no longer needs
+    edits = []
+    for imp in rest.imports():
+        names = {local for _, local, _ in imp.names} | {imp.default, imp.namespace} - {None}
+        keep = (names - moved_used) | (names & still_used)
+        if keep != names:
+            kept = rebuild_import(imp, keep)
+            edits.append((imp.start, imp.end, kept))
+    for start, end, kept in sorted(edits, reverse=True):
+        if kept:
+            source = source[:start] + kept + source[end:]
+        else:
+            source = remove_ranges(source, [(start, end)])
+
+    static_lines = []
+    lazy_lines = []
+    for split, found in plan:
+        spec = specifier(split['module'])
+        names = [(d.name, d.kind in TYPE_KINDS) for d in found if d.name in still_used]
+        if not names:
+            continue
+        if split.get('lazy'):
+            for name, is_type in names:
+                if is_type:
+                    static_lines.append(import_line([(name, True)], spec))
+                    continue
+                lazy_lines.append(f'const load{name} = () => import("{spec}")')
+                lazy_lines.append(f'const {name} = dynamic(() => load{name}().then((m) => m.{name}), {{ ssr: false }})')
+        else:
+            static_lines.append(import_line(names, spec))
+
+    rest = TokenIndex(SOURCE, source)
+    imports = rest.imports()
+    if lazy_lines and not any(imp.specifier == 'next/dynamic' for imp in imports):
+        # Third-party imports come before the "@/" ones
+        third_party = [imp for imp in imports if not imp.specifier.startswith('@/')]
+        at = third_party[-1].end if third_party else imports[0].start - 1
+        source = source[:at] + '\nimport dynamic from "next/dynamic"' + source[at:]
+        rest = TokenIndex(SOURCE, source)
+        imports = rest.imports()
+    for line in sorted(static_lines, reverse=True):
+        spec = line.rsplit('"', 2)[1]
+        after = [imp for imp in imports if imp.specifier.startswith('@/') and imp.specifier > spec]
+        at = after[0].start if after else imports[-1].end + 1
+        source = source[:at] + line + '\n' + source[at:]
+        rest = TokenIndex(SOURCE, source)
+        imports = rest.imports()
+    if lazy_lines:
+        at = imports[-1].end
+        block = '\n\n// Loaded on demand, off the critical path to the first frame (split_modules.py)\n' + '\n'.join(lazy_lines)
+        source = source[:at] + block + source[at:]
+    return source
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--dry-run', action='store_true', help='print the plan without writing files')
+    args = parser.parse_args()
+
+    index = TokenIndex(SOURCE)
+    plan, declarations = plan_splits(index)
+    if not plan:
+        print(f"✅ Nothing left to split in {SOURCE}")
+        return
+    directives = [d.name for d in index.declarations() if d.kind == 'directive']
+    directive = directives[0] if directives else None
+    moved_to = {d.name: split['module'] for split, found in plan for d in found}
+
+    modules = {}
+    moved_used = set()
+    for split, found in plan:
+        if os.path.exists(split['module']):
+            sys.exit(f"❌ {split['module']} already exists; merge by hand or remove it first")
+        text, used = module_source(index, split, found, moved_to, declarations, directive)
+        modules[split['module']] = text
+        moved_used |= used
+    source = rewire_source(index, plan, moved_used)
+
+    before = index.source.count('\n')
+    for split, found in plan:
+        text = modules[split['module']]
+        names = ', '.join(d.name for d in found)
+        lazy = ' (lazy)' if split.get('lazy') else ''
+        print(f"  - {split['module']}{lazy}: {names} — {text.count(chr(10))} lines")
+    print(f"  - {SOURCE}: {before} → {source.count(chr(10))} lines")
+    if args.dry_run:
+        return
+
+    for module, text in modules.items():
+        os.makedirs(os.path.dirname(module), exist_ok=True)
+        with open(module, 'w') as f:
+            f.write(text)
+    with open(SOURCE, 'w') as f:
+        f.write(source)
+    print(f"✅ Split {len(modules)} modules out of {SOURCE}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+"""
+Token index for the game's TypeScript/TSX sources
+
+Shared by the source tools (hot_path_lint.py, run_patch.py) so they agree on
+where a function starts and ends instead of each matching its own text:
+
+- Tokenizer: names, numbers, strings, template literals (substitutions are
+  tokenized too), regex literals, comments and punctuation; in .tsx files
+  JSX markup and text are skipped, but component names and the code in
+  {expressions} are tokenized like any other code
+- TokenIndex: bracket matching over the code tokens, the top-level
+  declarations and imports of a file, and its function-like definitions
+  (function declarations, const arrow functions and useCallback bodies,
+  class methods), looked up by name
+
+Only what the tools need is modelled: a token stream good enough to find
+bodies and count constructs, not a parser.
+
+Usage:
+    python3 tsx_tokens.py Baron-web.tsx    # list the functions it finds
+"""
+
+import argparse
+import bisect
+import fnmatch
+import re
+from collections import namedtuple
+
+Token = namedtuple('Token', 'kind text start end line')
+Function = namedtuple('Function', 'name line start end body_open body_close')
+Declaration = namedtuple('Declaration', 'name kind start end exported first last')
+Import = namedtuple('Import', 'start end specifier type_only default namespace names')
+
+PUNCTUATORS = sorted(
+    [
+        '>>>=', '...', '===', '!==', '**=', '<<=', '>>=', '>>>', '&&=', '||=', '??=',
+        '=>', '==', '!=', '<=', '>=', '&&', '||', '??', '?.', '++', '--', '+=', '-=',
+        '*=', '/=', '%=', '&=', '|=', '^=', '<<', '>>', '**',
+        '{', '}', '(', ')', '[', ']', ';', ',', '<', '>', '+', '-', '*', '/', '%',
+        '&', '|', '^', '!', '~', '?', ':', '=', '.', '@', '#',
+    ],
+    key=len,
+    reverse=True,
+)
+
+# Tokens after which an expression (a regex or a JSX element) can start
+EXPRESSION_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+EXPRESSION_AFTER = set(PUNCTUATORS) - {')', ']', '}', '++', '--'}
+CONTROL_KEYWORDS = {'if', 'for', 'while', 'switch', 'catch', 'function', 'return', 'with'}
+STATEMENT_KEYWORDS = {'import', 'export', 'const', 'let', 'var', 'function', 'type', 'interface', 'class', 'async', 'declare', 'enum'}
+METHOD_MODIFIERS = {'private', 'public', 'protected', 'static', 'async', 'get', 'set', 'override', 'readonly'}
+
+NAME_RE = re.compile(r'[A-Za-z_$][\w$]*')
+JSX_TAG_RE = re.compile(r'[A-Za-z_$][\w$.:-]*')
+NUMBER_RE = re.compile(r'(?:0[xXbBoO][\da-fA-F_]+|(?:\d[\d_]*\.?[\d_]*|\.\d[\d_]*)(?:[eE][+-]?\d+)?)n?')
+SPACE_RE = re.compile(r'\s+')
+
+
+class Tokenizer:
+    def __init__(self, source, jsx=False):
+        self.source = source
+        self.jsx = jsx
+        self.tokens = []
+        self.line_starts = [0] + [m.end() for m in re.finditer('\n', source)]
+
+    def line(self, offset):
+        low, high = 0, len(self.line_starts)
+        while low + 1 < high:
+            mid = (low + high) // 2
+            if self.line_starts[mid] <= offset:
+                low = mid
+            else:
+                high = mid
+        return low + 1
+
+    def emit(self, kind, start, end):
+        self.tokens.append(Token(kind, self.source[start:end], start, end, self.line(start)))
+
+    def expression_expected(self):
+        for token in reversed(self.tokens):
+            if token.kind == 'comment':
+                continue
+            if token.kind == 'punct':
+                return token.text in EXPRESSION_AFTER
+            return token.kind == 'name' and token.text in EXPRESSION_KEYWORDS
+        return True
+
+    def run(self):
+        self.code(0, nested=False)
+        return self.tokens
+
+    def code(self, i, nested):
+        """Tokenize from i; when nested, stop after the `}` closing a substitution"""
+        source = self.source
+        depth = 0
+        while i < len(source):
+            space = SPACE_RE.match(source, i)
+            if space:
+                i = space.end()
+                continue
+            c = source[i]
+            if source.startswith('//', i):
+                end = source.find('\n', i)
+                end = len(source) if end < 0 else end
+                self.emit('comment', i, end)
+                i = end
+            elif source.startswith('/*', i):
+                end = source.find('*/', i + 2)
+                end = len(source) if end < 0 else end + 2
+                self.emit('comment', i, end)
+                i = end
+            elif c in '"\'':
+                end = self.string_end(i, c)
+                self.emit('string', i, end)
+                i = end
+            elif c == '`':
+                i = self.template(i)
+            elif c == '/' and self.expression_expected():
+                end = self.regex_end(i)
+                self.emit('regex', i, end)
+                i = end
+            elif c == '<' and self.jsx and self.expression_expected() and re.match(r'<[A-Za-z>]', source[i:i + 2]):
+                i = self.jsx_element(i)
+            elif NAME_RE.match(source, i) and not c.isdigit():
+                end = NAME_RE.match(source, i).end()
+                self.emit('name', i, end)
+                i = end
+            elif c.isdigit() or (c == '.' and source[i + 1:i + 2].isdigit()):
+                end = NUMBER_RE.match(source, i).end()
+                self.emit('number', i, end)
+                i = end
+            else:
+                for p in PUNCTUATORS:
+                    if source.startswith(p, i):
+                        break
+                else:
+                    p = c
+                if nested and p == '}' and depth == 0:
+                    return i + 1
+                if p == '{':
+                    depth += 1
+                elif p == '}':
+                    depth -= 1
+                self.emit('punct', i, i + len(p))
+                i += len(p)
+        return i
+
+    def string_end(self, i, quote):
+        source = self.source
+        j = i + 1
+        while j < len(source) and source[j] != quote and source[j] != '\n':
+            j += 2 if source[j] == '\\' else 1
+        return j + 1
+
+    def regex_end(self, i):
+        source = self.source
+        j = i + 1
+        in_class = False
+        while j < len(source) and source[j] != '\n':
+            c = source[j]
+            if c == '\\':
+                j += 2
+                continue
+            if c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                break
+            j += 1
+        j += 1
+        while j < len(source) and source[j].isalpha():
+            j += 1
+        return j
+
+    def template(self, i):
+        """Emit the template literal, then the tokens of its substitutions"""
+        source = self.source
+        j = i + 1
+        substitutions = []
+        while j < len(source) and source[j] != '`':
+            if source[j] == '\\':
+                j += 2
+            elif source.startswith('${', j):
+                substitutions.append(j + 2)
+                j = self.skip_code(j + 2)
+            else:
+                j += 1
+        end = j + 1
+        self.emit('template', i, end)
+        for start in substitutions:
+            self.code(start, nested=True)
+        return end
+
+    def skip_code(self, i):
+        """End of a `${...}` or `{...}` expression, tokenized into a scratch list"""
+        scratch = Tokenizer(self.source, self.jsx)
+        scratch.line_starts = self.line_starts
+        return scratch.code(i, nested=True)
+
+    def jsx_element(self, i):
+        """Tokenize the JSX element (or fragment) at i and return its end"""
+        source = self.source
+        j = self.jsx_tag(i)
+        if source[j - 2:j] == '/>':
+            return j
+        depth = 1
+        while j < len(source) and depth:
+            c = source[j]
+            if c == '{':
+                j = self.code(j + 1, nested=True)
+            elif c == '<':
+                closing = source.startswith('</', j)
+                j = self.jsx_tag(j)
+                if closing:
+                    depth -= 1
+                elif source[j - 2:j] != '/>':
+                    depth += 1
+            else:
+                j += 1
+        return j
+
+    def jsx_tag(self, i):
+        """Tokenize the tag at i (component name, attribute expressions) and return its end"""
+        source = self.source
+        j = i + (2 if source.startswith('</', i) else 1)
+        tag = JSX_TAG_RE.match(source, j)
+        if tag and (tag.group()[0].isupper() or '.' in tag.group()):
+            # Components and member tags reference a binding; intrinsic tags do not
+            self.emit('name', j, j + NAME_RE.match(source, j).end() - j)
+        while j < len(source) and source[j] != '>':
+            c = source[j]
+            if c in '"\'':
+                j = source.find(c, j + 1) + 1
+            elif c == '{':
+                j = self.code(j + 1, nested=True)
+            else:
+                j += 1
+        return j + 1
+
+
+def tokenize(source, jsx=False):
+    return Tokenizer(source, jsx).run()
+
+
+class TokenIndex:
+    """Code tokens of one file with bracket matching and function lookup"""
+
+    def __init__(self, path, source=None):
+        self.path = path
+        if source is None:
+            with open(path) as f:
+                source = f.read()
+        self.source = source
+        self.tokens = tokenize(source, jsx=path.endswith('.tsx'))
+        self.code = [t for t in self.tokens if t.kind != 'comment']
+        self.match = {}
+        stack = []
+        for k, token in enumerate(self.code):
+            if token.kind != 'punct':
+                continue
+            if token.text in '([{':
+                stack.append(k)
+            elif token.text in ')]}' and stack:
+                self.match[stack.pop()] = k
+        self._functions = None
+
+    def text(self, k):
+        return self.code[k].text if 0 <= k < len(self.code) else ''
+
+    def is_punct(self, k, text):
+        return 0 <= k < len(self.code) and self.code[k].kind == 'punct' and self.code[k].text == text
+
+    def body_after(self, k):
+        """Index of the `{` opening a body after the `)` at k (skipping a return type), else None"""
+        line = self.code[k].line
+        k += 1
+        if self.is_punct(k, ':'):
+            depth = 0
+            k += 1
+            while k < len(self.code):
+                text = self.text(k)
+                if depth == 0 and text in ('{', '=>', ';'):
+                    break
+                if depth == 0 and self.code[k].line > line and self.code[k - 1].line == line:
+                    return None  # A signature without a body (interfaces, overloads)
+                if text in ('(', '<', '['):
+                    depth += 1
+                elif text in (')', '>', ']'):
+                    depth -= 1
+                k += 1
+        if self.is_punct(k, '=>'):
+            k += 1
+        return k if self.is_punct(k, '{') and k in self.match else None
+
+    def skip(self, k):
+        """Index after the token at k, jumping over a bracketed group"""
+        return self.match.get(k, k) + 1
+
+    def declarations(self):
+        """Top-level statements: imports, directives and named declarations"""
+        code = self.code
+        found = []
+        k = 0
+        while k < len(code):
+            first = k
+            exported = False
+            while self.text(k) in ('export', 'default', 'declare', 'async'):
+                exported = exported or self.text(k) == 'export'
+                k += 1
+            kind = self.text(k)
+            name = self.text(k + 1)
+            if kind == 'import':
+                while k < len(code) and code[k].kind != 'string':
+                    k = self.skip(k)
+                last = k + 1 if self.is_punct(k + 1, ';') else k
+            elif first == k and code[k].kind == 'string':
+                kind, name = 'directive', code[k].text.strip('"\'')
+                last = k + 1 if self.is_punct(k + 1, ';') else k
+            elif kind in ('function', 'class', 'interface'):
+                while k < len(code) and not self.is_punct(k, '{'):
+                    k = self.skip(k) if self.text(k) in ('(', '[') else k + 1
+                last = self.match.get(k, k)
+            else:
+                if kind not in ('const', 'let', 'var', 'type', 'enum'):
+                    kind, name = 'statement', ''
+                last = k
+                k = self.skip(k)
+                while k < len(code):
+                    if self.is_punct(k, ';'):
+                        last = k
+                        break
+                    if code[k].line > code[last].line and (
+                        code[k].text in STATEMENT_KEYWORDS or code[k].kind == 'string'
+                    ) and not self.is_punct(last, '=') and code[k - 1].text not in ('=', '=>', ':', '|', '&', ','):
+                        break
+                    last = self.match.get(k, k)
+                    k = last + 1
+            found.append(Declaration(name, kind, code[first].start, code[last].end, exported, first, last))
+            k = last + 1
+        return found
+
+    def imports(self):
+        """Parsed import statements in source order"""
+        found = []
+        for decl in self.declarations():
+            if decl.kind != 'import':
+                continue
+            k = decl.first + 1
+            type_only = self.text(k) == 'type' and self.text(k + 1) != ','
+            if type_only and self.text(k + 1) != 'from':
+                k += 1
+            default = namespace = None
+            names = []
+            while k <= decl.last and self.code[k].kind != 'string':
+                text = self.text(k)
+                if text == '*' and self.text(k + 1) == 'as':
+                    namespace = self.text(k + 2)
+                    k += 3
+                elif text == '{':
+                    j = k + 1
+                    while j < self.match[k]:
+                        is_type = self.text(j) == 'type' and self.text(j + 1) not in (',', '}', 'as')
+                        if is_type:
+                            j += 1
+                        imported = local = self.text(j)
+                        j += 1
+                        if self.text(j) == 'as':
+                            local = self.text(j + 1)
+                            j += 2
+                        names.append((imported, local, is_type or type_only))
+                        if self.text(j) == ',':
+                            j += 1
+                    k = self.match[k] + 1
+                elif self.code[k].kind == 'name' and text != 'from':
+                    default = text
+                    k += 1
+                else:
+                    k += 1
+            specifier = self.code[k].text.strip('"\'') if k <= decl.last else ''
+            found.append(Import(decl.start, decl.end, specifier, type_only, default, namespace, names))
+        return found
+
+    def names_in(self, start, end):
+        """Names referenced between two offsets (property names after `.` excluded)"""
+        names = set()
+        for k, token in enumerate(self.code):
+            if start <= token.start < end and token.kind == 'name' and self.text(k - 1) not in ('.', '?.'):
+                names.add(token.text)
+        return names
+
+    def comment_start(self, offset):
+        """Start of the comment lines directly above the token at offset, or offset itself"""
+        k = bisect.bisect_left([t.start for t in self.tokens], offset)
+        start = offset
+        line = self.tokens[k].line if k < len(self.tokens) else 0
+        while k > 0:
+            token = self.tokens[k - 1]
+            if token.kind != 'comment' or token.line + token.text.count('\n') != line - 1:
+                break
+            k -= 1
+            start, line = token.start, token.line
+        return start
+
+    def functions(self):
+        """Function-like definitions with a block body, in source order"""
+        if self._functions is not None:
+            return self._functions
+        found = []
+        code = self.code
+        for k, token in enumerate(code):
+            if token.kind != 'name':
+                continue
+            open_paren = None
+            start = k
+            if token.text == 'function' and k + 2 < len(code) and code[k + 1].kind == 'name' and self.is_punct(k + 2, '('):
+                name, open_paren = code[k + 1].text, k + 2
+            elif token.text in ('const', 'let', 'var') and k + 2 < len(code) and code[k + 1].kind == 'name' and self.is_punct(k + 2, '='):
+                name = code[k + 1].text
+                j = k + 3
+                if self.text(j) == 'useCallback' and self.is_punct(j + 1, '('):
+                    j += 2
+                if self.text(j) == 'async':
+                    j += 1
+                if self.is_punct(j, '('):
+                    open_paren = j
+                elif code[j].kind == 'name' if j < len(code) else False:
+                    if self.is_punct(j + 1, '=>') and self.is_punct(j + 2, '{'):
+                        found.append(self._function(name, start, j + 2))
+                    continue
+            elif (
+                token.text not in CONTROL_KEYWORDS
+                and self.is_punct(k + 1, '(')
+                and (k == 0 or self.text(k - 1) in ('{', '}', ';') or self.text(k - 1) in METHOD_MODIFIERS)
+            ):
+                name, open_paren = token.text, k + 1
+                while start > 0 and self.text(start - 1) in METHOD_MODIFIERS:
+                    start -= 1
+            if open_paren is None or open_paren not in self.match:
+                continue
+            body = self.body_after(self.match[open_paren])
+            if body is not None:
+                found.append(self._function(name, start, body))
+        self._functions = found
+        return found
+
+    def _function(self, name, start, body_open):
+        body_close = self.match[body_open]
+        first = self.code[start]
+        return Function(name, first.line, first.start, self.code[body_close].end, body_open, body_close)
+
+    def function(self, name):
+        """The outermost definition called name, or None"""
+        for fn in self.functions():
+            if fn.name == name:
+                return fn
+        return None
+
+    def find(self, patterns):
+        """Outermost definitions matching any of the names or glob patterns"""
+        return [fn for fn in self.functions() if any(fnmatch.fnmatchcase(fn.name, p) for p in patterns)]
+
+    def body_tokens(self, fn):
+        """Indexes of the code tokens inside fn's body braces"""
+        return range(fn.body_open + 1, fn.body_close)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('paths', nargs='+', help='.ts/.tsx files to index')
+    args = parser.parse_args()
+    for path in args.paths:
+        index = TokenIndex(path)
+        print(f"📄 {path}: {len(index.code):,} code tokens, {len(index.functions())} functions")
+        for fn in index.functions():
+            lines = index.code[fn.body_close].line - fn.line + 1
+            print(f"  - {fn.name} (line {fn.line}, {lines} lines)")
+
+
+if __name__ == '__main__':
+    main()